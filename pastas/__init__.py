@@ -4,12 +4,16 @@ import warnings
 
 from pandas.plotting import register_matplotlib_converters
 
+import pastas.memmap as memmap
 import pastas.objective_functions as objfunc
 import pastas.plotting.plots as plots
 import pastas.recharge as rch
 import pastas.stats as stats
 import pastas.timeseries_utils as ts
 from pastas import extensions
+from pastas.batch import solve_many
+from pastas.cache import set_block_cache_size
+from pastas.convolution import set_convolution_method
 from pastas.dataset import list_datasets, load_dataset
 from pastas.decorators import set_use_numba
 from pastas.model import Model
@@ -29,7 +33,7 @@ from pastas.rfunc import (
     Polder,
     Spline,
 )
-from pastas.solver import EmceeSolve, LeastSquares, LmfitSolve
+from pastas.solver import EmceeSolve, LeastSquares, LmfitSolve, VarProLeastSquares
 from pastas.stressmodels import (
     ChangeModel,
     Constant,
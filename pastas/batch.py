@@ -0,0 +1,234 @@
+"""This module contains methods to solve many Pastas models at once.
+
+Solving thousands of models one by one through `Model.solve` leaves most cores of a
+machine idle. The methods in this module distribute the models over a number of
+workers and collect the results in a single DataFrame.
+
+Examples
+--------
+>>> results = ps.solve_many(models, n_jobs=8)
+>>> results.loc[:, ["success", "evp"]]
+
+See Also
+--------
+pastas.model.Model.solve
+"""
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from logging import getLogger
+from os import cpu_count
+
+# Type Hinting
+from typing import List, Optional, Tuple
+
+import numpy as np
+from pandas import DataFrame
+
+import pastas.solver as solvers
+from pastas.io.base import _load_model
+from pastas.typing import Model
+
+logger = getLogger(__name__)
+
+__all__ = ["solve_many"]
+
+
+def solve_many(
+    models: List[Model],
+    n_jobs: Optional[int] = None,
+    backend: str = "process",
+    solver: Optional[type] = None,
+    stats: Tuple[str] = ("rsq", "evp", "rmse", "aic", "bic"),
+    update: bool = True,
+    **kwargs,
+) -> DataFrame:
+    """Method to solve many Pastas models in parallel.
+
+    Parameters
+    ----------
+    models: list of pastas.Model
+        List with the Pastas Models to solve.
+    n_jobs: int, optional
+        Number of workers used to solve the models. Default is None, which uses the
+        number of cores of the machine. If n_jobs=1, the models are solved one after
+        another in the current process.
+    backend: str, optional
+        Either "process" (default) or "thread". With the "process" backend only the
+        dictionary obtained with `Model.to_dict` is sent to a worker process, where
+        the model is rebuilt and solved. The "thread" backend solves the model
+        objects directly, which avoids the serialization but shares the interpreter.
+    solver: pastas.solver class, optional
+        Solver class used to solve each of the models, e.g., ps.LeastSquares. A new
+        instance is created for each model. If None, the solver of the model is used,
+        or ps.LeastSquares if the model has no solver.
+    stats: tuple of str, optional
+        Names of the goodness-of-fit statistics (see ml.stats.ops) that are computed
+        for each model after solving.
+    update: bool, optional
+        Update the models with the optimal parameters and the solver results.
+        Default is True. Only relevant for the "process" backend, with the "thread"
+        backend the models are always updated.
+    **kwargs: dict, optional
+        All other keyword arguments are passed on to `Model.solve` for each model.
+
+    Returns
+    -------
+    results: pandas.DataFrame
+        DataFrame with one row per model (index are the model names), with columns
+        "success", "error", "nfev", the requested statistics, the optimal parameters
+        and the standard errors of the parameters (column names ending with
+        "_stderr").
+
+    Notes
+    -----
+    A model that fails to solve does not abort the batch. The error message is
+    stored in the "error" column of the results and "success" is False.
+
+    Examples
+    --------
+    >>> models = [ml1, ml2, ml3]
+    >>> results = ps.solve_many(models, n_jobs=2, tmin="2000", report=False)
+    >>> failed = results.loc[~results.success]
+    """
+    if backend not in ["process", "thread"]:
+        msg = "Backend %s is not supported. Choose 'process' or 'thread'."
+        logger.error(msg, backend)
+        raise ValueError(msg % backend)
+
+    if solver is not None and not isinstance(solver, type):
+        # a solver instance cannot be shared between models, so use its class
+        solver = type(solver)
+
+    kwargs["report"] = False
+    n_jobs = cpu_count() if n_jobs is None else n_jobs
+
+    results = [None] * len(models)
+
+    if n_jobs == 1:
+        for i, ml in enumerate(models):
+            results[i] = _solve_model(ml, solver, stats, kwargs)
+    elif backend == "thread":
+        with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+            futures = {
+                executor.submit(_solve_model, ml, solver, stats, kwargs): i
+                for i, ml in enumerate(models)
+            }
+            for future in as_completed(futures):
+                results[futures[future]] = _get_future_result(future)
+    else:
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            futures = {
+                executor.submit(
+                    _solve_model_dict, ml.to_dict(), solver, stats, kwargs
+                ): i
+                for i, ml in enumerate(models)
+            }
+            for future in as_completed(futures):
+                results[futures[future]] = _get_future_result(future)
+
+        if update:
+            for ml, result in zip(models, results):
+                if result["success"] is not None:
+                    _update_model(ml, result)
+
+    return _get_results_frame(models, results, stats)
+
+
+def _solve_model(ml: Model, solver: Optional[type], stats: Tuple[str], kwargs: dict):
+    """Internal method to solve a single model and return the results."""
+    try:
+        if solver is not None:
+            kwargs = dict(kwargs, solver=solver())
+        ml.solve(**kwargs)
+        return _get_solve_result(ml, stats)
+    except Exception as e:
+        logger.warning("Model %s could not be solved: %s", ml.name, e)
+        return {"success": None, "error": f"{type(e).__name__}: {e}"}
+
+
+def _solve_model_dict(
+    data: dict, solver: Optional[type], stats: Tuple[str], kwargs: dict
+) -> dict:
+    """Internal method to rebuild a model from a dictionary in a worker process and
+    solve it."""
+    try:
+        ml = _load_model(data)
+    except Exception as e:
+        return {"success": None, "error": f"{type(e).__name__}: {e}"}
+    return _solve_model(ml, solver, stats, kwargs)
+
+
+def _get_future_result(future) -> dict:
+    """Internal method to get the result of a future without raising errors."""
+    try:
+        return future.result()
+    except Exception as e:
+        return {"success": None, "error": f"{type(e).__name__}: {e}"}
+
+
+def _get_solve_result(ml: Model, stats: Tuple[str]) -> dict:
+    """Internal method to collect the results of a solved model."""
+    try:
+        solver = ml.solver.to_dict()
+    except NotImplementedError:
+        # e.g., the EmceeSolve solver cannot be stored in a dictionary
+        solver = None
+
+    result = {
+        "success": ml._solve_success,
+        "error": None,
+        "nfev": ml.solver.nfev,
+        "parameters": ml.parameters,
+        "settings": ml.settings,
+        "solver": solver,
+        "stats": {},
+    }
+    for stat in stats:
+        try:
+            result["stats"][stat] = getattr(ml.stats, stat)()
+        except Exception as e:
+            logger.warning("Statistic %s could not be computed: %s", stat, e)
+            result["stats"][stat] = np.nan
+    return result
+
+
+def _update_model(ml: Model, result: dict) -> None:
+    """Internal method to update a model with the results from a worker process."""
+    ml.parameters = result["parameters"]
+    ml.settings.update(result["settings"])
+    ml._solve_success = result["success"]
+
+    if result["solver"] is not None:
+        solver_data = dict(result["solver"])
+        solver = getattr(solvers, solver_data.pop("class"))
+        ml.solver = solver(**solver_data)
+        ml.solver.set_model(ml)
+
+    # Make sure the simulation index and calibration series are renewed
+    ml.sim_index = None
+    ml.oseries_calib = None
+    ml.interpolate_simulation = None
+
+
+def _get_results_frame(
+    models: List[Model], results: List[dict], stats: Tuple[str]
+) -> DataFrame:
+    """Internal method to combine the results of all models in a DataFrame."""
+    rows = []
+    for ml, result in zip(models, results):
+        row = {
+            "success": bool(result["success"]),
+            "error": result["error"],
+            "nfev": np.nan,
+        }
+        if result["success"] is not None:
+            row["nfev"] = result["nfev"]
+            row.update(result["stats"])
+            parameters = result["parameters"]
+            row.update(parameters.optimal.to_dict())
+            row.update(parameters.stderr.add_suffix("_stderr").to_dict())
+        else:
+            row.update({stat: np.nan for stat in stats})
+        rows.append(row)
+
+    return DataFrame(rows, index=[ml.name for ml in models])
@@ -0,0 +1,290 @@
+"""This module contains the caches used in Pastas to avoid repeated computations.
+
+The block response of a response function only depends on the parameters and the
+settings of the response function. During the optimization of a model the same
+block responses are computed many times, for example when a Jacobian is estimated
+with finite differences, where only one parameter is changed at a time. The block
+responses are therefore stored in a least-recently-used cache.
+
+Many models often use the same stresses (e.g., the precipitation and evaporation
+of a few meteorological stations in a regional study). The time series of the
+stresses are therefore stored once in a store that is shared by all TimeSeries
+with the same values.
+
+Examples
+--------
+>>> ps.set_block_cache_size(256)
+>>> ps.cache.block_cache.info()
+{'hits': 0, 'misses': 0, 'size': 0, 'maxsize': 256}
+>>> ps.cache.series_store.info()
+{'hits': 0, 'misses': 0, 'size': 0, 'nbytes': 0}
+
+"""
+
+from collections import OrderedDict
+from hashlib import blake2b
+from logging import getLogger
+from threading import Lock
+from typing import Hashable, Optional
+from weakref import WeakValueDictionary, ref
+
+import numpy as np
+from pandas import Series
+
+from pastas.typing import ArrayLike, RFunc
+
+logger = getLogger(__name__)
+
+
+class BlockCache:
+    """Least-recently-used cache for the block responses of response functions.
+
+    Parameters
+    ----------
+    maxsize: int, optional
+        Maximum number of block responses that are stored. Default is 128. If
+        maxsize is 0, the block responses are not cached.
+
+    Notes
+    -----
+    The block responses are stored using the identity and the settings of the
+    response function, the parameter values, the time step, the cutoff and the
+    maximum time (maxtmax) of the response as key. The settings are the values
+    exported by the `to_dict` method of the response function (e.g., `quad`), so a
+    block response is computed again after a setting is changed. The response
+    function is stored as a weak reference, to make sure a block response is not
+    returned for another response function that happens to get the same identity
+    after the original one was deleted.
+
+    The cached block responses are read-only arrays.
+    """
+
+    def __init__(self, maxsize: int = 128) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._cache = OrderedDict()
+        self._lock = Lock()
+
+    def get_block(
+        self,
+        rfunc: RFunc,
+        p: ArrayLike,
+        dt: float = 1.0,
+        cutoff: Optional[float] = None,
+        maxtmax: Optional[float] = None,
+    ) -> ArrayLike:
+        """Method to get the block response from the cache or compute it.
+
+        Parameters
+        ----------
+        rfunc: pastas.rfunc instance
+            The response function to compute the block response with.
+        p: array_like
+            array_like object with the values as floats representing the parameters
+            of the response function.
+        dt: float, optional
+            timestep as a multiple of one day.
+        cutoff: float, optional
+            proportion after which the step function is cut off. If None, the cutoff
+            of the response function is used.
+        maxtmax: float, optional
+            Maximum timestep to compute the block response for.
+
+        Returns
+        -------
+        b: array_like
+            Read-only array with the block response.
+        """
+        if self.maxsize == 0 or isinstance(dt, np.ndarray):
+            return rfunc.block(p, dt, cutoff=cutoff, maxtmax=maxtmax)
+
+        if cutoff is None:
+            cutoff = rfunc.cutoff
+        p = np.asarray(p, dtype=float)
+        key = (id(rfunc), _get_settings_key(rfunc), p.tobytes(), dt, cutoff, maxtmax)
+
+        with self._lock:
+            item = self._cache.get(key)
+            if item is not None and item[0]() is rfunc:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return item[1]
+
+        b = rfunc.block(p, dt, cutoff=cutoff, maxtmax=maxtmax)
+        b.flags.writeable = False
+
+        with self._lock:
+            self.misses += 1
+            self._cache[key] = (ref(rfunc), b)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+        return b
+
+    def clear(self) -> None:
+        """Method to remove all block responses from the cache and reset the
+        counters."""
+        with self._lock:
+            self._cache.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> dict:
+        """Method to get the number of hits and misses and the size of the cache.
+
+        Returns
+        -------
+        info: dict
+            Dictionary with the number of hits and misses, the current number of
+            stored block responses (size) and the maximum size.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._cache),
+            "maxsize": self.maxsize,
+        }
+
+
+def _get_settings_key(rfunc: RFunc) -> tuple:
+    """Internal method to get the settings of a response function as a hashable
+    key."""
+    settings = []
+    for key, value in rfunc.to_dict().items():
+        if isinstance(value, (list, np.ndarray)):
+            value = tuple(np.ravel(value))
+        settings.append((key, value))
+    return tuple(settings)
+
+
+block_cache = BlockCache()
+
+
+def set_block_cache_size(maxsize: int) -> None:
+    """Set the maximum number of block responses stored in the cache.
+
+    Parameters
+    ----------
+    maxsize: int
+        Maximum number of block responses that are stored. Use 0 to disable the
+        caching of block responses.
+    """
+    if maxsize < 0:
+        msg = "The maximum size of the block cache should be zero or positive."
+        logger.error(msg)
+        raise ValueError(msg)
+    block_cache.maxsize = maxsize
+    with block_cache._lock:
+        while len(block_cache._cache) > maxsize:
+            block_cache._cache.popitem(last=False)
+
+
+class SeriesStore:
+    """Store for time series that are shared by all TimeSeries with the same values.
+
+    Notes
+    -----
+    The values and the index of a series are stored once for each key, as a
+    read-only array and an index. Values that are already read-only are stored
+    without a copy. Each TimeSeries gets its own pandas Series that
+    uses the stored values and index, so the name of the Series may differ. The
+    original series are stored with the hash of their values and index (see
+    `get_series_hash`) as key. The series of a TimeSeries that are updated with
+    the settings are stored with the hash of the original series and the settings
+    as key.
+
+    The store only holds weak references to the values and the index. A series is
+    removed from the store as soon as no Series uses it anymore, so the store
+    does not have to be cleared. Set `enabled` to False to give each TimeSeries
+    its own copy of the series again.
+    """
+
+    def __init__(self) -> None:
+        self.enabled = True
+        self.hits = 0
+        self.misses = 0
+        self._values = WeakValueDictionary()
+        self._index = WeakValueDictionary()
+        self._lock = Lock()
+
+    def add(self, key: Hashable, series: Series) -> Series:
+        """Method to get the stored series for the key, or store the series.
+
+        Parameters
+        ----------
+        key: hashable
+            The key of the series, e.g., computed with `get_series_hash`.
+        series: pandas.Series
+            The series to store if no series is stored for the key yet.
+
+        Returns
+        -------
+        series: pandas.Series
+            Series with the name of the provided series and the read-only values
+            and index of the stored series. If the store is not enabled or key is
+            None, a copy of the provided series.
+        """
+        if not self.enabled or key is None:
+            return series.copy()
+
+        with self._lock:
+            values = self._values.get(key)
+            index = self._index.get(key)
+            if values is None or index is None:
+                # read-only values (e.g., memory-mapped) are stored without a copy
+                values = series.values
+                if values.flags.writeable:
+                    values = np.array(values)
+                    values.flags.writeable = False
+                index = series.index
+                self._values[key] = values
+                self._index[key] = index
+                self.misses += 1
+            else:
+                self.hits += 1
+        return Series(values, index=index, name=series.name, copy=False)
+
+    def info(self) -> dict:
+        """Method to get the number of hits and misses and the size of the store.
+
+        Returns
+        -------
+        info: dict
+            Dictionary with the number of hits and misses, the current number of
+            stored series (size) and the number of bytes of the stored values.
+        """
+        with self._lock:
+            arrays = list(self._values.values())
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(arrays),
+            "nbytes": sum(values.nbytes for values in arrays),
+        }
+
+
+series_store = SeriesStore()
+
+
+def get_series_hash(series: Series) -> str:
+    """Get a hash of the values and the index of a series.
+
+    Parameters
+    ----------
+    series: pandas.Series
+        Series with a DatetimeIndex.
+
+    Returns
+    -------
+    hash: str
+        Hexadecimal string that is the same for series with the same values and
+        index, independent of the name of the series.
+    """
+    h = blake2b(digest_size=16)
+    values = np.ascontiguousarray(series.values)
+    index = np.ascontiguousarray(series.index.values)
+    h.update(f"{values.dtype.str}{index.dtype.str}{values.size}".encode())
+    h.update(values.view(np.uint8))
+    h.update(index.view(np.uint8))
+    return h.hexdigest()
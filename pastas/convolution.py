@@ -0,0 +1,248 @@
+"""This module contains the methods to convolve the stresses with block responses.
+
+The contribution of most stress models is the convolution of a stress with a block
+response, truncated to the length of the stress. The best method to compute this
+convolution depends on the length of the stress and the block response. A direct
+convolution is fastest for short block responses, while the Fast Fourier Transform
+(FFT) is fastest for long block responses. For long stresses and relatively short
+block responses, the overlap-add method is fastest.
+
+The stresses do not change during the calibration of a model, while the block
+responses do. The real FFT of a stress can therefore be stored and reused, so only
+the block response has to be transformed in each simulation.
+
+Examples
+--------
+>>> ps.set_convolution_method("fft")
+
+"""
+
+from logging import getLogger
+from typing import List, Optional
+
+import numpy as np
+from scipy.fft import irfft, next_fast_len, rfft
+from scipy.signal import fftconvolve, oaconvolve
+
+from pastas.typing import ArrayLike
+
+logger = getLogger(__name__)
+
+CONVOLUTION_METHODS = ["auto", "direct", "fft", "oa"]
+CONVOLUTION_METHOD = "auto"
+
+# Block responses up to this length are convolved directly by the "auto" method
+_DIRECT_MAX_LENGTH = 64
+# Stresses this many times longer than the block response use the overlap-add
+# method with the "auto" method
+_OA_MIN_RATIO = 50
+
+
+def set_convolution_method(method: str) -> None:
+    """Set the method used to convolve the stresses with the block responses.
+
+    Parameters
+    ----------
+    method: str
+        One of "auto" (default), "direct", "fft" or "oa" (overlap-add). With
+        "auto", the method is chosen based on the length of the stress and the
+        block response.
+    """
+    if method not in CONVOLUTION_METHODS:
+        msg = "Convolution method %s is not supported. Choose from %s."
+        logger.error(msg, method, CONVOLUTION_METHODS)
+        raise ValueError(msg % (method, CONVOLUTION_METHODS))
+    global CONVOLUTION_METHOD
+    CONVOLUTION_METHOD = method
+
+
+def convolve(
+    stress: ArrayLike,
+    b: ArrayLike,
+    method: Optional[str] = None,
+    spectra: Optional[dict] = None,
+) -> ArrayLike:
+    """Method to convolve a stress with a block response.
+
+    Parameters
+    ----------
+    stress: array_like
+        Array with the stress. If the stress is two-dimensional, each column of
+        the stress is convolved with the same column of b (e.g., the recharge and
+        the block response for different parameter sets).
+    b: array_like
+        Array with the block response. If b is two-dimensional, the stress is
+        convolved with each of the columns of b (e.g., the derivatives of a block
+        response to the parameters).
+    method: str, optional
+        One of "auto", "direct", "fft" or "oa". If None (default), the method set
+        with `set_convolution_method` is used. With "auto", the method is chosen
+        based on the length of the stress and the block response.
+    spectra: dict, optional
+        Dictionary to store the real FFT of the stress in, with the length of the
+        FFT as key. If provided, the FFT method reuses the stored FFT of the stress
+        and stores new ones. Only provide a dictionary that belongs to this stress.
+        Not used for a two-dimensional stress.
+
+    Returns
+    -------
+    h: array_like
+        The convolution of the stress and the block response, with the same
+        length as the stress (and the same number of columns as b).
+
+    Notes
+    -----
+    Only the causal part of the convolution with the length of the stress is
+    returned. The block response is truncated to the length of the stress
+    beforehand, as the remainder of the block response does not contribute to
+    the result. The full convolution (n + m - 1 values for a stress with length n
+    and a block response with length m) is still computed and truncated: an FFT
+    shorter than n + m - 1 would add the end of the convolution to the first
+    values, and for the direct and overlap-add methods the m - 1 extra values are
+    a small part of the computation, as these methods are only chosen for block
+    responses that are much shorter than the stress.
+
+    With `spectra`, the length of the FFT is rounded up to a limited number of
+    lengths, so that the FFT of the stress can be reused for block responses with
+    slightly different lengths (e.g., during the calibration of a model).
+    """
+    n = stress.shape[0]
+    b = b[:n]
+    if method is None:
+        method = CONVOLUTION_METHOD
+    if method == "auto":
+        method = _choose_method(n, b.shape[0], spectra is not None)
+
+    if stress.ndim == 2:
+        return _convolve_columns(stress, b, method)
+    elif method == "fft" and spectra is not None:
+        return _convolve_spectrum(stress, b, spectra)
+
+    if b.ndim == 1:
+        if method == "direct":
+            return np.convolve(stress, b)[:n]
+        elif method == "oa":
+            return oaconvolve(stress, b, "full")[:n]
+        return fftconvolve(stress, b, "full")[:n]
+
+    if method == "direct":
+        h = np.empty((n, b.shape[1]))
+        for j in range(b.shape[1]):
+            h[:, j] = np.convolve(stress, b[:, j])[:n]
+        return h
+    elif method == "oa":
+        return oaconvolve(stress[:, np.newaxis], b, "full", axes=0)[:n]
+    return fftconvolve(stress[:, np.newaxis], b, "full", axes=0)[:n]
+
+
+def _convolve_columns(stress: ArrayLike, b: ArrayLike, method: str) -> ArrayLike:
+    """Internal method to convolve each column of the stress with the same column
+    of the block response."""
+    n = stress.shape[0]
+    if method == "direct":
+        h = np.empty(stress.shape)
+        for j in range(stress.shape[1]):
+            h[:, j] = np.convolve(stress[:, j], b[:, j])[:n]
+        return h
+    elif method == "oa":
+        return oaconvolve(stress, b, "full", axes=0)[:n]
+    return fftconvolve(stress, b, "full", axes=0)[:n]
+
+
+def _choose_method(n: int, m: int, spectrum: bool = False) -> str:
+    """Internal method to choose the convolution method for a stress with length n
+    and a block response with length m.
+
+    If the FFT of the stress can be reused (spectrum=True), the FFT method is
+    faster than the overlap-add method for all but the shortest block responses.
+    """
+    if m <= _DIRECT_MAX_LENGTH:
+        return "direct"
+    elif not spectrum and n >= _OA_MIN_RATIO * m:
+        return "oa"
+    return "fft"
+
+
+def convolve_sum(
+    stresses: List[ArrayLike],
+    b: ArrayLike,
+    spectra: Optional[List[Optional[dict]]] = None,
+) -> ArrayLike:
+    """Method to convolve multiple stresses with their block responses and sum the
+    results.
+
+    Parameters
+    ----------
+    stresses: list of array_like
+        List with one-dimensional arrays with the stresses, all with the same length.
+    b: array_like
+        Two-dimensional array with the block response for each stress in the
+        columns.
+    spectra: list of dict, optional
+        List with a dictionary for each stress to store the real FFT of the stress
+        in (see `convolve`). A dictionary may be None.
+
+    Returns
+    -------
+    h: array_like
+        The sum of the convolutions, with the same length as the stresses.
+
+    Notes
+    -----
+    With the FFT method, the products of the FFTs of the stresses and the block
+    responses are summed before the inverse FFT, so only one inverse FFT is
+    computed for all stresses.
+    """
+    n = stresses[0].shape[0]
+    b = b[:n]
+    method = CONVOLUTION_METHOD
+    if method == "auto":
+        method = _choose_method(n, b.shape[0], spectrum=True)
+    if spectra is None:
+        spectra = [None] * len(stresses)
+
+    if method != "fft":
+        h = np.zeros(n)
+        for i, stress in enumerate(stresses):
+            h += convolve(stress, b[:, i], method=method)
+        return h
+
+    nfft = _get_nfft(n, b.shape[0])
+    h_fft = np.zeros(nfft // 2 + 1, dtype=complex)
+    b_fft = rfft(b, nfft, axis=0)
+    for i, stress in enumerate(stresses):
+        h_fft += _get_stress_fft(stress, nfft, spectra[i]) * b_fft[:, i]
+    return irfft(h_fft, nfft)[:n]
+
+
+def _get_nfft(n: int, m: int) -> int:
+    """Internal method to get the length of the FFT for a stress with length n and
+    a block response with length m."""
+    # round up the length of the block response to a power of two, so only a few
+    # FFTs of the stress are stored
+    m = min(1 << int(np.ceil(np.log2(max(m, 1)))), n)
+    return next_fast_len(n + m - 1, real=True)
+
+
+def _get_stress_fft(stress: ArrayLike, nfft: int, spectra: Optional[dict]) -> ArrayLike:
+    """Internal method to get the real FFT of the stress, stored in spectra."""
+    if spectra is None:
+        return rfft(stress, nfft)
+    stress_fft = spectra.get(nfft)
+    if stress_fft is None:
+        stress_fft = rfft(stress, nfft)
+        spectra[nfft] = stress_fft
+    return stress_fft
+
+
+def _convolve_spectrum(stress: ArrayLike, b: ArrayLike, spectra: dict) -> ArrayLike:
+    """Internal method to convolve a stress with a block response using the
+    stored real FFT of the stress."""
+    n = stress.shape[0]
+    nfft = _get_nfft(n, b.shape[0])
+    stress_fft = _get_stress_fft(stress, nfft, spectra)
+
+    if b.ndim == 1:
+        return irfft(stress_fft * rfft(b, nfft), nfft)[:n]
+    b_fft = rfft(b, nfft, axis=0)
+    return irfft(stress_fft[:, np.newaxis] * b_fft, nfft, axis=0)[:n]
@@ -1,2 +1,4 @@
 # flake8: noqa
+from . import pasz
+from .archive import ModelArchive
 from .base import dump, load
@@ -0,0 +1,295 @@
+"""This file contains the ModelArchive to store many models in a single file.
+
+The ModelArchive stores the models in a SQLite database. The model data is stored
+as json (the same structure as a .pas file), and the time series are stored as
+binary arrays in a separate table. Time series with identical values and index,
+e.g., a precipitation series used in many models, are stored only once. For each
+model, the name of the oseries, the period and a number of goodness-of-fit
+statistics are stored in an index, which can be queried without loading the models.
+
+Examples
+--------
+>>> with ps.io.ModelArchive("models.db") as archive:
+...     archive.add_model(ml)
+...     index = archive.get_index()
+...     names = index.index[index["evp"] > 70]
+...     models = [archive.load(name) for name in names]
+
+"""
+
+import json
+import sqlite3
+from logging import getLogger
+from typing import List, Optional
+
+import numpy as np
+from pandas import DataFrame, DatetimeIndex, Series, Timestamp
+
+from pastas.cache import get_series_hash
+from pastas.io.base import _load_model
+from pastas.io.pas import PastasEncoder, pastas_hook
+from pastas.io.pasz import _SERIES_KEY, _PaszEncoder
+from pastas.typing import Model
+
+logger = getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS models (
+    name TEXT PRIMARY KEY,
+    info TEXT NOT NULL,
+    metadata TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS series (
+    key TEXT PRIMARY KEY,
+    refs INTEGER NOT NULL,
+    series_values BLOB NOT NULL,
+    series_index BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS model_series (
+    model TEXT NOT NULL,
+    key TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS model_series_model ON model_series (model);
+"""
+
+
+class ModelArchive:
+    """Archive to store many models in a single file.
+
+    Parameters
+    ----------
+    fname: str
+        The name of the archive file. The file is created if it does not exist.
+    stats: list of str, optional
+        The goodness-of-fit statistics (methods of `ml.stats`) that are stored in
+        the index of the archive for each model that is added. If None, the
+        statistics in `ModelArchive.stats` are stored.
+
+    Notes
+    -----
+    The models are loaded one at a time with `load`, without reading the data of
+    the other models. The index and the metadata of all models are read with
+    `get_index` and `get_metadata`, without loading the models.
+
+    The statistics are computed when a model is added to the archive. They are NaN
+    for a model that is not solved.
+    """
+
+    stats = ["rmse", "evp", "rsq", "nse", "aic", "bic"]
+
+    def __init__(self, fname: str, stats: Optional[List[str]] = None) -> None:
+        self.fname = fname
+        if stats is not None:
+            self.stats = stats
+        self._connection = sqlite3.connect(fname)
+        self._connection.executescript(_SCHEMA)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(fname={self.fname}, models={len(self)})"
+
+    def __len__(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM models").fetchone()[0]
+
+    def __contains__(self, name: str) -> bool:
+        query = "SELECT 1 FROM models WHERE name = ?"
+        return self._connection.execute(query, (name,)).fetchone() is not None
+
+    def __enter__(self) -> "ModelArchive":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    @property
+    def names(self) -> List[str]:
+        """The names of the models in the archive."""
+        query = "SELECT name FROM models ORDER BY rowid"
+        return [row[0] for row in self._connection.execute(query)]
+
+    def close(self) -> None:
+        """Method to close the archive file."""
+        self._connection.close()
+
+    def add_model(self, ml: Model, overwrite: bool = False) -> None:
+        """Method to add a model to the archive.
+
+        Parameters
+        ----------
+        ml: pastas.model.Model
+            The model to add. The model is stored under the name of the model.
+        overwrite: bool, optional
+            If True, a model with the same name in the archive is replaced. If
+            False (default), a ValueError is raised if the name is already used.
+        """
+        exists = ml.name in self
+        if exists and not overwrite:
+            msg = "A model with the name %s is already in the archive."
+            logger.error(msg, ml.name)
+            raise ValueError(msg % ml.name)
+
+        data = ml.to_dict(series=True)
+        info = {
+            "oseries": ml.oseries.name,
+            "tmin": ml.settings["tmin"],
+            "tmax": ml.settings["tmax"],
+            "stressmodels": list(ml.stressmodels),
+            "noisemodel": ml.noisemodel._name if ml.noisemodel else None,
+            "solver": ml.solver._name if ml.solver else None,
+        }
+        solved = ml.solver is not None and not ml.parameters["optimal"].hasnans
+        for stat in self.stats:
+            info[stat] = getattr(ml.stats, stat)() if solved else np.nan
+
+        # the old model is only deleted if the new model is added successfully
+        with self._connection:
+            if exists:
+                self._delete_model(ml.name)
+            keys = set()
+
+            def write_series(series: Series) -> dict:
+                key = self._write_series(series)
+                keys.add(key)
+                return {_SERIES_KEY: key, "name": series.name}
+
+            data = _PaszEncoder(write_series).encode(data)
+            self._connection.execute(
+                "INSERT INTO models VALUES (?, ?, ?, ?)",
+                (
+                    ml.name,
+                    json.dumps(info, cls=PastasEncoder),
+                    json.dumps(ml.oseries.metadata, cls=PastasEncoder),
+                    data,
+                ),
+            )
+            self._connection.executemany(
+                "INSERT INTO model_series VALUES (?, ?)",
+                [(ml.name, key) for key in keys],
+            )
+            self._connection.executemany(
+                "UPDATE series SET refs = refs + 1 WHERE key = ?",
+                [(key,) for key in keys],
+            )
+
+    def load(self, name: str) -> Model:
+        """Method to load a model from the archive.
+
+        Parameters
+        ----------
+        name: str
+            The name of the model.
+
+        Returns
+        -------
+        ml: pastas.model.Model
+            The model.
+        """
+        query = "SELECT data FROM models WHERE name = ?"
+        row = self._connection.execute(query, (name,)).fetchone()
+        if row is None:
+            msg = "There is no model with the name %s in the archive."
+            logger.error(msg, name)
+            raise KeyError(msg % name)
+
+        series = {}
+
+        def hook(obj: dict):
+            if _SERIES_KEY in obj:
+                key = (obj[_SERIES_KEY], obj.get("name"))
+                if key not in series:
+                    series[key] = self._read_series(*key)
+                return series[key]
+            return pastas_hook(obj)
+
+        # the model data is written by add_model, so it does not have to be validated
+        return _load_model(json.loads(row[0], object_hook=hook), validate=False)
+
+    def del_model(self, name: str) -> None:
+        """Method to delete a model from the archive.
+
+        Parameters
+        ----------
+        name: str
+            The name of the model. Time series that are not used by other models
+            are deleted as well.
+        """
+        if name not in self:
+            msg = "There is no model with the name %s in the archive."
+            logger.error(msg, name)
+            raise KeyError(msg % name)
+        with self._connection:
+            self._delete_model(name)
+
+    def _delete_model(self, name: str) -> None:
+        """Internal method to delete a model, within the current transaction."""
+        self._connection.execute(
+            "UPDATE series SET refs = refs - 1 WHERE key IN "
+            "(SELECT key FROM model_series WHERE model = ?)",
+            (name,),
+        )
+        self._connection.execute("DELETE FROM series WHERE refs <= 0")
+        self._connection.execute("DELETE FROM model_series WHERE model = ?", (name,))
+        self._connection.execute("DELETE FROM models WHERE name = ?", (name,))
+
+    def get_index(self) -> DataFrame:
+        """Method to get the index of the archive, without loading the models.
+
+        Returns
+        -------
+        index: pandas.DataFrame
+            DataFrame with the name of the oseries, the period (tmin and tmax), the
+            names of the stress models, the name of the noise model (None if no
+            noise model is used), the name of the solver and the statistics of each
+            model, with the names of the models as index.
+        """
+        index = self._read_column("info")
+        for column in ["tmin", "tmax"]:
+            if column in index:
+                index[column] = [
+                    Timestamp(t) if t is not None else None for t in index[column]
+                ]
+        return index
+
+    def get_metadata(self) -> DataFrame:
+        """Method to get the metadata of the oseries, without loading the models.
+
+        Returns
+        -------
+        metadata: pandas.DataFrame
+            DataFrame with the metadata of the oseries of each model, with the names
+            of the models as index.
+        """
+        return self._read_column("metadata")
+
+    def _read_column(self, column: str) -> DataFrame:
+        """Internal method to read a json column of all models to a DataFrame."""
+        query = f"SELECT name, {column} FROM models ORDER BY rowid"
+        rows = self._connection.execute(query).fetchall()
+        df = DataFrame(
+            [json.loads(row[1]) for row in rows], index=[row[0] for row in rows]
+        )
+        df.index.name = "name"
+        return df
+
+    def _write_series(self, series: Series) -> str:
+        """Internal method to store a time series, if it is not stored yet."""
+        if not isinstance(series.index, DatetimeIndex):
+            msg = "Only time series with a DatetimeIndex can be stored in a %s"
+            logger.error(msg, "ModelArchive.")
+            raise TypeError(msg % "ModelArchive.")
+        index = series.index.tz_localize(None).as_unit("ns")
+        series = Series(np.asarray(series.values, dtype=float), index=index)
+        key = get_series_hash(series)
+        self._connection.execute(
+            "INSERT OR IGNORE INTO series VALUES (?, 0, ?, ?)",
+            (key, series.values.tobytes(), index.asi8.tobytes()),
+        )
+        return key
+
+    def _read_series(self, key: str, name: Optional[str] = None) -> Series:
+        """Internal method to read a time series."""
+        query = "SELECT series_values, series_index FROM series WHERE key = ?"
+        values, index = self._connection.execute(query, (key,)).fetchone()
+        values = np.frombuffer(values, dtype=float)
+        index = DatetimeIndex(np.frombuffer(index, dtype="datetime64[ns]"))
+        return Series(values, index=index, name=name, copy=False)
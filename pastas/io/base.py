@@ -5,7 +5,7 @@ from logging import getLogger
 from os import path
 
 from packaging import version
-from pandas import to_numeric
+from pandas import DataFrame, to_numeric
 
 import pastas as ps
 
@@ -30,6 +30,13 @@ def load(fname: str, **kwargs) -> Model:
     ml: pastas.model.Model
         Pastas Model instance.
 
+    Notes
+    -----
+    A file written with the current version of Pastas is trusted, so the model is
+    built without validating the model components and rebuilding their parameters,
+    which is much faster. Files written with other versions of Pastas are
+    validated.
+
     Examples
     --------
     >>> import pastas as ps
@@ -60,7 +67,8 @@ def load(fname: str, **kwargs) -> Model:
         logger.error(msg)
         raise ValueError(msg)
 
-    ml = _load_model(data)
+    # Files written by this version of Pastas do not have to be validated
+    ml = _load_model(data, validate=file_version != ps.__version__)
 
     logger.info(
         "Pastas Model from file %s successfully loaded. This file was created with "
@@ -72,8 +80,20 @@ def load(fname: str, **kwargs) -> Model:
     return ml
 
 
-def _load_model(data: dict) -> Model:
-    """Internal method to create a model from a dictionary."""
+def _load_model(data: dict, validate: bool = True) -> Model:
+    """Internal method to create a model from a dictionary.
+
+    Parameters
+    ----------
+    data: dict
+        Dictionary with the model data, e.g., from `Model.to_dict`.
+    validate: bool, optional
+        If False, the data is trusted to be exported from a model by the current
+        version of Pastas (e.g., to copy a model). The model components are then
+        added without rebuilding the parameters for each component, and the
+        parameters of the model and its components are restored directly from the
+        data. Default is True.
+    """
     # Create model
     oseries = data["oseries"]["series"]
     metadata = data["oseries"]["metadata"]
@@ -90,10 +110,12 @@ def _load_model(data: dict) -> Model:
 
     ml = ps.Model(
         oseries=oseries,
-        constant=constant,
+        constant=constant and validate,
         name=name,
         metadata=metadata,
     )
+    if constant and not validate:
+        ml.constant = ml._get_default_constant()
 
     if "settings" in data.keys():
         if "noise" in data["settings"]:
@@ -108,13 +130,21 @@ def _load_model(data: dict) -> Model:
     # Add stressmodels
     for name, smdata in data["stressmodels"].items():
         sm = _load_stressmodel(smdata, data)
-        ml.add_stressmodel(sm)
+        if validate:
+            ml.add_stressmodel(sm)
+        else:
+            ml.stressmodels[sm.name] = sm
+            sm.update_stress(freq=ml.settings["freq"])
 
     # Add transform
     if "transform" in data.keys():
         transform = getattr(ps.transform, data["transform"].pop("class"))
         transform = transform(**data["transform"])
-        ml.add_transform(transform)
+        if validate:
+            ml.add_transform(transform)
+        else:
+            transform.set_model(ml)
+            ml.transform = transform
 
     # Add noisemodel if present
     if "noisemodel" in data.keys():
@@ -125,7 +155,10 @@ def _load_model(data: dict) -> Model:
         # if data["noisemodel"]["class"] == "ArmaModel":
         #     data["noisemodel"]["class"] = "ArmaNoiseModel"
         n = getattr(ps.noisemodels, data["noisemodel"].pop("class"))()
-        ml.add_noisemodel(n)
+        if validate:
+            ml.add_noisemodel(n)
+        else:
+            ml._set_noisemodel(n)
 
     # Add solver object to the model from pas-files < 1.3.0  TODO Deprecate
     if "fit" in data.keys():
@@ -144,6 +177,10 @@ def _load_model(data: dict) -> Model:
         ml.solver = solver(**data["solver"])
         ml.solver.set_model(ml)
 
+    if not validate:
+        _restore_parameters(ml, data["parameters"])
+        return ml
+
     # Add parameters, use update to maintain correct order
     ml.parameters = ml.get_init_parameters(noise=ml.settings["noise"])
     ml.parameters.update(data["parameters"])
@@ -158,6 +195,21 @@ def _load_model(data: dict) -> Model:
     return ml
 
 
+def _restore_parameters(ml: Model, parameters: DataFrame) -> None:
+    """Internal method to set the parameters of a model and its components."""
+    ml.parameters = parameters.infer_objects().copy()
+    ml._check_stressmodel_compatibility()
+
+    components = [*ml.stressmodels.values(), ml.constant, ml.transform, ml.noisemodel]
+    for component in components:
+        if component is None:
+            continue
+        index = component.parameters.index
+        if index.isin(ml.parameters.index).all():
+            columns = component.parameters.columns
+            component.parameters = ml.parameters.loc[index, columns]
+
+
 def _load_stressmodel(ts, data):
     # Create and add stress model
     stressmodel = getattr(ps.stressmodels, ts.pop("class"))
@@ -246,7 +298,7 @@ def dump(fname: str, data: dict, **kwargs):
     ----------
     fname: str
         string with the name of the file, including a supported file-extension.
-        Currently supported extension are: .pas.
+        Currently supported extension are: .pas and .pasz.
     data: dict
         dictionary with the information to store.
     kwargs:
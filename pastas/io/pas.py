@@ -56,7 +56,7 @@ def pastas_hook(obj: dict):
                 obj[key] = Timedelta(value, "d")
             else:
                 obj[key] = Timedelta(value)
-        elif key in ["parameters", "pcov"]:
+        elif key in ["parameters", "pcov"] and value is not None:
             # Necessary to maintain order when using the JSON format!
             value = json.loads(value, object_pairs_hook=OrderedDict)
             param = DataFrame(data=value, columns=value.keys()).T
@@ -0,0 +1,183 @@
+"""This file contains the import and export methods for pasz-files.
+
+A .pasz file is a zip archive with the model data in a json file (the same format as
+a .pas file) and the time series as binary arrays. The values of each time series
+are stored as float64 and the index as int64 timestamps (nanoseconds), in the numpy
+.npy format. Reading these arrays is much faster than parsing the json text of the
+time series in a .pas file. Time series with identical values and index are stored
+only once.
+
+Examples
+--------
+>>> ml.to_file("model.pasz")
+>>> ml = ps.io.load("model.pasz")
+
+Read the model data without the time series, e.g., to get the parameters of many
+models quickly:
+
+>>> data = ps.io.pasz.load("model.pasz", lazy=True)
+>>> data["parameters"]
+>>> data["oseries"]["series"].load()
+
+"""
+
+import json
+from logging import getLogger
+from typing import Optional
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile
+
+import numpy as np
+from pandas import DatetimeIndex, Series
+
+from pastas.cache import get_series_hash
+from pastas.io.pas import PastasEncoder, pastas_hook
+from pastas.timeseries import TimeSeries
+
+logger = getLogger(__name__)
+
+_MODEL_FILE = "model.json"
+_SERIES_KEY = "__series__"
+
+
+class SeriesReference:
+    """Reference to a time series stored in a pasz-file.
+
+    Parameters
+    ----------
+    fname: str
+        The name of the pasz-file.
+    key: str
+        The key of the time series in the pasz-file.
+    name: str, optional
+        The name of the time series.
+    """
+
+    def __init__(self, fname: str, key: str, name: Optional[str] = None) -> None:
+        self.fname = fname
+        self.key = key
+        self.name = name
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(fname={self.fname}, key={self.key})"
+
+    def load(self, zf: Optional[ZipFile] = None) -> Series:
+        """Method to read the time series from the pasz-file.
+
+        Parameters
+        ----------
+        zf: zipfile.ZipFile, optional
+            The opened pasz-file. If None, the file is opened to read the series.
+
+        Returns
+        -------
+        series: pandas.Series
+            The time series.
+        """
+        if zf is None:
+            with ZipFile(self.fname) as zf:
+                return self.load(zf)
+        values = _read_array(zf, f"series/{self.key}/values.npy")
+        index = _read_array(zf, f"series/{self.key}/index.npy")
+        index = DatetimeIndex(index.view("datetime64[ns]"))
+        return Series(values, index=index, name=self.name, copy=False)
+
+
+def load(fname: str, lazy: bool = False) -> dict:
+    """Method to read the model data from a pasz-file.
+
+    Parameters
+    ----------
+    fname: str
+        The name of the pasz-file.
+    lazy: bool, optional
+        If True, the time series are not read, and each time series in the model
+        data is a SeriesReference, with a method `load` to read the time series
+        later. Default is False. Only use this option to read the model data
+        directly, as a model cannot be created from it with `ps.io.load`.
+
+    Returns
+    -------
+    data: dict
+        Dictionary with the model data.
+    """
+    with ZipFile(fname) as zf:
+        series = {}
+
+        def hook(obj: dict):
+            if _SERIES_KEY in obj:
+                key = (obj[_SERIES_KEY], obj.get("name"))
+                if key not in series:
+                    reference = SeriesReference(fname, *key)
+                    series[key] = reference if lazy else reference.load(zf)
+                return series[key]
+            return pastas_hook(obj)
+
+        data = json.loads(zf.read(_MODEL_FILE), object_hook=hook)
+    return data
+
+
+def dump(fname: str, data: dict, compress: bool = False) -> None:
+    """Method to write the model data to a pasz-file.
+
+    Parameters
+    ----------
+    fname: str
+        The name of the pasz-file.
+    data: dict
+        Dictionary with the model data.
+    compress: bool, optional
+        If True, the files in the archive are compressed with zlib, which reduces
+        the size of the file at the cost of slower reading and writing. Default
+        is False.
+    """
+    compression = ZIP_DEFLATED if compress else ZIP_STORED
+    with ZipFile(fname, "w", compression=compression) as zf:
+        keys = {}
+
+        def write_series(series: Series) -> dict:
+            if not isinstance(series.index, DatetimeIndex):
+                msg = "Only time series with a DatetimeIndex can be stored in a %s"
+                logger.error(msg, "pasz-file.")
+                raise TypeError(msg % "pasz-file.")
+            # store time series with identical values and index only once
+            series_hash = get_series_hash(series)
+            if series_hash not in keys:
+                key = str(len(keys))
+                index = series.index.tz_localize(None).as_unit("ns")
+                values = np.asarray(series.values, dtype=float)
+                _write_array(zf, f"series/{key}/values.npy", values)
+                _write_array(zf, f"series/{key}/index.npy", index.asi8)
+                keys[series_hash] = key
+            return {_SERIES_KEY: keys[series_hash], "name": series.name}
+
+        encoder = _PaszEncoder(write_series, indent=4)
+        zf.writestr(_MODEL_FILE, encoder.encode(data))
+    logger.info("%s file successfully exported", fname)
+
+
+class _PaszEncoder(PastasEncoder):
+    """Encoder that writes the time series to the pasz-file and stores a
+    reference to them in the json data."""
+
+    def __init__(self, write_series, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.write_series = write_series
+
+    def default(self, o):
+        if isinstance(o, TimeSeries):
+            o = o.series
+        if isinstance(o, Series):
+            return self.write_series(o)
+        return super().default(o)
+
+
+def _write_array(zf: ZipFile, name: str, array: np.ndarray) -> None:
+    """Internal method to write an array to a file in the zip archive."""
+    with zf.open(name, "w", force_zip64=True) as f:
+        np.lib.format.write_array(f, np.ascontiguousarray(array), allow_pickle=False)
+
+
+def _read_array(zf: ZipFile, name: str) -> np.ndarray:
+    """Internal method to read an array from a file in the zip archive."""
+    with zf.open(name) as f:
+        return np.lib.format.read_array(f, allow_pickle=False)
@@ -0,0 +1,200 @@
+"""This module contains lookup tables for functions that are expensive to compute.
+
+The step response of the Hantush and HantushWellModel response functions requires
+the evaluation of exponential integrals and Bessel functions for every time step.
+The normalized Hantush well function only depends on two variables, so it can be
+tabulated once on a logarithmic grid and interpolated afterward. The tables are
+built when they are first used and stored on disk, so they are only built once.
+
+Examples
+--------
+>>> rfunc = ps.Hantush(use_table=True)
+>>> rfunc = ps.HantushWellModel(use_table=True, table_tol=1e-6)
+
+The directory where the tables are stored is set with `rcParams["cache_dir"]`. To
+build the tables in each session without storing them on disk, use:
+
+>>> ps.rcParams["cache_dir"] = False
+
+"""
+
+from logging import getLogger
+from os import environ, makedirs
+from os.path import exists, expanduser, join
+from typing import Optional, Union
+
+import numpy as np
+from scipy.interpolate import RectBivariateSpline
+
+from pastas.rcparams import rcParams
+from pastas.typing import ArrayLike, Function
+
+logger = getLogger(__name__)
+
+TABLE_VERSION = 1
+
+
+def get_cache_dir() -> Union[str, bool]:
+    """Get the directory where Pastas stores the lookup tables.
+
+    Returns
+    -------
+    cache_dir: str or bool
+        The directory set in `rcParams["cache_dir"]`, or False if the tables are
+        not stored. If `rcParams["cache_dir"]` is None (default), the directory
+        "pastas" in $XDG_CACHE_HOME, or in ~/.cache if XDG_CACHE_HOME is not set.
+    """
+    if rcParams["cache_dir"] is not None:
+        return rcParams["cache_dir"]
+    cache_home = environ.get("XDG_CACHE_HOME", join(expanduser("~"), ".cache"))
+    return join(cache_home, "pastas")
+
+
+class HantushTable:
+    """Lookup table for the normalized Hantush well function.
+
+    Parameters
+    ----------
+    function: callable
+        Function with signature `function(tau, rho)` that returns the normalized
+        Hantush well function F / (2 K0(rho)), for arrays tau and rho that
+        broadcast.
+    tol: float, optional
+        The maximum absolute error of the interpolated function, estimated
+        halfway between the grid points. Default is 1e-5.
+    cache_dir: str, optional
+        Directory where the table is stored. If None (default), the directory
+        returned by `get_cache_dir` is used (see `rcParams["cache_dir"]`). If
+        False, the table is not stored.
+
+    Notes
+    -----
+    The function is tabulated as a function of x = log(2 tau / rho) and
+    y = log(rho), for rho between 1e-4 and 10 and x between log(1e-6) and
+    log(1e6). The approximation of the Hantush well function has a kink at
+    tau = rho / 2 (x = 0), so two bicubic splines are fitted, one on each side of
+    the kink. The number of grid points per decade is doubled until the
+    tolerance is met. For values outside the table, NaN is returned.
+    """
+
+    _x_range = (np.log(1e-6), np.log(1e6))
+    _y_range = (np.log(1e-4), np.log(10.0))
+    _max_points_per_decade = 256
+
+    def __init__(
+        self,
+        function: Function,
+        tol: float = 1e-5,
+        cache_dir: Optional[str] = None,
+    ) -> None:
+        self.function = function
+        self.tol = tol
+        if cache_dir is None:
+            cache_dir = get_cache_dir()
+        self.cache_dir = cache_dir
+
+        data = self._load()
+        if data is None:
+            data = self._build()
+            self._save(data)
+        self.splines = [
+            RectBivariateSpline(data["x_left"], data["y"], data["z_left"]),
+            RectBivariateSpline(data["x_right"], data["y"], data["z_right"]),
+        ]
+
+    @property
+    def path(self) -> str:
+        """The path of the file the table is stored in."""
+        fname = f"hantush_table_v{TABLE_VERSION}_{self.tol:.0e}.npz"
+        return join(self.cache_dir, fname)
+
+    def __call__(self, tau: ArrayLike, rho: float) -> ArrayLike:
+        """Method to interpolate the normalized Hantush well function.
+
+        Parameters
+        ----------
+        tau: array_like
+            Increasing array with the values of tau (t / a).
+        rho: float
+            The value of rho.
+
+        Returns
+        -------
+        f: array_like
+            Array with the interpolated function, NaN outside the table.
+        """
+        f = np.full(tau.shape, np.nan)
+        y = np.log(rho)
+        if not self._y_range[0] <= y <= self._y_range[1]:
+            return f
+
+        x = np.log(2 * tau / rho)
+        left = (x >= self._x_range[0]) & (x < 0.0)
+        right = (x >= 0.0) & (x <= self._x_range[1])
+        for spline, mask in zip(self.splines, [left, right]):
+            if mask.any():
+                f[mask] = spline(x[mask], y)[:, 0]
+        return f
+
+    def _build(self) -> dict:
+        """Internal method to build the table for the tolerance."""
+        npd = 16  # number of points per decade
+        while True:
+            y = self._get_grid(*self._y_range, npd)
+            x_left = self._get_grid(self._x_range[0], 0.0, npd)
+            x_right = self._get_grid(0.0, self._x_range[1], npd)
+            data = {"y": y}
+            error = 0.0
+            for side, x in [("left", x_left), ("right", x_right)]:
+                z = self._evaluate(x, y)
+                spline = RectBivariateSpline(x, y, z)
+                xm = (x[1:] + x[:-1]) / 2
+                ym = (y[1:] + y[:-1]) / 2
+                z_mid = self._evaluate(xm, ym)
+                error = max(error, np.abs(spline(xm, ym) - z_mid).max())
+                data[f"x_{side}"] = x
+                data[f"z_{side}"] = z
+            if error <= self.tol:
+                return data
+            elif 2 * npd > self._max_points_per_decade:
+                logger.warning(
+                    "The tolerance of the Hantush table of %s is not met, the "
+                    "estimated maximum error is %.1e.",
+                    self.tol,
+                    error,
+                )
+                return data
+            npd *= 2
+
+    def _evaluate(self, x: ArrayLike, y: ArrayLike) -> ArrayLike:
+        """Internal method to evaluate the function on a grid of x and y."""
+        rho = np.exp(y)[np.newaxis, :]
+        tau = np.exp(x)[:, np.newaxis] * rho / 2
+        return self.function(tau, rho)
+
+    @staticmethod
+    def _get_grid(start: float, stop: float, npd: int) -> ArrayLike:
+        """Internal method to get a grid with npd points per decade."""
+        n = int(np.ceil((stop - start) / np.log(10) * npd)) + 1
+        return np.linspace(start, stop, n)
+
+    def _load(self) -> Optional[dict]:
+        """Internal method to load the table from the cache directory."""
+        if self.cache_dir is False or not exists(self.path):
+            return None
+        try:
+            with np.load(self.path) as f:
+                return {key: f[key] for key in f.files}
+        except Exception as e:
+            logger.info("Hantush table could not be loaded from %s: %s", self.path, e)
+            return None
+
+    def _save(self, data: dict) -> None:
+        """Internal method to store the table in the cache directory."""
+        if self.cache_dir is False:
+            return
+        try:
+            makedirs(self.cache_dir, exist_ok=True)
+            np.savez(self.path, **data)
+        except OSError as e:
+            logger.info("Hantush table could not be stored in %s: %s", self.path, e)
@@ -0,0 +1,137 @@
+"""This module contains methods to use memory-mapped time series.
+
+Long time series with a high frequency (e.g., 20 years of observations every 15
+minutes) take a lot of memory, in every process that uses them. A time series can
+therefore be stored in files with `write_series` and read back with `read_series`
+as a Series with memory-mapped values and index. The data of such a Series is only
+read from the file when it is used, and the operating system shares the data
+between all processes that use the same file.
+
+A TimeSeries does not copy the read-only values of a memory-mapped Series. If no
+values have to be changed with the settings (e.g., no NaN-values and the same
+frequency), the updated series and the stresses of the stress models are views of
+the memory-mapped values, so only the part of the files between tmin and tmax is
+read during a simulation. A memory-mapped Series is pickled as a reference to the
+files instead of its values, so sending a model to a worker process (e.g., with
+`ps.solve_many`) does not copy the data.
+
+Examples
+--------
+>>> ps.memmap.write_series(series, "well_1")
+>>> series = ps.memmap.read_series("well_1")
+>>> ml = ps.Model(series)
+
+"""
+
+from logging import getLogger
+from mmap import ALLOCATIONGRANULARITY
+from os import fspath
+from typing import Optional, Tuple
+
+import numpy as np
+from pandas import DatetimeIndex, Series
+
+logger = getLogger(__name__)
+
+
+class _MemmapArray(np.memmap):
+    """Memory-mapped array that is pickled as a reference to the file.
+
+    Notes
+    -----
+    Like a numpy.memmap, the results of computations (e.g., the mean) are plain
+    arrays or scalars, and only views of the file are memory-mapped arrays.
+    """
+
+    def __array_wrap__(self, array, context=None, *args):
+        array = super().__array_wrap__(array, context, *args)
+        if array is self or not isinstance(array, np.memmap):
+            return array
+        if array.shape == ():
+            return array[()]
+        return array.view(np.ndarray)
+
+    def __getitem__(self, index):
+        result = super().__getitem__(index)
+        if isinstance(result, np.memmap) and result._mmap is None:
+            return result.view(np.ndarray)
+        return result
+
+    def __reduce__(self):
+        location = self._get_location()
+        if location is None:
+            return np.asarray(self).__reduce__()
+        return _open_memmap, (self.filename, self.dtype.str, *location)
+
+    def _get_location(self) -> Optional[Tuple[int, int]]:
+        """Internal method to get the offset in bytes and the length of the array
+        in the file, or None if the array is not a contiguous part of the file."""
+        if getattr(self, "_mmap", None) is None or self.ndim != 1:
+            return None
+        if not self.flags.c_contiguous:
+            return None
+        # the memory map starts at the allocation granularity before the offset
+        start = self.offset - self.offset % ALLOCATIONGRANULARITY
+        buffer = np.frombuffer(self._mmap, dtype=np.uint8)
+        pointer = self.__array_interface__["data"][0]
+        offset = pointer - buffer.__array_interface__["data"][0] + start
+        return offset, self.size
+
+
+def _open_memmap(filename: str, dtype: str, offset: int, size: int) -> np.ndarray:
+    """Internal method to open a read-only memory-mapped array."""
+    if size == 0:
+        return np.empty(0, dtype=dtype)
+    return _MemmapArray(filename, dtype=dtype, mode="r", offset=offset, shape=(size,))
+
+
+def _open_npy(fname: str) -> np.ndarray:
+    """Internal method to open a .npy-file as a read-only memory-mapped array."""
+    array = np.load(fname, mmap_mode="r")
+    if not isinstance(array, np.memmap):
+        return array
+    return _open_memmap(fname, array.dtype.str, array.offset, array.size)
+
+
+def write_series(series: Series, fname: str) -> None:
+    """Method to write a time series to files that can be memory-mapped.
+
+    Parameters
+    ----------
+    series: pandas.Series
+        Series with a DatetimeIndex.
+    fname: str
+        The name of the files without extension. The values are written as float64
+        to `fname`.values.npy and the index as int64 timestamps (nanoseconds) to
+        `fname`.index.npy.
+    """
+    if not isinstance(series.index, DatetimeIndex):
+        msg = "Only time series with a DatetimeIndex can be memory-mapped."
+        logger.error(msg)
+        raise TypeError(msg)
+    fname = fspath(fname)
+    index = series.index.tz_localize(None).as_unit("ns")
+    np.save(f"{fname}.values.npy", np.asarray(series.values, dtype=float))
+    np.save(f"{fname}.index.npy", index.asi8)
+
+
+def read_series(fname: str, name: Optional[str] = None) -> Series:
+    """Method to read a time series with memory-mapped values and index.
+
+    Parameters
+    ----------
+    fname: str
+        The name of the files without extension, see `write_series`.
+    name: str, optional
+        The name of the series.
+
+    Returns
+    -------
+    series: pandas.Series
+        Series with read-only, memory-mapped values and index.
+    """
+    fname = fspath(fname)
+    values = _open_npy(f"{fname}.values.npy")
+    index = _open_npy(f"{fname}.index.npy")
+    index = DatetimeIndex(index.view("datetime64[ns]"), copy=False)
+    return Series(values, index=index, name=name, copy=False)
@@ -2,6 +2,8 @@
 
 # Python Dependencies
 from collections import OrderedDict
+from copy import deepcopy
+from functools import partial
 from itertools import combinations
 from logging import getLogger
 from os import getlogin
@@ -22,6 +24,7 @@ from pandas import (
 )
 
 # Internal Pastas
+from pastas.cache import block_cache
 from pastas.decorators import get_stressmodel
 from pastas.io.base import _load_model, dump
 from pastas.modelstats import Statistics
@@ -140,8 +143,7 @@ class Model:
         }
 
         if constant:
-            constant = Constant(initial=self.oseries.series.mean(), name="constant")
-            self.add_constant(constant)
+            self.add_constant(self._get_default_constant())
 
         if noisemodel is not None:
             if noisemodel is True:
@@ -172,6 +174,7 @@ class Model:
         self.oseries_calib = None
         self.interpolate_simulation = None
         self.normalize_residuals = False
+        self._simulation_alignment = None
         self.solver = None
         self._solve_success = False
 
@@ -193,6 +196,13 @@ class Model:
             noise=True if self.noisemodel else False,
         )
 
+    def __getstate__(self) -> dict:
+        # the alignment refers to the stress models by their identity, so it is not
+        # valid after unpickling and is set again in the first solve
+        state = self.__dict__.copy()
+        state["_simulation_alignment"] = None
+        return state
+
     def add_stressmodel(
         self, stressmodel: Union[StressModel, List[StressModel]], replace: bool = True
     ) -> None:
@@ -276,6 +286,10 @@ class Model:
         self.parameters = self.get_init_parameters(initial=False)
         self._check_stressmodel_compatibility()
 
+    def _get_default_constant(self) -> Constant:
+        """Internal method to get the constant that is added to a new model."""
+        return Constant(initial=self.oseries.series.mean(), name="constant")
+
     def add_transform(self, transform: ThresholdTransform):
         """Add a Transform to the time series Model.
 
@@ -318,6 +332,12 @@ class Model:
         If a noisemodel is present, it will always be used during optimization.
 
         """
+        self._set_noisemodel(noisemodel)
+        self.parameters = self.get_init_parameters(initial=False)
+
+    def _set_noisemodel(self, noisemodel: NoiseModelType) -> None:
+        """Internal method to set the noisemodel, without updating the parameters
+        of the model."""
         self.noisemodel = noisemodel
         self.noisemodel.set_init_parameters(oseries=self.oseries.series)
 
@@ -328,7 +348,6 @@ class Model:
             self.noisemodel._set_initial("noise_alpha", freq_in_days)
 
         self.settings["noise"] = True
-        self.parameters = self.get_init_parameters(initial=False)
 
     @get_stressmodel
     def del_stressmodel(self, name: str):
@@ -431,14 +450,52 @@ class Model:
         elif not isinstance(warmup, Timedelta):
             warmup = Timedelta(warmup, "D")
 
-        # Get the simulation index and the time step
-        sim_index = self._get_sim_index(tmin, tmax, freq, warmup)
-        dt = _get_dt(freq)
-
         # Get parameters if none are provided
         if p is None:
             p = self.get_parameters()
 
+        # Simulate with NumPy arrays if the contributions are aligned
+        values = self._simulate_values(p, tmin, tmax, freq, warmup, return_warmup)
+        if values is not None:
+            if return_warmup:
+                index = self._simulation_alignment["sim_index"]
+            else:
+                index = self._simulation_alignment["index"]
+            sim = Series(data=values, index=index)
+        else:
+            sim = self._simulate_series(p, tmin, tmax, freq, warmup)
+
+            # Respect provided tmin/tmax at this point, since warmup matters for
+            # simulation but should not be returned, unless return_warmup=True.
+            if not return_warmup:
+                sim = sim.loc[tmin:tmax]
+
+        if sim.hasnans:
+            msg = (
+                "Simulation contains NaN-values. Check if time series settings "
+                "are provided for each stress model "
+                "(e.g. `ps.StressModel(stress, settings='prec')`!"
+            )
+            logger.error(msg)
+            raise ValueError(msg)
+
+        sim.name = "Simulation"
+        return sim
+
+    def _simulate_series(
+        self,
+        p: ArrayLike,
+        tmin: Timestamp,
+        tmax: Timestamp,
+        freq: str,
+        warmup: Timedelta,
+    ) -> Series:
+        """Internal method to simulate the model by adding the contributions as
+        pandas Series, including the warmup period."""
+        # Get the simulation index and the time step
+        sim_index = self._get_sim_index(tmin, tmax, freq, warmup)
+        dt = _get_dt(freq)
+
         sim = Series(data=np.zeros(sim_index.size, dtype=float), index=sim_index)
 
         istart = 0  # Track parameters index to pass to stressmodel object
@@ -455,24 +512,420 @@ class Model:
             sim = self.transform.simulate(
                 sim, p[istart : istart + self.transform.nparam]
             )
+        return sim
 
-        # Respect provided tmin/tmax at this point, since warmup matters for
-        # simulation but should not be returned, unless return_warmup=True.
-        if not return_warmup:
-            sim = sim.loc[tmin:tmax]
+    def _simulate_values(
+        self,
+        p: ArrayLike,
+        tmin: Timestamp,
+        tmax: Timestamp,
+        freq: str,
+        warmup: Timedelta,
+        return_warmup: bool = False,
+    ) -> Union[ArrayLike, None]:
+        """Internal method to simulate the model using NumPy arrays.
 
-        if sim.hasnans:
-            msg = (
-                "Simulation contains NaN-values. Check if time series settings "
-                "are provided for each stress model "
-                "(e.g. `ps.StressModel(stress, settings='prec')`!"
+        Returns
+        -------
+        sim: numpy.ndarray or None
+            Array with the simulated values, aligned with the simulation index
+            stored in `_simulation_alignment`. None is returned if the alignment
+            is not available for the provided arguments, in which case the model
+            has to be simulated using pandas Series.
+
+        Notes
+        -----
+        The alignment of the contributions with the simulation index is determined
+        once in the `initialize` method. This saves the alignment of pandas Series
+        in each call, which is the main cost of a simulation for small models.
+        """
+        alignment = self._simulation_alignment
+        if alignment is None or alignment["key"] != self._get_simulation_key(
+            tmin, tmax, freq, warmup
+        ):
+            return None
+
+        sim_index = alignment["sim_index"]
+        dt = _get_dt(freq)
+
+        sim = np.zeros(sim_index.size, dtype=float)
+
+        istart = 0  # Track parameters index to pass to stressmodel object
+        for sm in self.stressmodels.values():
+            contrib = sm._simulate_array(
+                p[istart : istart + sm.nparam], sim_index[0], tmax, freq, dt
             )
-            logger.error(msg)
-            raise ValueError(msg)
+            if contrib.size != sim.size:
+                # the stresses have changed since the model was initialized
+                self._simulation_alignment = None
+                return None
+            sim += contrib
+            istart += sm.nparam
+        if self.constant:
+            sim += self.constant.simulate(p[istart])
+            istart += 1
+        if self.transform:
+            sim = self.transform.simulate(
+                Series(data=sim, index=sim_index),
+                p[istart : istart + self.transform.nparam],
+            ).values
 
-        sim.name = "Simulation"
+        if not return_warmup:
+            sim = sim[alignment["slice"]]
         return sim
 
+    def _simulate_batch(
+        self,
+        P: ArrayLike,
+        name: Optional[str] = None,
+        n_jobs: Optional[int] = None,
+    ) -> Union[ArrayLike, None]:
+        """Internal method to simulate the model for many parameter sets at once.
+
+        Parameters
+        ----------
+        P: array_like
+            Two-dimensional array with a parameter set in each row.
+        name: str, optional
+            Name of a stressmodel. If provided, the contribution of this stressmodel
+            is simulated and P contains the parameters of this stressmodel only.
+        n_jobs: int, optional
+            Number of processes used to simulate nonlinear recharge models. Default
+            is None, which uses the current process only.
+
+        Returns
+        -------
+        sim: numpy.ndarray or None
+            Array with shape (nsim, nsamples) with the simulation (or contribution)
+            between tmin and tmax for each parameter set in a column. The rows are
+            aligned with the index stored in `_simulation_alignment`. None is
+            returned if the model cannot be simulated using NumPy arrays with the
+            current settings (see `_simulate_values`).
+        """
+        tmin = self.settings["tmin"]
+        tmax = self.settings["tmax"]
+        freq = self.settings["freq"]
+        warmup = self.settings["warmup"]
+
+        alignment = self._simulation_alignment
+        if alignment is None or alignment["key"] != self._get_simulation_key(
+            tmin, tmax, freq, warmup
+        ):
+            return None
+
+        sim_index = alignment["sim_index"]
+        dt = _get_dt(freq)
+        P = np.atleast_2d(np.asarray(P, dtype=float))
+
+        if name is not None:
+            sim = self.stressmodels[name]._simulate_batch(
+                P, sim_index[0], tmax, freq, dt, n_jobs=n_jobs
+            )
+            if sim.shape[0] != sim_index.size:
+                return None
+            return sim[alignment["slice"]]
+
+        sim = np.zeros((sim_index.size, P.shape[0]))
+
+        istart = 0  # Track parameters index to pass to stressmodel object
+        for sm in self.stressmodels.values():
+            contrib = sm._simulate_batch(
+                P[:, istart : istart + sm.nparam],
+                sim_index[0],
+                tmax,
+                freq,
+                dt,
+                n_jobs=n_jobs,
+            )
+            if contrib.shape[0] != sim_index.size:
+                return None
+            sim += contrib
+            istart += sm.nparam
+        if self.constant:
+            sim += P[:, istart]
+            istart += 1
+        if self.transform:
+            p_transform = P[:, istart : istart + self.transform.nparam]
+            for i in range(P.shape[0]):
+                sim[:, i] = self.transform.simulate(
+                    Series(data=sim[:, i], index=sim_index), p_transform[i]
+                ).values
+
+        return sim[alignment["slice"]]
+
+    def _simulate_jacobian(self, p: ArrayLike) -> Union[ArrayLike, None]:
+        """Internal method to get the derivatives of the simulation to the parameters.
+
+        Parameters
+        ----------
+        p: array_like
+            array_like object with the values as floats representing the model
+            parameters.
+
+        Returns
+        -------
+        jac: numpy.ndarray or None
+            Array with shape (nsim, nparam) with the derivatives of the simulation
+            between tmin and tmax to the parameters. The columns of the parameters of
+            the noise model are zero. None is returned if the model cannot be
+            simulated using NumPy arrays (see `_simulate_values`) or if a transform
+            is present, as the simulation is then not linear in the contributions.
+        """
+        tmin = self.settings["tmin"]
+        tmax = self.settings["tmax"]
+        freq = self.settings["freq"]
+        warmup = self.settings["warmup"]
+
+        alignment = self._simulation_alignment
+        if (
+            self.transform is not None
+            or alignment is None
+            or alignment["key"] != self._get_simulation_key(tmin, tmax, freq, warmup)
+        ):
+            return None
+
+        sim_index = alignment["sim_index"]
+        dt = _get_dt(freq)
+        p = np.asarray(p, dtype=float)
+        jac = np.zeros((sim_index.size, p.size))
+
+        istart = 0  # Track parameters index to pass to stressmodel object
+        for sm in self.stressmodels.values():
+            jac_sm = sm._simulate_jacobian(
+                p[istart : istart + sm.nparam], sim_index[0], tmax, freq, dt
+            )
+            if jac_sm.shape[0] != sim_index.size:
+                return None
+            jac[:, istart : istart + sm.nparam] = jac_sm
+            istart += sm.nparam
+        if self.constant:
+            jac[:, istart] = 1.0
+
+        return jac[alignment["slice"]]
+
+    def _get_linear_parameters(self) -> ArrayLike:
+        """Internal method to get the parameters the simulation is linear in.
+
+        Returns
+        -------
+        linear: numpy.ndarray
+            Boolean array with the length of the number of parameters, which is True
+            for the parameters the simulation is linear in (e.g., the gains of the
+            response functions and the constant). All False if a transform is used.
+        """
+        linear = np.zeros(self.parameters.index.size, dtype=bool)
+        if self.transform is not None:
+            return linear
+
+        istart = 0  # Track parameters index to pass to stressmodel object
+        for sm in self.stressmodels.values():
+            linear[istart : istart + sm.nparam] = sm._get_linear_parameters()
+            istart += sm.nparam
+        if self.constant:
+            linear[istart] = True
+        return linear
+
+    def _simulate_linear_basis(
+        self, p: ArrayLike, columns: ArrayLike
+    ) -> Union[ArrayLike, None]:
+        """Internal method to simulate the contributions of linear parameters.
+
+        Parameters
+        ----------
+        p: array_like
+            array_like object with the values as floats representing the model
+            parameters.
+        columns: array_like
+            Indices of the linear parameters (see `_get_linear_parameters`).
+
+        Returns
+        -------
+        basis: numpy.ndarray or None
+            Array with shape (nsim, ncolumns) with the simulation between tmin and
+            tmax for a value of one of each linear parameter. The simulation is the
+            sum of these columns multiplied by the linear parameters and the
+            contributions of the other parameters. None is returned if the model
+            cannot be simulated using NumPy arrays (see `_simulate_values`).
+        """
+        tmin = self.settings["tmin"]
+        tmax = self.settings["tmax"]
+        freq = self.settings["freq"]
+        warmup = self.settings["warmup"]
+
+        alignment = self._simulation_alignment
+        if alignment is None or alignment["key"] != self._get_simulation_key(
+            tmin, tmax, freq, warmup
+        ):
+            return None
+
+        sim_index = alignment["sim_index"]
+        dt = _get_dt(freq)
+        p = np.asarray(p, dtype=float)
+        basis = np.zeros((sim_index.size, len(columns)))
+
+        istart = 0  # Track parameters index to pass to stressmodel object
+        for sm in self.stressmodels.values():
+            for i, j in enumerate(columns):
+                if istart <= j < istart + sm.nparam:
+                    p_sm = p[istart : istart + sm.nparam].copy()
+                    p_sm[j - istart] = 1.0
+                    contrib = sm._simulate_array(p_sm, sim_index[0], tmax, freq, dt)
+                    if contrib.size != sim_index.size:
+                        return None
+                    basis[:, i] = contrib
+            istart += sm.nparam
+        if self.constant:
+            basis[:, np.asarray(columns) == istart] = 1.0
+
+        return basis[alignment["slice"]]
+
+    def _get_simulation_key(
+        self, tmin: Timestamp, tmax: Timestamp, freq: str, warmup: Timedelta
+    ) -> tuple:
+        """Internal method to get the key that identifies the simulation alignment."""
+        return (
+            tmin,
+            tmax,
+            freq,
+            warmup,
+            self.settings["time_offset"],
+            tuple(id(sm) for sm in self.stressmodels.values()),
+        )
+
+    def _set_simulation_alignment(self) -> None:
+        """Internal method to align the contributions with the simulation index.
+
+        Notes
+        -----
+        The contributions of all stress models are simulated once with the
+        current settings. If each contribution has exactly the same index as the
+        simulation index, the alignment is stored and the model is simulated using
+        NumPy arrays afterwards (see `_simulate_values`). Otherwise, the model is
+        simulated using pandas Series.
+        """
+        self._simulation_alignment = None
+
+        tmin = self.settings["tmin"]
+        tmax = self.settings["tmax"]
+        freq = self.settings["freq"]
+        warmup = self.settings["warmup"]
+
+        sim_index = self._get_sim_index(tmin, tmax, freq, warmup)
+        dt = _get_dt(freq)
+        p = self.parameters.initial.to_numpy(dtype=float)
+
+        istart = 0
+        for sm in self.stressmodels.values():
+            contrib = sm.simulate(
+                p[istart : istart + sm.nparam], sim_index[0], tmax, freq, dt
+            )
+            istart += sm.nparam
+            if not contrib.index.equals(sim_index):
+                logger.debug(
+                    "The contribution of %s is not aligned with the simulation "
+                    "index. The model is simulated using pandas Series.",
+                    sm.name,
+                )
+                return
+
+        # Positions of tmin and tmax, like sim.loc[tmin:tmax]
+        istart = sim_index.searchsorted(tmin, side="left")
+        iend = sim_index.searchsorted(tmax, side="right")
+
+        self._simulation_alignment = {
+            "key": self._get_simulation_key(tmin, tmax, freq, warmup),
+            "sim_index": sim_index,
+            "slice": slice(istart, iend),
+            "index": sim_index[istart:iend],
+            "oseries_calib": None,
+            "observations": None,
+            "missing": None,
+        }
+
+    def _get_observation_values(self, sim: ArrayLike) -> ArrayLike:
+        """Internal method to get the simulated values at the observation times.
+
+        Notes
+        -----
+        The positions of (or the interpolation between) the simulated values at
+        the times of the calibration observations are computed once and stored
+        with the simulation alignment. Without interpolation, observations between
+        the simulation time steps get NaN values, like with `Series.reindex`.
+        """
+        alignment = self._simulation_alignment
+        if alignment["oseries_calib"] is not self.oseries_calib:
+            obs_index = self.oseries_calib.index
+            index = alignment["index"]
+            if self.interpolate_simulation is None:
+                if obs_index.difference(index).size != 0:
+                    self.interpolate_simulation = True
+                    logger.info(
+                        "There are observations between the simulation time steps. "
+                        "Linear interpolation between simulated values is used."
+                    )
+            if self.interpolate_simulation:
+                observations = (
+                    obs_index.asi8.astype(float),
+                    index.asi8.astype(float),
+                )
+            else:
+                observations = index.get_indexer(obs_index)
+                missing = observations < 0
+                alignment["missing"] = missing if missing.any() else None
+            alignment["oseries_calib"] = self.oseries_calib
+            alignment["observations"] = observations
+
+        observations = alignment["observations"]
+        if isinstance(observations, tuple):
+            # interpolate simulation to times of observations
+            if sim.ndim == 2:
+                return np.column_stack(
+                    [np.interp(observations[0], observations[1], s) for s in sim.T]
+                )
+            return np.interp(observations[0], observations[1], sim)
+        else:
+            values = sim[observations]
+            if alignment["missing"] is not None:
+                values[alignment["missing"]] = np.nan
+            return values
+
+    def _residuals_batch(self, P: ArrayLike) -> Union[ArrayLike, None]:
+        """Internal method to calculate the residuals for many parameter sets.
+
+        Parameters
+        ----------
+        P: array_like
+            Two-dimensional array with a parameter set in each row.
+
+        Returns
+        -------
+        res: numpy.ndarray or None
+            Array with shape (nobs, nsamples) with the residuals at the times of
+            the calibration observations for each parameter set in a column. None
+            is returned if the residuals cannot be computed using NumPy arrays (see
+            `_simulate_batch`), in which case the residuals method has to be used.
+        """
+        if self.settings["freq_obs"] is None:
+            freq_obs = self.settings["freq"]
+        else:
+            freq_obs = self.settings["freq_obs"]
+        oseries_calib = self.observations(
+            self.settings["tmin"], self.settings["tmax"], freq_obs
+        )
+        if oseries_calib is not self.oseries_calib:
+            return None
+
+        sim = self._simulate_batch(P)
+        if sim is None:
+            return None
+        res = oseries_calib.values[:, np.newaxis] - self._get_observation_values(sim)
+        if np.isnan(res).any():
+            return None  # let the residuals method handle the NaN-values
+
+        if self.normalize_residuals:
+            res = res - res.mean(axis=0)
+        return res
+
     def residuals(
         self,
         p: Optional[ArrayLike] = None,
@@ -517,12 +970,53 @@ class Model:
         else:
             freq_obs = self.settings["freq_obs"]
 
-        # simulate model
-        sim = self.simulate(p, tmin, tmax, freq, warmup, return_warmup=False)
-
         # Get the oseries calibration series
         oseries_calib = self.observations(tmin, tmax, freq_obs)
 
+        # Simulate with NumPy arrays if the contributions are aligned
+        sim = None
+        if oseries_calib is self.oseries_calib and self._simulation_alignment:
+            if p is None:
+                p = self.get_parameters()
+            if warmup is None:
+                warmup = self.settings["warmup"]
+            elif not isinstance(warmup, Timedelta):
+                warmup = Timedelta(warmup, "D")
+            sim = self._simulate_values(p, tmin, tmax, freq, warmup)
+            if sim is not None and np.isnan(sim).any():
+                sim = None  # let the simulate method raise the error
+
+        if sim is not None:
+            res = Series(
+                data=oseries_calib.values - self._get_observation_values(sim),
+                index=oseries_calib.index,
+            )
+        else:
+            res = self._residuals_series(p, tmin, tmax, freq, warmup, oseries_calib)
+
+        if res.hasnans:
+            res = res.dropna()
+            logger.warning("Nan-values were removed from the residuals.")
+
+        if self.normalize_residuals:
+            res = res.subtract(res.values.mean())
+
+        res.name = "Residuals"
+        return res
+
+    def _residuals_series(
+        self,
+        p: ArrayLike,
+        tmin: TimestampType,
+        tmax: TimestampType,
+        freq: str,
+        warmup: Union[float, Timedelta],
+        oseries_calib: Series,
+    ) -> Series:
+        """Internal method to calculate the residuals using pandas Series."""
+        # simulate model
+        sim = self.simulate(p, tmin, tmax, freq, warmup, return_warmup=False)
+
         # Get simulation at the correct indices
         if self.interpolate_simulation is None:
             if oseries_calib.index.difference(sim.index).size != 0:
@@ -541,17 +1035,7 @@ class Model:
             sim_interpolated = sim.reindex(oseries_calib.index)
 
         # Calculate the actual residuals here
-        res = oseries_calib.subtract(sim_interpolated)
-
-        if res.hasnans:
-            res = res.dropna()
-            logger.warning("Nan-values were removed from the residuals.")
-
-        if self.normalize_residuals:
-            res = res.subtract(res.values.mean())
-
-        res.name = "Residuals"
-        return res
+        return oseries_calib.subtract(sim_interpolated)
 
     def noise(
         self,
@@ -769,6 +1253,19 @@ class Model:
         # Initialize parameters
         self.parameters = self.get_init_parameters(noise, initial)
 
+        # Prepare the stresses and align the contributions with the simulation index.
+        # The stresses are only prepared again if the period or the stresses changed.
+        if not self.sim_index.empty:
+            for sm in self.stressmodels.values():
+                sm._get_prepared_stress(
+                    tmin=self.sim_index[0],
+                    tmax=self.settings["tmax"],
+                    freq=self.settings["freq"],
+                )
+            self._set_simulation_alignment()
+        else:
+            self._simulation_alignment = None
+
         # Prepare model if not fitting the constant as a parameter
         if self.settings["fit_constant"] is False:
             if self.transform is not None:
@@ -792,6 +1289,7 @@ class Model:
         weights: Optional[Series] = None,
         fit_constant: bool = True,
         freq_obs: Optional[str] = None,
+        warm_start: bool = False,
         **kwargs,
     ) -> None:
         """Method to solve the time series model.
@@ -839,6 +1337,12 @@ class Model:
             multiple of that e.g. "7D". Should generally be larger than the frequency
             of the original observations and the model frequency (freq). If freq_obs
             is not set, the frequency of the model (freq) will be used.
+        warm_start: bool, optional
+            Start the optimization from the optimal parameters of an earlier
+            optimization (like initial=False) and use the results of the solver of
+            that optimization, e.g., to scale the parameters with their standard
+            errors in the LeastSquares solver. Useful to solve the model again after
+            a few observations or stress values are added. Default is False.
         **kwargs: dict, optional
             All keyword arguments will be passed onto minimization method from the
             solver. It depends on the solver used which arguments can be used.
@@ -850,6 +1354,14 @@ class Model:
           ml.solver.pcor).
         - Each solver returns a number of results after optimization. These solver
           specific results are stored in ml.solver.result and can be accessed from there.
+        - The stresses are only prepared again if the simulation period, the
+          frequency or the stresses changed since the model was last solved.
+
+        Examples
+        --------
+        >>> ml.solve()
+        >>> # after new observations are added to the model
+        >>> ml.solve(warm_start=True)
 
         See Also
         --------
@@ -877,6 +1389,16 @@ class Model:
             logger.error(msg)
             raise ValueError(msg)
 
+        if warm_start:
+            if self.parameters.optimal.isna().any():
+                logger.warning(
+                    "The model has no optimal parameters to start from, the initial "
+                    "parameters are used."
+                )
+                warm_start = False
+            else:
+                initial = False
+
         # Initialize the model
         self.initialize(
             tmin=tmin,
@@ -905,6 +1427,10 @@ class Model:
 
         self.settings["solver"] = self.solver._name
 
+        # Use the results of the earlier optimization, unless provided by the user
+        if warm_start:
+            kwargs = {**self.solver._get_warm_start_kwargs(), **kwargs}
+
         # Solve model
         success, optimal, stderr = self.solver.solve(
             noise=self.settings["noise"], weights=weights, **kwargs
@@ -1571,11 +2097,14 @@ class Model:
         response: pandas.Series or None
             Pandas.Series with the response, None if not present.
         """
-        if self.stressmodels[name].rfunc is None:
+        rfunc = self.stressmodels[name].rfunc
+        if rfunc is None:
             logger.warning("Stressmodel %s has no rfunc.", name)
             return None
+        elif block_or_step == "block" and set(kwargs).issubset(["cutoff", "maxtmax"]):
+            block_or_step = partial(block_cache.get_block, rfunc)
         else:
-            block_or_step = getattr(self.stressmodels[name].rfunc, block_or_step)
+            block_or_step = getattr(rfunc, block_or_step)
 
         if p is None:
             p = self.get_parameters(name)
@@ -1586,6 +2115,8 @@ class Model:
             p = self.stressmodels[name].get_parameters(model=self, istress=istress)
 
         response = block_or_step(p, dt, **kwargs)
+        if not response.flags.writeable:
+            response = response.copy()  # cached block responses are read-only
 
         if add_0:
             if isinstance(dt, np.ndarray):
@@ -2146,7 +2677,8 @@ class Model:
         ----------
         fname: str
             String with the name and the extension of the file. File extension has to
-            be supported by Pastas. E.g. "model.pas"
+            be supported by Pastas. E.g. "model.pas", or "model.pasz" for a binary
+            file that is faster to load.
         series: bool or str, optional
             Export the simulated series or not. If series is "original", the original
             series are exported, if series is "modified", the series are exported
@@ -2166,7 +2698,7 @@ class Model:
         # Write the dicts to a file
         return dump(fname, data, **kwargs)
 
-    def copy(self, name: Optional[str] = None) -> ModelType:
+    def copy(self, name: Optional[str] = None, deep: bool = True) -> ModelType:
         """Method to copy a model.
 
         Parameters
@@ -2174,22 +2706,72 @@ class Model:
         name: str, optional
             String with the name of the model. The old name plus is appended with
             '_copy' if no name is provided.
+        deep: bool, optional
+            If True (default), a new model is built from the data of this model. If
+            False, the model is copied without building it again: the parameters,
+            settings and model components are copied, while the time series data
+            are shared with this model. This is much faster for models with long
+            time series, e.g., to create many scenarios from one model.
 
         Returns
         -------
         ml: pastas.model.Model
             Copy of the original model with no references to the old model.
 
+        Notes
+        -----
+        The time series data are shared as read-only arrays, so changing the
+        settings of a time series in the copy (e.g., with `update_series`) does not
+        change the time series of the original model. With deep=False, the
+        solver of the copy has no results of the previous solve, like with
+        deep=True. The checkpoint file of an EmceeSolve solver is not used by the
+        copy, so the chains of the original model are not overwritten or extended.
+
         Examples
         --------
         >>> ml_copy = ml.copy(name="new_name")
+        >>> ml_scenario = ml.copy(name="scenario", deep=False)
         """
         if name is None:
             name = self.name + "_copy"
-        ml = _load_model(self.to_dict())
+        if deep:
+            # the TimeSeries are passed to reuse their validated and updated series
+            data = self.to_dict(series="modified")
+            if "solver" in data:
+                data["solver"].pop("checkpoint", None)
+            ml = _load_model(data, validate=False)
+        else:
+            ml = self._copy_shallow()
         ml.name = name
         return ml
 
+    def _copy_shallow(self) -> ModelType:
+        """Internal method to copy the model, sharing the time series data."""
+        # Objects in the memo are used in the copy instead of a deep copy. The
+        # TimeSeries get a new TimeSeries that shares the series, the derived data
+        # that depend on the identity of the stress models are not copied.
+        memo = {
+            id(self.oseries): TimeSeries(self.oseries),
+            id(self._simulation_alignment): None,
+            id(self.solver): None,
+        }
+        for sm in self.stressmodels.values():
+            for ts in sm.stress:
+                memo[id(ts)] = TimeSeries(ts)
+            memo[id(sm._prepared_stress)] = None
+        for data in [self.sim_index, self.oseries_calib]:
+            memo[id(data)] = data
+        ml = deepcopy(self, memo)
+
+        # Create a new solver with the settings of the solver of this model
+        if self.solver is not None:
+            data = self.solver.to_dict()
+            data.pop("class")
+            data.pop("checkpoint", None)
+            ml.solver = self.solver.__class__(**data)
+            ml.solver.set_model(ml)
+        return ml
+
     def _check_stressmodel_compatibility(self) -> None:
         """Internal method to check if the stressmodels are compatible with the
         model."""
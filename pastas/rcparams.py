@@ -55,5 +55,8 @@ rcParams = {
             fill_after="mean",
             fill_nan=0.0,
         ),
-    }
+    },
+    # Directory where the lookup tables are stored (see pastas.lookup). If None,
+    # the default cache directory is used. If False, the tables are not stored.
+    "cache_dir": None,
 }
@@ -2,6 +2,7 @@
 """This module contains all the response functions available in Pastas."""
 
 from logging import getLogger
+from threading import Lock
 
 import numpy as np
 from numpy import pi
@@ -17,10 +18,12 @@ from scipy.special import (
     gammaincinv,
     k0,
     k1,
+    kv,
     lambertw,
 )
 
 from .decorators import latexfun, njit
+from .lookup import HantushTable
 from .version import check_numba_scipy
 
 try:
@@ -29,12 +32,15 @@ except ImportError:
     prange = range
 
 # Type Hinting
-from typing import Optional, Union
+from typing import List, Optional, Union
 
 from pastas.typing import ArrayLike
 
 logger = getLogger(__name__)
 
+_hantush_tables = {}
+_hantush_tables_lock = Lock()
+
 __all__ = [
     "Gamma",
     "Exponential",
@@ -52,6 +58,8 @@ __all__ = [
 
 class RfuncBase:
     _name = "RfuncBase"
+    _linear_gain = False  # True if the response is linear in p[0]
+    _step_broadcasts = False  # True if step supports arrays of parameters
 
     def __init__(
         self,
@@ -191,6 +199,189 @@ class RfuncBase:
         s = self.step(p=p, dt=dt, **kwargs)
         return np.append(s[0], np.subtract(s[1:], s[:-1]))
 
+    def step_batch(
+        self,
+        P: ArrayLike,
+        dt: float = 1.0,
+        cutoff: Optional[float] = None,
+        maxtmax: Optional[int] = None,
+    ) -> ArrayLike:
+        """Method to return the step responses for multiple parameter sets.
+
+        Parameters
+        ----------
+        P: array_like
+            Two-dimensional array with a parameter set in each row.
+        dt: float or array_like, optional
+            timestep as a multiple of one day, or an array with the times to compute
+            the step responses for.
+        cutoff: float, optional
+            proportion after which the step function is cut off.
+        maxtmax: int, optional
+            Maximum timestep to compute the step responses for.
+
+        Returns
+        -------
+        s: array_like
+            Array with shape (nt, nsamples) with the step response of each
+            parameter set in a column. The step responses are padded to the length
+            of the longest step response with their last value.
+
+        Notes
+        -----
+        Response functions of which the step method supports arrays of parameters
+        that broadcast with the times compute all step responses in one call.
+        Otherwise, the step method is called for each parameter set.
+        """
+        P = np.atleast_2d(np.asarray(P, dtype=float))
+
+        if not self._step_broadcasts:
+            steps = [self.step(p, dt=dt, cutoff=cutoff, maxtmax=maxtmax) for p in P]
+            nt = np.array([step.size for step in steps])
+            s = np.zeros((nt.max(), P.shape[0]))
+            for i, step in enumerate(steps):
+                s[: nt[i], i] = step
+        else:
+            if isinstance(dt, np.ndarray):
+                t = dt
+                nt = np.full(P.shape[0], t.size)
+            else:
+                tmax = np.array([self.get_tmax(p, cutoff) for p in P])
+                if maxtmax is not None:
+                    tmax = np.minimum(tmax, maxtmax)
+                tmax = np.maximum(tmax, 3 * dt)
+                t = np.arange(dt, tmax.max(), dt)
+                nt = np.searchsorted(t, tmax)
+            # the parameters in rows broadcast with the times in a column
+            s = self.step(P.T[:, np.newaxis, :], dt=t[:, np.newaxis])
+
+        # the step responses are constant after their own tmax
+        valid = np.arange(s.shape[0])[:, np.newaxis] < nt
+        return np.where(valid, s, s[nt - 1, np.arange(P.shape[0])])
+
+    def block_batch(
+        self,
+        P: ArrayLike,
+        dt: float = 1.0,
+        cutoff: Optional[float] = None,
+        maxtmax: Optional[int] = None,
+    ) -> ArrayLike:
+        """Method to return the block responses for multiple parameter sets.
+
+        Returns
+        -------
+        b: array_like
+            Array with shape (nt, nsamples) with the block response of each
+            parameter set in a column, padded with zeros. See the step_batch method
+            for the parameters.
+        """
+        if type(self).block is not RfuncBase.block:
+            P = np.atleast_2d(np.asarray(P, dtype=float))
+            blocks = [self.block(p, dt, cutoff=cutoff, maxtmax=maxtmax) for p in P]
+            b = np.zeros((max(block.size for block in blocks), P.shape[0]))
+            for i, block in enumerate(blocks):
+                b[: block.size, i] = block
+            return b
+        s = self.step_batch(P, dt=dt, cutoff=cutoff, maxtmax=maxtmax)
+        return np.diff(s, axis=0, prepend=0.0)
+
+    def step_derivative(
+        self,
+        p: ArrayLike,
+        dt: float = 1.0,
+        cutoff: Optional[float] = None,
+        maxtmax: Optional[int] = None,
+    ) -> ArrayLike:
+        """Method to return the derivatives of the step function to the parameters.
+
+        Parameters
+        ----------
+        p: array_like
+            array_like object with the values as floats representing the model
+            parameters.
+        dt: float
+            timestep as a multiple of one day.
+        cutoff: float, optional
+            proportion after which the step function is cut off. default is 0.999.
+        maxtmax: int, optional
+            Maximum timestep to compute the block response for.
+
+        Returns
+        -------
+        ds: array_like
+            Array with shape (nt, nparam) with the derivatives of the step response
+            to each of the parameters, at the same times as the step response.
+
+        Notes
+        -----
+        The derivatives are computed with forward finite differences. Response
+        functions for which (some of) the derivatives are known analytically
+        override this method. The change of the length of the step response with
+        the parameters is not taken into account.
+        """
+        s = self.step(p, dt=dt, cutoff=cutoff, maxtmax=maxtmax)
+        return self._step_derivative_fd(
+            p, s, range(self.nparam), dt=dt, cutoff=cutoff, maxtmax=maxtmax
+        )
+
+    def block_derivative(
+        self,
+        p: ArrayLike,
+        dt: float = 1.0,
+        cutoff: Optional[float] = None,
+        maxtmax: Optional[int] = None,
+    ) -> ArrayLike:
+        """Method to return the derivatives of the block function to the parameters.
+
+        Parameters
+        ----------
+        p: array_like
+            array_like object with the values as floats representing the model
+            parameters.
+        dt: float
+            timestep as a multiple of one day.
+        cutoff: float, optional
+            proportion after which the step function is cut off. default is 0.999.
+        maxtmax: int, optional
+            Maximum timestep to compute the block response for.
+
+        Returns
+        -------
+        db: array_like
+            Array with shape (nt, nparam) with the derivatives of the block response
+            to each of the parameters, at the same times as the block response.
+        """
+        ds = self.step_derivative(p, dt=dt, cutoff=cutoff, maxtmax=maxtmax)
+        return np.diff(ds, axis=0, prepend=0.0)
+
+    def _step_derivative_fd(
+        self,
+        p: ArrayLike,
+        s: ArrayLike,
+        columns: List[int],
+        dt: float = 1.0,
+        cutoff: Optional[float] = None,
+        maxtmax: Optional[int] = None,
+        ds: Optional[ArrayLike] = None,
+    ) -> ArrayLike:
+        """Internal method to compute derivatives of the step function with forward
+        finite differences for the parameters in columns."""
+        p = np.asarray(p, dtype=float)
+        if ds is None:
+            ds = np.zeros((s.size, self.nparam))
+        for j in columns:
+            h = np.sqrt(np.finfo(float).eps) * max(1.0, abs(p[j]))
+            p1 = p.copy()
+            p1[j] += h
+            s1 = self.step(p1, dt=dt, cutoff=cutoff, maxtmax=maxtmax)
+            # the length of the step response may change with the parameters
+            if s1.size >= s.size:
+                s1 = s1[: s.size]
+            else:
+                s1 = np.append(s1, np.full(s.size - s1.size, s1[-1]))
+            ds[:, j] = (s1 - s) / h
+        return ds
+
     @staticmethod
     def impulse(t: ArrayLike, p: ArrayLike) -> ArrayLike:
         """Method to return the impulse response function.
@@ -311,6 +502,8 @@ class Gamma(RfuncBase):
     """
 
     _name = "Gamma"
+    _linear_gain = True
+    _step_broadcasts = True
 
     def __init__(
         self,
@@ -376,6 +569,32 @@ class Gamma(RfuncBase):
         s = p[0] * gammainc(p[1], t / p[2])
         return s
 
+    def step_derivative(
+        self,
+        p: ArrayLike,
+        dt: float = 1.0,
+        cutoff: Optional[float] = None,
+        maxtmax: Optional[int] = None,
+    ) -> ArrayLike:
+        """Method to return the derivatives of the step function to the parameters.
+
+        Notes
+        -----
+        The derivatives to A and a are computed analytically and the derivative
+        to n with forward finite differences.
+
+        See `RfuncBase.step_derivative` for the parameters and the returned array.
+        """
+        t = self.get_t(p=p, dt=dt, cutoff=cutoff, maxtmax=maxtmax)
+        A, n, a = p
+        ds = np.zeros((t.size, self.nparam))
+        ds[:, 0] = gammainc(n, t / a)
+        ds[:, 2] = -A * (t / a) ** n * np.exp(-t / a) / (a * gamma(n))
+        # no closed-form expression for the derivative to n
+        return self._step_derivative_fd(
+            p, A * ds[:, 0], [1], dt=dt, cutoff=cutoff, maxtmax=maxtmax, ds=ds
+        )
+
     @staticmethod
     @latexfun(identifiers={"impulse": "theta", "gamma": "Gamma"})
     def impulse(t: ArrayLike, p: ArrayLike) -> ArrayLike:
@@ -408,6 +627,8 @@ class Exponential(RfuncBase):
     """
 
     _name = "Exponential"
+    _linear_gain = True
+    _step_broadcasts = True
 
     def __init__(
         self,
@@ -471,6 +692,28 @@ class Exponential(RfuncBase):
         s = p[0] * (1.0 - np.exp(-t / p[1]))
         return s
 
+    def step_derivative(
+        self,
+        p: ArrayLike,
+        dt: float = 1.0,
+        cutoff: Optional[float] = None,
+        maxtmax: Optional[float] = None,
+    ) -> ArrayLike:
+        """Method to return the derivatives of the step function to the parameters.
+
+        Notes
+        -----
+        The derivatives to A and a are computed analytically.
+
+        See `RfuncBase.step_derivative` for the parameters and the returned array.
+        """
+        t = self.get_t(p=p, dt=dt, cutoff=cutoff, maxtmax=maxtmax)
+        A, a = p
+        ds = np.zeros((t.size, self.nparam))
+        ds[:, 0] = 1.0 - np.exp(-t / a)
+        ds[:, 1] = -A * t / a**2 * np.exp(-t / a)
+        return ds
+
     @staticmethod
     @latexfun(identifiers={"impulse": "theta"})
     def impulse(t: ArrayLike, p: ArrayLike) -> ArrayLike:
@@ -495,6 +738,13 @@ class HantushWellModel(RfuncBase):
         Use the method 'numba_step' to compute the step_response.
     quad: bool, optional
         Use the method 'numba_quad' to compute the step_response.
+    use_table: bool, optional
+        Use the method 'table_step' to compute the step_response, which
+        interpolates a lookup table of the Hantush well function (see
+        pastas.lookup). Ignored if quad=True.
+    table_tol: float, optional
+        The maximum absolute error of the normalized Hantush well function in the
+        lookup table. Default is 1e-5.
 
     Notes
     -----
@@ -514,12 +764,15 @@ class HantushWellModel(RfuncBase):
     """
 
     _name = "HantushWellModel"
+    _linear_gain = True
 
     def __init__(
         self,
         cutoff: float = 0.999,
         use_numba: bool = False,
         quad: bool = False,
+        use_table: bool = False,
+        table_tol: float = 1e-5,
         **kwargs,
     ) -> None:
         RfuncBase.__init__(self, cutoff=cutoff, **kwargs)
@@ -527,6 +780,8 @@ class HantushWellModel(RfuncBase):
         self.nparam = 3
         self.use_numba = use_numba  # requires numba_scipy for real speedups
         self.quad = quad  # if quad=True, implicitly uses numba
+        self.use_table = use_table
+        self.table_tol = table_tol
         # check numba and numba_scipy installation
         if self.quad or self.use_numba:
             # turn off use_numba if numba_scipy is not available
@@ -646,22 +901,38 @@ class HantushWellModel(RfuncBase):
         return A * F / 2
 
     @staticmethod
-    def numpy_step(A: float, a: float, b: float, r: float, t: ArrayLike) -> ArrayLike:
+    def numpy_step(
+        A: float, a: float, b: float, r: Union[float, ArrayLike], t: ArrayLike
+    ) -> ArrayLike:
+        # r and t may be arrays that broadcast, e.g., r[np.newaxis, :] and
+        # t[:, np.newaxis] to compute the step responses for multiple distances
         rho = 2 * r * np.exp(b / 2)
-        rhosq = rho**2
         k0rho = k0(rho)
-        tau = t / a
-        tau1 = tau[tau < rho / 2]
-        tau2 = tau[tau >= rho / 2]
         w = (exp1(rho) - k0rho) / (exp1(rho) - exp1(rho / 2))
-        F = np.zeros_like(tau)
-        F[tau < rho / 2] = w * exp1(rhosq / (4 * tau1)) - (w - 1) * exp1(
-            tau1 + rhosq / (4 * tau1)
+        tau, rho, k0rho, w = np.broadcast_arrays(t / a, rho, k0rho, w)
+        return A * HantushWellModel._numpy_F(tau, rho, k0rho, w) / 2
+
+    @staticmethod
+    def _numpy_F(
+        tau: ArrayLike, rho: ArrayLike, k0rho: ArrayLike, w: ArrayLike
+    ) -> ArrayLike:
+        """Internal method to compute the approximation of the Hantush well function
+        for arrays with the same shape."""
+        rhosq = rho**2
+        F = np.zeros(tau.shape)
+        i1 = tau < rho / 2
+        i2 = ~i1
+        tau1 = tau[i1]
+        tau2 = tau[i2]
+        F[i1] = w[i1] * exp1(rhosq[i1] / (4 * tau1)) - (w[i1] - 1) * exp1(
+            tau1 + rhosq[i1] / (4 * tau1)
         )
-        F[tau >= rho / 2] = (
-            2 * k0rho - w * exp1(tau2) + (w - 1) * exp1(tau2 + rhosq / (4 * tau2))
+        F[i2] = (
+            2 * k0rho[i2]
+            - w[i2] * exp1(tau2)
+            + (w[i2] - 1) * exp1(tau2 + rhosq[i2] / (4 * tau2))
         )
-        return A * F / 2
+        return F
 
     def quad_step(
         self, A: float, a: float, b: float, r: float, t: ArrayLike
@@ -687,6 +958,8 @@ class HantushWellModel(RfuncBase):
 
         if self.quad:
             return self.quad_step(A, a, b, r, t)
+        elif self.use_table:
+            return self.table_step(A, a, b, r, t)
         else:
             # if numba_scipy is available and param a >= ~30, numba is faster
             if a >= 30.0 and self.use_numba:
@@ -694,6 +967,127 @@ class HantushWellModel(RfuncBase):
             else:  # otherwise numpy is faster
                 return self.numpy_step(A, a, b, r, t)
 
+    def table_step(
+        self, A: float, a: float, b: float, r: float, t: ArrayLike
+    ) -> ArrayLike:
+        rho = 2 * r * np.exp(b / 2)
+        f = _get_hantush_table(self.table_tol)(t / a, rho)
+        outside = np.isnan(f)
+        f = A * k0(rho) * f
+        if outside.any():
+            f[outside] = self.numpy_step(A, a, b, r, t[outside])
+        return f
+
+    def step_wells(
+        self,
+        p: ArrayLike,
+        distances: ArrayLike,
+        dt: float = 1.0,
+        cutoff: Optional[float] = None,
+        maxtmax: Optional[int] = None,
+    ) -> ArrayLike:
+        """Method to compute the step responses for multiple distances at once.
+
+        Parameters
+        ----------
+        p: array_like
+            array_like object with the values as floats representing the model
+            parameters A, a and b.
+        distances: array_like
+            Distances from the pumping wells to the observation point.
+        dt: float, optional
+            timestep as a multiple of one day.
+        cutoff: float, optional
+            proportion after which the step function is cut off.
+        maxtmax: float, optional
+            The maximum time of the response, usually set to the simulation length.
+
+        Returns
+        -------
+        s: array_like
+            Array with shape (nt, ndistances) with the step responses, for the
+            times of the longest response. Shorter step responses are constant
+            after their own tmax.
+        """
+        A, a, b = p[:3]
+        r = np.atleast_1d(np.asarray(distances, dtype=float))
+        tmax = np.array([self.get_tmax(np.append(p[:3], ri), cutoff) for ri in r])
+        if maxtmax is not None:
+            tmax = np.minimum(tmax, maxtmax)
+        tmax = np.maximum(tmax, 3 * dt)
+        t = np.arange(dt, tmax.max(), dt)
+
+        # only evaluate each step response up to its own tmax, like the step method
+        nt = np.searchsorted(t, tmax)
+        valid = np.arange(t.size)[:, np.newaxis] < nt
+        s = np.zeros((t.size, r.size))
+        if self.quad or self.use_table or (a >= 30.0 and self.use_numba):
+            for i, ri in enumerate(r):
+                s[: nt[i], i] = self.step(np.append(p[:3], ri), t[: nt[i]])
+        else:
+            rho = 2 * r * np.exp(b / 2)
+            k0rho = k0(rho)
+            w = (exp1(rho) - k0rho) / (exp1(rho) - exp1(rho / 2))
+            it, ir = np.nonzero(valid)
+            F = self._numpy_F(t[it] / a, rho[ir], k0rho[ir], w[ir])
+            s[it, ir] = A * F / 2
+        # the step responses are constant after their own tmax
+        return np.where(valid, s, s[nt - 1, np.arange(r.size)])
+
+    def block_wells(
+        self,
+        p: ArrayLike,
+        distances: ArrayLike,
+        dt: float = 1.0,
+        cutoff: Optional[float] = None,
+        maxtmax: Optional[int] = None,
+    ) -> ArrayLike:
+        """Method to compute the block responses for multiple distances at once.
+
+        Returns
+        -------
+        b: array_like
+            Array with shape (nt, ndistances) with the block responses. See the
+            step_wells method for the parameters.
+        """
+        s = self.step_wells(p, distances, dt=dt, cutoff=cutoff, maxtmax=maxtmax)
+        return np.diff(s, axis=0, prepend=0.0)
+
+    def step_derivative(
+        self,
+        p: ArrayLike,
+        dt: float = 1.0,
+        cutoff: Optional[float] = None,
+        maxtmax: Optional[int] = None,
+    ) -> ArrayLike:
+        """Method to return the derivatives of the step function to the parameters.
+
+        Notes
+        -----
+        The derivative to A is computed analytically, the derivative to a
+        analytically if quad is True and with forward finite differences
+        otherwise, and the derivative to b with forward finite differences.
+
+        See `RfuncBase.step_derivative` for the parameters and the returned array.
+        """
+        A, a, b = p[:3]
+        r = self._get_distance_from_params(p)
+        t = self.get_t(p=p, dt=dt, cutoff=cutoff, maxtmax=maxtmax)
+        brsq = np.exp(b) * r**2
+        ds = np.zeros((t.size, self.nparam))
+        ds[:, 0] = self.step(np.append([1.0, a, b], p[3:]), dt, cutoff, maxtmax)
+        if self.quad:
+            ds[:, 1] = -A / (2 * a) * np.exp(-a * brsq / t - t / a)
+            columns = [2]
+        else:
+            # the approximation of the integral is differentiated numerically, as
+            # the derivative of the exact integral differs slightly from it
+            columns = [1, 2]
+        # no closed-form expression for the derivative to b
+        return self._step_derivative_fd(
+            p, A * ds[:, 0], columns, dt=dt, cutoff=cutoff, maxtmax=maxtmax, ds=ds
+        )
+
     @staticmethod
     def variance_gain(
         A: float,
@@ -774,6 +1168,8 @@ class HantushWellModel(RfuncBase):
             "cutoff": self.cutoff,
             "use_numba": self.use_numba,
             "quad": self.quad,
+            "use_table": self.use_table,
+            "table_tol": self.table_tol,
         }
         return data
 
@@ -795,6 +1191,13 @@ class Hantush(RfuncBase):
         Use the method 'numba_step' to compute the step_response.
     quad: bool, optional
         Use the method 'numba_quad' to compute the step_response.
+    use_table: bool, optional
+        Use the method 'table_step' to compute the step_response, which
+        interpolates a lookup table of the Hantush well function (see
+        pastas.lookup). Ignored if quad=True.
+    table_tol: float, optional
+        The maximum absolute error of the normalized Hantush well function in the
+        lookup table. Default is 1e-5.
 
     Notes
     -----
@@ -811,18 +1214,23 @@ class Hantush(RfuncBase):
     """
 
     _name = "Hantush"
+    _linear_gain = True
 
     def __init__(
         self,
         cutoff: float = 0.999,
         use_numba: bool = False,
         quad: bool = False,
+        use_table: bool = False,
+        table_tol: float = 1e-5,
         **kwargs,
     ) -> None:
         RfuncBase.__init__(self, cutoff=cutoff, **kwargs)
         self.nparam = 3
         self.use_numba = use_numba
         self.quad = quad
+        self.use_table = use_table
+        self.table_tol = table_tol
         # check numba and numba_scipy installation
         if self.quad or self.use_numba:
             # turn off use_numba if numba_scipy is not available
@@ -865,6 +1273,11 @@ class Hantush(RfuncBase):
         parameters.loc[name + "_b"] = (1, 1e-6, 25, True, name, "uniform")
         return parameters
 
+    @property
+    def _step_broadcasts(self) -> bool:
+        # only the numpy implementation supports arrays of parameters
+        return not (self.quad or self.use_numba or self.use_table)
+
     def get_tmax(self, p: ArrayLike, cutoff: Optional[float] = None) -> float:
         # approximate formula for tmax
         if cutoff is None:
@@ -907,23 +1320,22 @@ class Hantush(RfuncBase):
 
     @staticmethod
     def numpy_step(A: float, a: float, b: float, t: ArrayLike) -> ArrayLike:
+        # the parameters and t may be arrays that broadcast (see step_batch)
         rho = 2 * np.sqrt(b)
-        rhosq = rho**2
         k0rho = k0(rho)
-        tau = t / a
-        tau_mask = tau < rho / 2
-        tau1 = tau[tau_mask]
-        tau2 = tau[~tau_mask]
         w = (exp1(rho) - k0rho) / (exp1(rho) - exp1(rho / 2))
-        F = np.zeros_like(tau)
-        F[tau_mask] = w * exp1(rhosq / (4 * tau1)) - (w - 1) * exp1(
-            tau1 + rhosq / (4 * tau1)
-        )
-        F[~tau_mask] = (
-            2 * k0rho - w * exp1(tau2) + (w - 1) * exp1(tau2 + rhosq / (4 * tau2))
-        )
+        F = HantushWellModel._numpy_F(*np.broadcast_arrays(t / a, rho, k0rho, w))
         return A * F / (2 * k0rho)
 
+    def table_step(self, A: float, a: float, b: float, t: ArrayLike) -> ArrayLike:
+        rho = 2 * np.sqrt(b)
+        f = _get_hantush_table(self.table_tol)(t / a, rho)
+        outside = np.isnan(f)
+        f = A * f
+        if outside.any():
+            f[outside] = self.numpy_step(A, a, b, t[outside])
+        return f
+
     def quad_step(self, A: float, a: float, b: float, t: ArrayLike) -> ArrayLike:
         F = np.zeros_like(t)
         u = a * b / t
@@ -943,13 +1355,48 @@ class Hantush(RfuncBase):
 
         if self.quad:
             return self.quad_step(A, a, b, t)
+        elif self.use_table:
+            return self.table_step(A, a, b, t)
         else:
             # if numba_scipy is available and param a >= ~30, numba is faster
-            if a >= 30.0 and self.use_numba:
+            if self.use_numba and a >= 30.0:
                 return self.numba_step(A, a, b, t)
             else:  # otherwise numpy is faster
                 return self.numpy_step(A, a, b, t)
 
+    def step_derivative(
+        self,
+        p: ArrayLike,
+        dt: float = 1.0,
+        cutoff: Optional[float] = None,
+        maxtmax: Optional[int] = None,
+    ) -> ArrayLike:
+        """Method to return the derivatives of the step function to the parameters.
+
+        Notes
+        -----
+        The derivative to A is computed analytically, the derivative to a
+        analytically if quad is True and with forward finite differences
+        otherwise, and the derivative to b with forward finite differences.
+
+        See `RfuncBase.step_derivative` for the parameters and the returned array.
+        """
+        A, a, b = p
+        t = self.get_t(p=p, dt=dt, cutoff=cutoff, maxtmax=maxtmax)
+        ds = np.zeros((t.size, self.nparam))
+        ds[:, 0] = self.step([1.0, a, b], dt, cutoff, maxtmax)
+        if self.quad:
+            ds[:, 1] = -A / (2 * a * k0(2 * np.sqrt(b))) * np.exp(-t / a - a * b / t)
+            columns = [2]
+        else:
+            # the approximation of the integral is differentiated numerically, as
+            # the derivative of the exact integral differs slightly from it
+            columns = [1, 2]
+        # no closed-form expression for the derivative to b
+        return self._step_derivative_fd(
+            p, A * ds[:, 0], columns, dt=dt, cutoff=cutoff, maxtmax=maxtmax, ds=ds
+        )
+
     @staticmethod
     @latexfun(identifiers={"impulse": "theta", "k0": "K_0"})
     def impulse(t: ArrayLike, p: ArrayLike) -> ArrayLike:
@@ -976,6 +1423,8 @@ class Hantush(RfuncBase):
             "cutoff": self.cutoff,
             "use_numba": self.use_numba,
             "quad": self.quad,
+            "use_table": self.use_table,
+            "table_tol": self.table_tol,
         }
         return data
 
@@ -1007,6 +1456,8 @@ class Polder(RfuncBase):
     """
 
     _name = "Polder"
+    _linear_gain = True
+    _step_broadcasts = True
 
     def __init__(
         self,
@@ -1058,6 +1509,34 @@ class Polder(RfuncBase):
             s = -s
         return s
 
+    def step_derivative(
+        self,
+        p: ArrayLike,
+        dt: float = 1.0,
+        cutoff: Optional[float] = None,
+        maxtmax: Optional[int] = None,
+    ) -> ArrayLike:
+        """Method to return the derivatives of the step function to the parameters.
+
+        Notes
+        -----
+        The derivatives to A and a are computed analytically and the derivative
+        to b with forward finite differences.
+
+        See `RfuncBase.step_derivative` for the parameters and the returned array.
+        """
+        t = self.get_t(p=p, dt=dt, cutoff=cutoff, maxtmax=maxtmax)
+        A, a, b = p
+        sign = 1.0 if self.up else -1.0
+        ds = np.zeros((t.size, self.nparam))
+        ds[:, 0] = sign * self.polder_function(np.sqrt(b), np.sqrt(t / a))
+        # the step response is a function of t / a, so ds/da = -t / a * ds/dt
+        ds[:, 1] = -sign * t / a * self.impulse(t, p)
+        # no closed-form expression for the derivative to b
+        return self._step_derivative_fd(
+            p, A * ds[:, 0], [2], dt=dt, cutoff=cutoff, maxtmax=maxtmax, ds=ds
+        )
+
     @staticmethod
     @latexfun(identifiers={"impulse": "theta"})
     def impulse(t: ArrayLike, p: ArrayLike) -> ArrayLike:
@@ -1089,6 +1568,7 @@ class One(RfuncBase):
     """
 
     _name = "One"
+    _linear_gain = True
 
     def __init__(
         self,
@@ -1158,6 +1638,15 @@ class One(RfuncBase):
     ) -> ArrayLike:
         return p[0] * np.ones(1)
 
+    def block_derivative(
+        self,
+        p: ArrayLike,
+        dt: float = 1.0,
+        cutoff: Optional[float] = None,
+        maxtmax: Optional[int] = None,
+    ) -> ArrayLike:
+        return np.ones((1, 1))
+
 
 class FourParam(RfuncBase):
     """Four Parameter response function with 4 parameters A, a, b, and n.
@@ -1184,9 +1673,18 @@ class FourParam(RfuncBase):
 
         ps.FourParam.impulse
 
+    The integral of the impulse response from zero to infinity, which is used to
+    normalize the step response, is computed with the closed-form expression
+    :math:`2 a^n b^{n/2} K_n(2 \\sqrt{b})`. Unless quad=True, the impulse response
+    is integrated over each time step with a three-point Gauss-Legendre rule,
+    where time steps are split in halves until the estimated error is small
+    enough.
     """
 
     _name = "FourParam"
+    _linear_gain = True
+    _rtol = 1e-6  # relative tolerance of the integration of the step response
+    _max_depth = 10  # maximum number of times a time step is split in halves
 
     def __init__(
         self,
@@ -1256,7 +1754,7 @@ class FourParam(RfuncBase):
             func = self.impulse(x, p)
             func_half = self.impulse(x[:-1] + 1 / 2, p)
             y[1:] = y[0] + np.cumsum(1 / 6 * (func[:-1] + 4 * func_half + func[1:]))
-            y = y / quad(self.impulse, 0, np.inf, args=p)[0]
+            y = y / self._integral(p)
             return np.searchsorted(y, cutoff)
 
         else:
@@ -1277,13 +1775,90 @@ class FourParam(RfuncBase):
                 + w3 * self.impulse(0.5 * t3 + 0.5, p)
             )
             y[1:] = y[0] + np.cumsum(1 / 6 * (func[:-1] + 4 * func_half + func[1:]))
-            y = y / quad(self.impulse, 0, np.inf, args=p)[0]
+            y = y / self._integral(p)
             return np.searchsorted(y, cutoff)
 
     @staticmethod
     def gain(p: ArrayLike) -> float:
         return p[0]
 
+    def _integral(self, p: ArrayLike) -> float:
+        """Internal method to compute the integral of the impulse response from
+        zero to infinity."""
+        _, n, a, b = p[:4]
+        integral = 2 * a**n * b ** (n / 2) * kv(n, 2 * np.sqrt(b))
+        if not np.isfinite(integral) or integral <= 0.0:
+            integral = quad(self.impulse, 0, np.inf, args=p)[0]
+        return integral
+
+    def _gauss(self, p: ArrayLike, t0: ArrayLike, t1: ArrayLike) -> ArrayLike:
+        """Internal method to integrate the impulse response from t0 to t1 with a
+        three-point Gauss-Legendre rule."""
+        h = (t1 - t0) / 2
+        c = (t0 + t1) / 2
+        x = np.sqrt(3 / 5)
+        return h * (
+            5 / 9 * self.impulse(c - h * x, p)
+            + 8 / 9 * self.impulse(c, p)
+            + 5 / 9 * self.impulse(c + h * x, p)
+        )
+
+    def _integrate(self, p: ArrayLike, t: ArrayLike, tol: float) -> ArrayLike:
+        """Internal method to integrate the impulse response over the time steps.
+
+        Parameters
+        ----------
+        p: array_like
+            array_like object with the values as floats representing the model
+            parameters.
+        t: array_like
+            Array with the times at the end of the time steps, starting at t=0.
+        tol: float
+            The tolerance of the absolute error per unit of time.
+
+        Returns
+        -------
+        integrals: array_like
+            Array with the integral of the impulse response over each time step.
+        """
+        t0 = np.append(0.0, t[:-1])
+        t1 = t.astype(float)
+        integrals = self._gauss(p, t0, t1)
+
+        # compare with Simpson's rule, which shares the function values at the ends
+        # of the time steps, to find the time steps that are not accurate enough
+        with np.errstate(divide="ignore", invalid="ignore"):
+            f = self.impulse(np.append(0.0, t1), p)
+        mid = (t0 + t1) / 2
+        simpson = (t1 - t0) / 6 * (f[:-1] + 4 * self.impulse(mid, p) + f[1:])
+        split = ~(np.abs(integrals - simpson) <= tol * (t1 - t0))
+
+        index = np.flatnonzero(split)
+        t0 = t0[split]
+        t1 = t1[split]
+        coarse = integrals[split]
+        integrals[split] = 0.0
+        for depth in range(self._max_depth + 1):
+            if index.size == 0:
+                break
+            mid = (t0 + t1) / 2
+            left = self._gauss(p, t0, mid)
+            right = self._gauss(p, mid, t1)
+            fine = left + right
+            done = np.abs(fine - coarse) <= tol * (t1 - t0)
+            if depth == self._max_depth:
+                done[:] = True
+            np.add.at(integrals, index[done], fine[done])
+            # split the time steps that are not accurate enough in halves
+            split = ~done
+            index = np.concatenate([index[split], index[split]])
+            t0, t1 = (
+                np.concatenate([t0[split], mid[split]]),
+                np.concatenate([mid[split], t1[split]]),
+            )
+            coarse = np.concatenate([left[split], right[split]])
+        return integrals
+
     def step(
         self,
         p: ArrayLike,
@@ -1302,57 +1877,44 @@ class FourParam(RfuncBase):
             s[0] = quad(self.impulse, 0, dt, args=p)[0]
             for i in range(1, len(t)):
                 s[i] = s[i - 1] + quad(self.impulse, t[i - 1], t[i], args=p)[0]
-            s = s * (p[0] / (quad(self.impulse, 0, np.inf, args=p))[0])
+            s = s * (p[0] / self._integral(p))
             return s
 
         else:
-            t1 = -np.sqrt(3 / 5)
-            t2 = 0
-            t3 = np.sqrt(3 / 5)
-            w1 = 5 / 9
-            w2 = 8 / 9
-            w3 = 5 / 9
+            t = self.get_t(p=p, dt=dt, cutoff=cutoff, maxtmax=maxtmax)
+            integral = self._integral(p)
+            tol = self._rtol * integral / t[-1]
+            s = np.cumsum(self._integrate(p, t, tol))
+            return s * (p[0] / integral)
 
-            if dt > 0.1:
-                step = 0.1  # step size for numerical integration
-                tmax = max(self.get_tmax(p=p, cutoff=cutoff), 3 * dt)
-                t = np.arange(step, tmax, step)
-                s = np.zeros_like(t)
-
-                # for interval [0,dt] :
-                s[0] = (step / 2) * (
-                    w1 * self.impulse((step / 2) * t1 + (step / 2), p)
-                    + w2 * self.impulse((step / 2) * t2 + (step / 2), p)
-                    + w3 * self.impulse((step / 2) * t3 + (step / 2), p)
-                )
+    def step_derivative(
+        self,
+        p: ArrayLike,
+        dt: float = 1.0,
+        cutoff: Optional[float] = None,
+        maxtmax: Optional[int] = None,
+    ) -> ArrayLike:
+        """Method to return the derivatives of the step function to the parameters.
 
-                # for interval [dt,tmax]:
-                func = self.impulse(t, p)
-                func_half = self.impulse(t[:-1] + step / 2, p)
-                s[1:] = s[0] + np.cumsum(
-                    step / 6 * (func[:-1] + 4 * func_half + func[1:])
-                )
-                s = s * (p[0] / quad(self.impulse, 0, np.inf, args=p)[0])
-                return s[int(dt / step - 1) :: int(dt / step)]
-            else:
-                t = self.get_t(p=p, dt=dt, cutoff=cutoff, maxtmax=maxtmax)
-                s = np.zeros_like(t)
-
-                # for interval [0,dt] Gaussian quadrate:
-                s[0] = (dt / 2) * (
-                    w1 * self.impulse((dt / 2) * t1 + (dt / 2), p)
-                    + w2 * self.impulse((dt / 2) * t2 + (dt / 2), p)
-                    + w3 * self.impulse((dt / 2) * t3 + (dt / 2), p)
-                )
+        Notes
+        -----
+        The derivative to A is computed analytically and the derivatives to n, a
+        and b with forward finite differences.
 
-                # for interval [dt,tmax] Simpson integration:
-                func = self.impulse(t, p)
-                func_half = self.impulse(t[:-1] + dt / 2, p)
-                s[1:] = s[0] + np.cumsum(
-                    dt / 6 * (func[:-1] + 4 * func_half + func[1:])
-                )
-                s = s * (p[0] / quad(self.impulse, 0, np.inf, args=p)[0])
-                return s
+        See `RfuncBase.step_derivative` for the parameters and the returned array.
+        """
+        # Because Model.get_response_tmax() provides parameters for the stressmodel,
+        # not only the response functions
+        if len(p) > 4:
+            p = p[:4]
+
+        s = self.step(np.append(1.0, p[1:]), dt=dt, cutoff=cutoff, maxtmax=maxtmax)
+        ds = np.zeros((s.size, self.nparam))
+        ds[:, 0] = s
+        # no closed-form expressions for the derivatives to n, a and b
+        return self._step_derivative_fd(
+            p, p[0] * s, [1, 2, 3], dt=dt, cutoff=cutoff, maxtmax=maxtmax, ds=ds
+        )
 
     def to_dict(self):
         """Method to export the response function to a dictionary.
@@ -1402,6 +1964,8 @@ class DoubleExponential(RfuncBase):
     """
 
     _name = "DoubleExponential"
+    _linear_gain = True
+    _step_broadcasts = True
 
     def __init__(
         self,
@@ -1478,6 +2042,32 @@ class DoubleExponential(RfuncBase):
         s = p[0] * (1 - ((1 - p[1]) * np.exp(-t / p[2]) + p[1] * np.exp(-t / p[3])))
         return s
 
+    def step_derivative(
+        self,
+        p: ArrayLike,
+        dt: float = 1.0,
+        cutoff: Optional[float] = None,
+        maxtmax: Optional[int] = None,
+    ) -> ArrayLike:
+        """Method to return the derivatives of the step function to the parameters.
+
+        Notes
+        -----
+        The derivatives to all parameters are computed analytically.
+
+        See `RfuncBase.step_derivative` for the parameters and the returned array.
+        """
+        t = self.get_t(p=p, dt=dt, cutoff=cutoff, maxtmax=maxtmax)
+        A, alpha, a1, a2 = p
+        e1 = np.exp(-t / a1)
+        e2 = np.exp(-t / a2)
+        ds = np.zeros((t.size, self.nparam))
+        ds[:, 0] = 1 - ((1 - alpha) * e1 + alpha * e2)
+        ds[:, 1] = A * (e1 - e2)
+        ds[:, 2] = -A * (1 - alpha) * t / a1**2 * e1
+        ds[:, 3] = -A * alpha * t / a2**2 * e2
+        return ds
+
 
 class Edelman(RfuncBase):
     """The function of Edelman, describing the propagation of an instantaneous
@@ -1594,6 +2184,8 @@ class Kraijenhoff(RfuncBase):
     """
 
     _name = "Kraijenhoff"
+    _linear_gain = True
+    _step_broadcasts = True
 
     def __init__(
         self,
@@ -1740,6 +2332,7 @@ class Spline(RfuncBase):
     """
 
     _name = "Spline"
+    _linear_gain = True
 
     def __init__(
         self,
@@ -1837,3 +2430,21 @@ class Spline(RfuncBase):
             "t": self.t,
         }
         return data
+
+
+def _hantush_normalized(tau: ArrayLike, rho: ArrayLike) -> ArrayLike:
+    """Internal method to compute the normalized Hantush well function
+    F / (2 K0(rho)) for arrays tau and rho that broadcast."""
+    k0rho = k0(rho)
+    w = (exp1(rho) - k0rho) / (exp1(rho) - exp1(rho / 2))
+    tau, rho, k0rho, w = np.broadcast_arrays(tau, rho, k0rho, w)
+    return HantushWellModel._numpy_F(tau, rho, k0rho, w) / (2 * k0rho)
+
+
+def _get_hantush_table(tol: float) -> HantushTable:
+    """Internal method to get the lookup table of the Hantush well function for a
+    tolerance, which is built or loaded once per session."""
+    with _hantush_tables_lock:
+        if tol not in _hantush_tables:
+            _hantush_tables[tol] = HantushTable(_hantush_normalized, tol=tol)
+        return _hantush_tables[tol]
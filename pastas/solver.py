@@ -10,21 +10,36 @@ To solve a model the following syntax can be used:
 """
 
 import importlib
+from copy import copy
+from functools import partial
 from logging import getLogger
+from os import cpu_count
+from pickle import dumps, loads
 
 # Type Hinting
-from typing import Optional, Tuple, Union
+from typing import Callable, Iterator, Optional, Tuple, Union
+from weakref import finalize
 
 import numpy as np
-from pandas import DataFrame, Series
+from pandas import DataFrame, DatetimeIndex, Index, Series
 from scipy.linalg import svd
-from scipy.optimize import least_squares
+from scipy.optimize import least_squares, lsq_linear, root
+from scipy.special import log_ndtr, ndtr, ndtri
 
+from pastas import objective_functions
 from pastas.objective_functions import GaussianLikelihood
+from pastas.stats.quantiles import P2Quantiles
 from pastas.typing import ArrayLike, CallBack, Function, Model
 
 logger = getLogger(__name__)
 
+# Number of realizations simulated at once when the quantiles are streamed
+_STREAMING_CHUNK_SIZE = 100
+# Below this acceptance rate, the parameter samples are drawn with minimax tilting
+_MIN_ACCEPTANCE_RATE = 0.05
+# Maximum number of parameter samples drawn at once with rejection sampling
+_MAX_BATCH_SIZE = 100_000
+
 
 class BaseSolver:
     _name = "BaseSolver"
@@ -139,11 +154,206 @@ class BaseSolver:
 
         return rv.values
 
+    def _misfit_batch(
+        self,
+        P: ArrayLike,
+        noise: bool,
+        weights: Optional[Series] = None,
+        callback: Optional[CallBack] = None,
+    ) -> Union[ArrayLike, None]:
+        """Internal method to obtain the misfit for many parameter sets at once.
+
+        Parameters
+        ----------
+        P: array_like
+            Two-dimensional array with a parameter set of the model in each row.
+
+        Returns
+        -------
+        rv: numpy.ndarray or None
+            Array with the misfit (see the misfit method) for each parameter set in
+            a column. None is returned if the model cannot be simulated for all
+            parameter sets at once (see `Model._simulate_batch`).
+
+        Notes
+        -----
+        The simulations of all parameter sets are computed at once. The noise
+        model and the weights are applied to the residuals of each parameter set
+        separately.
+        """
+        P = np.atleast_2d(P)
+        res = self.ml._residuals_batch(P)
+        if res is None:
+            return None
+
+        index = self.ml.oseries_calib.index
+        rv = []
+        for i, p in enumerate(P):
+            r = Series(res[:, i], index=index)
+            if noise:
+                p_noise = p[-self.ml.noisemodel.nparam :]
+                noisemodel = self.ml.noisemodel
+                r = noisemodel.simulate(r, p_noise) * noisemodel.weights(r, p_noise)
+            if weights is not None:
+                r = r.multiply(weights.reindex(r.index).fillna(1.0))
+            if callback:
+                callback(p)
+            rv.append(r.values)
+        return np.column_stack(rv)
+
+    def misfit_jacobian(
+        self,
+        p: ArrayLike,
+        noise: bool,
+        weights: Optional[Series] = None,
+        vary: Optional[ArrayLike] = None,
+    ) -> ArrayLike:
+        """Method to compute the derivatives of the misfit to the parameters.
+
+        Parameters
+        ----------
+        p: array_like
+            array_like object with the values as floats representing the
+            model parameters.
+        noise: Boolean
+        weights: pandas.Series, optional
+            pandas Series by which the residual or noise series are
+            multiplied. Typically values between 0 and 1.
+        vary: array_like, optional
+            Boolean array indicating which parameters are varied. The derivatives to
+            the other parameters are not computed and are zero. By default, all
+            derivatives are computed.
+
+        Returns
+        -------
+        jac: array_like
+            Array with shape (nobs, nparam) with the derivatives of the array
+            returned by the misfit method to the parameters.
+
+        Notes
+        -----
+        The derivatives of the simulation are obtained from the stress models,
+        which convolve the stresses with the derivatives of the block responses
+        where possible. The misfit is linear in the simulation for fixed parameters
+        of the noise model, so these derivatives are transformed into derivatives of
+        the misfit in the same way the residuals are transformed into the misfit.
+        The derivatives to the parameters of the noise model are computed with
+        forward finite differences. If the derivatives of the simulation are not
+        available (e.g., when a transform is used), forward finite differences are
+        used for all parameters.
+        """
+        p = np.asarray(p, dtype=float)
+        if vary is None:
+            vary = np.ones(p.size, dtype=bool)
+        rv = self.misfit(p, noise=noise, weights=weights)
+        jac = np.zeros((rv.size, p.size))
+
+        jac_sim = self.ml._simulate_jacobian(p)
+        if jac_sim is not None:
+            res = self.ml.residuals(p)
+            if res.size != self.ml.oseries_calib.index.size:
+                jac_sim = None  # NaN-values were removed from the residuals
+
+        if jac_sim is None:
+            columns = np.flatnonzero(vary)
+        else:
+            nnoise = self.ml.noisemodel.nparam if self.ml.noisemodel else 0
+            model_columns = np.flatnonzero(vary[: p.size - nnoise])
+            columns = np.flatnonzero(vary[p.size - nnoise :]) + p.size - nnoise
+
+            residuals_to_misfit = self._get_residuals_to_misfit(
+                p, noise, weights, res.index
+            )
+            for j in model_columns:
+                # r = h_obs - h_sim, so dr/dp = -dh_sim/dp at the observations
+                dres = -self.ml._get_observation_values(jac_sim[:, j])
+                jac[:, j] = residuals_to_misfit(dres)
+
+        for j in columns:
+            h = np.sqrt(np.finfo(float).eps) * max(1.0, abs(p[j]))
+            p1 = p.copy()
+            p1[j] += h
+            jac[:, j] = (self.misfit(p1, noise=noise, weights=weights) - rv) / h
+
+        return jac
+
+    def _get_residuals_to_misfit(
+        self,
+        p: ArrayLike,
+        noise: bool,
+        weights: Optional[Series],
+        index: DatetimeIndex,
+    ) -> Callable:
+        """Internal method to get the function that transforms (a change of) the
+        residuals into (a change of) the misfit.
+
+        Notes
+        -----
+        For fixed parameters of the noise model, the misfit is linear in the
+        residuals. The noise models in Pastas filter the residuals linearly and
+        the noise weights only depend on the time steps.
+        """
+        if noise:
+            nnoise = self.ml.noisemodel.nparam
+            p_noise = p[-nnoise:]
+            noise_weights = self.ml.noise_weights(p).values
+        if weights is not None:
+            weights = weights.reindex(index).fillna(1.0).values
+
+        def residuals_to_misfit(dres: ArrayLike) -> ArrayLike:
+            if self.ml.normalize_residuals:
+                dres = dres - dres.mean()
+            if noise:
+                dres = Series(dres, index=index)
+                dres = self.ml.noisemodel.simulate(dres, p_noise).values
+                dres = dres * noise_weights
+            if weights is not None:
+                dres = dres * weights
+            return dres
+
+        return residuals_to_misfit
+
     def prediction_interval(
-        self, n: int = 1000, alpha: float = 0.05, max_iter: int = 10, **kwargs
+        self,
+        n: int = 1000,
+        alpha: float = 0.05,
+        max_iter: int = 10,
+        n_jobs: Optional[int] = None,
+        method: str = "exact",
+        chunk_size: Optional[int] = None,
+        rng: Optional[Union[np.random.Generator, int]] = None,
+        **kwargs,
     ) -> DataFrame:
         """Method to calculate the prediction interval for the simulation.
 
+        Parameters
+        ----------
+        n: int, optional
+            Number of parameter samples, default is 1000.
+        alpha: float, optional
+            The interval is computed between the alpha / 2 and 1 - alpha / 2
+            quantiles, default is 0.05.
+        max_iter : int, optional
+            maximum number of iterations for truncated multivariate sampling,
+            default is 10.
+        n_jobs: int, optional
+            Number of processes used to simulate nonlinear recharge models. Default
+            is None, which uses the current process only.
+        method: str, optional
+            Either "exact" (default), which stores all realizations and computes the
+            quantiles exactly, or "streaming", which estimates the quantiles with a
+            bounded amount of memory.
+        chunk_size: int, optional
+            Number of realizations that are simulated at once. Default is None,
+            which simulates all realizations at once with method="exact" and 100
+            realizations at a time with method="streaming".
+        rng: numpy.random.Generator or int, optional
+            Random number generator or a seed to create one with, used to draw the
+            parameter samples. If None (default), the global random state of NumPy
+            is used.
+        **kwargs: dict, optional
+            Keyword arguments passed on to the simulation of each parameter sample.
+
         Returns
         -------
         data : Pandas.DataFrame
@@ -159,20 +369,59 @@ class BaseSolver:
 
         sigr = self.ml.residuals().std()
 
-        data = self._get_realizations(
-            func=self.ml.simulate, n=n, name=None, max_iter=max_iter, **kwargs
+        return self._get_simulation_interval(
+            n=n,
+            alpha=alpha,
+            max_iter=max_iter,
+            n_jobs=n_jobs,
+            method=method,
+            chunk_size=chunk_size,
+            sigma=sigr,
+            rng=rng,
+            **kwargs,
         )
-        data = data + sigr * np.random.randn(data.shape[0], data.shape[1])
-
-        q = [alpha / 2, 1 - alpha / 2]
-        rv = data.quantile(q, axis=1).transpose()
-        return rv
 
     def ci_simulation(
-        self, n: int = 1000, alpha: float = 0.05, max_iter: int = 10, **kwargs
+        self,
+        n: int = 1000,
+        alpha: float = 0.05,
+        max_iter: int = 10,
+        n_jobs: Optional[int] = None,
+        method: str = "exact",
+        chunk_size: Optional[int] = None,
+        rng: Optional[Union[np.random.Generator, int]] = None,
+        **kwargs,
     ) -> DataFrame:
         """Method to calculate the confidence interval for the simulation.
 
+        Parameters
+        ----------
+        n: int, optional
+            Number of parameter samples, default is 1000.
+        alpha: float, optional
+            The interval is computed between the alpha / 2 and 1 - alpha / 2
+            quantiles, default is 0.05.
+        max_iter : int, optional
+            maximum number of iterations for truncated multivariate sampling,
+            default is 10.
+        n_jobs: int, optional
+            Number of processes used to simulate nonlinear recharge models. Default
+            is None, which uses the current process only.
+        method: str, optional
+            Either "exact" (default), which stores all realizations and computes the
+            quantiles exactly, or "streaming", which estimates the quantiles with a
+            bounded amount of memory.
+        chunk_size: int, optional
+            Number of realizations that are simulated at once. Default is None,
+            which simulates all realizations at once with method="exact" and 100
+            realizations at a time with method="streaming".
+        rng: numpy.random.Generator or int, optional
+            Random number generator or a seed to create one with, used to draw the
+            parameter samples. If None (default), the global random state of NumPy
+            is used.
+        **kwargs: dict, optional
+            Keyword arguments passed on to the simulation of each parameter sample.
+
         Returns
         -------
         data : Pandas.DataFrame
@@ -187,8 +436,15 @@ class BaseSolver:
         that the true best-fit line for the observed data lies within the
         95% confidence interval.
         """
-        return self._get_confidence_interval(
-            func=self.ml.simulate, n=n, alpha=alpha, max_iter=max_iter, **kwargs
+        return self._get_simulation_interval(
+            n=n,
+            alpha=alpha,
+            max_iter=max_iter,
+            n_jobs=n_jobs,
+            method=method,
+            chunk_size=chunk_size,
+            rng=rng,
+            **kwargs,
         )
 
     def ci_block_response(
@@ -197,10 +453,30 @@ class BaseSolver:
         n: int = 1000,
         alpha: float = 0.05,
         max_iter: int = 10,
+        rng: Optional[Union[np.random.Generator, int]] = None,
         **kwargs,
     ) -> DataFrame:
         """Method to calculate the confidence interval for the block response.
 
+        Parameters
+        ----------
+        name: str
+            Name of the stressmodel to compute the interval of the response for.
+        n: int, optional
+            Number of parameter samples, default is 1000.
+        alpha: float, optional
+            The interval is computed between the alpha / 2 and 1 - alpha / 2
+            quantiles, default is 0.05.
+        max_iter : int, optional
+            maximum number of iterations for truncated multivariate sampling,
+            default is 10.
+        rng: numpy.random.Generator or int, optional
+            Random number generator or a seed to create one with, used to draw the
+            parameter samples. If None (default), the global random state of NumPy
+            is used.
+        **kwargs: dict, optional
+            Keyword arguments passed on to the response function.
+
         Returns
         -------
         data : Pandas.DataFrame
@@ -216,15 +492,17 @@ class BaseSolver:
         95% confidence interval.
         """
         dt = self.ml.get_block_response(name=name).index.values
-        return self._get_confidence_interval(
-            func=self.ml.get_block_response,
-            n=n,
-            alpha=alpha,
+        data = self._get_response_realizations(
+            block_or_step="block",
             name=name,
+            n=n,
             max_iter=max_iter,
             dt=dt,
+            rng=rng,
             **kwargs,
         )
+        q = [alpha / 2, 1 - alpha / 2]
+        return data.quantile(q=q, axis=1).transpose()
 
     def ci_step_response(
         self,
@@ -232,10 +510,30 @@ class BaseSolver:
         n: int = 1000,
         alpha: float = 0.05,
         max_iter: int = 10,
+        rng: Optional[Union[np.random.Generator, int]] = None,
         **kwargs,
     ) -> DataFrame:
         """Method to calculate the confidence interval for the step response.
 
+        Parameters
+        ----------
+        name: str
+            Name of the stressmodel to compute the interval of the response for.
+        n: int, optional
+            Number of parameter samples, default is 1000.
+        alpha: float, optional
+            The interval is computed between the alpha / 2 and 1 - alpha / 2
+            quantiles, default is 0.05.
+        max_iter : int, optional
+            maximum number of iterations for truncated multivariate sampling,
+            default is 10.
+        rng: numpy.random.Generator or int, optional
+            Random number generator or a seed to create one with, used to draw the
+            parameter samples. If None (default), the global random state of NumPy
+            is used.
+        **kwargs: dict, optional
+            Keyword arguments passed on to the response function.
+
         Returns
         -------
         data : Pandas.DataFrame
@@ -251,15 +549,17 @@ class BaseSolver:
         95% confidence interval.
         """
         dt = self.ml.get_block_response(name=name).index.values
-        return self._get_confidence_interval(
-            func=self.ml.get_step_response,
-            n=n,
-            alpha=alpha,
+        data = self._get_response_realizations(
+            block_or_step="step",
             name=name,
+            n=n,
             max_iter=max_iter,
             dt=dt,
+            rng=rng,
             **kwargs,
         )
+        q = [alpha / 2, 1 - alpha / 2]
+        return data.quantile(q=q, axis=1).transpose()
 
     def ci_contribution(
         self,
@@ -267,10 +567,44 @@ class BaseSolver:
         n: int = 1000,
         alpha: float = 0.05,
         max_iter: int = 10,
+        n_jobs: Optional[int] = None,
+        method: str = "exact",
+        chunk_size: Optional[int] = None,
+        rng: Optional[Union[np.random.Generator, int]] = None,
         **kwargs,
     ) -> DataFrame:
         """Method to calculate the confidence interval for the contribution.
 
+        Parameters
+        ----------
+        name: str
+            Name of the stressmodel to compute the interval of the contribution for.
+        n: int, optional
+            Number of parameter samples, default is 1000.
+        alpha: float, optional
+            The interval is computed between the alpha / 2 and 1 - alpha / 2
+            quantiles, default is 0.05.
+        max_iter : int, optional
+            maximum number of iterations for truncated multivariate sampling,
+            default is 10.
+        n_jobs: int, optional
+            Number of processes used to simulate nonlinear recharge models. Default
+            is None, which uses the current process only.
+        method: str, optional
+            Either "exact" (default), which stores all realizations and computes the
+            quantiles exactly, or "streaming", which estimates the quantiles with a
+            bounded amount of memory.
+        chunk_size: int, optional
+            Number of realizations that are simulated at once. Default is None,
+            which simulates all realizations at once with method="exact" and 100
+            realizations at a time with method="streaming".
+        rng: numpy.random.Generator or int, optional
+            Random number generator or a seed to create one with, used to draw the
+            parameter samples. If None (default), the global random state of NumPy
+            is used.
+        **kwargs: dict, optional
+            Keyword arguments passed on to the simulation of each parameter sample.
+
         Returns
         -------
         data : Pandas.DataFrame
@@ -285,17 +619,24 @@ class BaseSolver:
         that the true best-fit line for the observed data lies within the
         95% confidence interval.
         """
-        return self._get_confidence_interval(
-            func=self.ml.get_contribution,
+        return self._get_simulation_interval(
             n=n,
             alpha=alpha,
             name=name,
             max_iter=max_iter,
+            n_jobs=n_jobs,
+            method=method,
+            chunk_size=chunk_size,
+            rng=rng,
             **kwargs,
         )
 
     def get_parameter_sample(
-        self, name: Optional[str] = None, n: int = None, max_iter: int = 10
+        self,
+        name: Optional[str] = None,
+        n: int = None,
+        max_iter: int = 10,
+        rng: Optional[Union[np.random.Generator, int]] = None,
     ) -> ArrayLike:
         """Method to obtain a parameter sets for monte carlo analyses.
 
@@ -308,54 +649,57 @@ class BaseSolver:
             Number of random samples drawn from the bivariate normal
             distribution.
         max_iter : int, optional
-            maximum number of iterations for truncated multivariate
-            sampling, default is 10. Increase this value if number of
-            accepted parameter samples is lower than n.
+            maximum number of batches drawn with rejection sampling, default is 10.
+            The remaining samples are drawn with minimax tilting.
+        rng: numpy.random.Generator or int, optional
+            Random number generator or a seed to create one with. If None
+            (default), the global random state of NumPy is used.
 
         Returns
         -------
         array_like
             array with N parameter samples.
+
+        Notes
+        -----
+        The samples are drawn from the multivariate normal distribution truncated
+        by the parameter bounds (pmin and pmax). Samples are first drawn in batches
+        and the samples outside the bounds are rejected. The size of each batch is
+        based on the acceptance rate so far. If the acceptance rate is low (e.g.,
+        when the optimal parameters are close to their bounds) or after max_iter
+        batches, the remaining samples are drawn with minimax tilting, an exact
+        sampler that only proposes samples within the bounds.
         """
         p = self.ml.get_parameters(name=name)
-        pcov = self._get_covariance_matrix(name=name)
+        pcov = self._get_covariance_matrix(name=name).to_numpy()
 
         if name is None:
             parameters = self.ml.parameters
         else:
             parameters = self.ml.parameters.loc[self.ml.parameters.name == name]
 
-        pmin = parameters.pmin.fillna(-np.inf).values
-        pmax = parameters.pmax.fillna(np.inf).values
+        pmin = parameters.pmin.fillna(-np.inf).to_numpy(dtype=float)
+        pmax = parameters.pmax.fillna(np.inf).to_numpy(dtype=float)
 
         if n is None:
             # only use parameters that are varied.
             n = int(10 ** parameters.vary.sum())
 
-        samples = np.zeros((0, p.size))
-
-        # Start truncated multivariate sampling
-        it = 0
-        while samples.shape[0] < n:
-            s = np.random.multivariate_normal(p, pcov, size=(n,), check_valid="ignore")
-            accept = s[
-                (np.min(s - pmin, axis=1) >= 0) & (np.max(s - pmax, axis=1) <= 0)
-            ]
-            samples = np.concatenate((samples, accept), axis=0)
-
-            # Make sure there's no endless while loop
-            if it > max_iter:
-                break
-            else:
-                it += 1
+        rng = _get_rng(rng)
 
-        if samples.shape[0] < n:
-            logger.warning(
-                "Parameter sample size is smaller than n: %s/%s Increase 'max_iter'.",
-                samples.shape[0],
-                n,
-            )
-        return samples[:n, :]
+        # only the parameters with a variance are sampled, the others are fixed
+        free = np.diag(pcov) > 0
+        samples = np.tile(np.asarray(p, dtype=float), (n, 1))
+        samples[:, free] = _sample_truncated_normal(
+            mean=p[free],
+            cov=pcov[np.ix_(free, free)],
+            lower=pmin[free],
+            upper=pmax[free],
+            n=n,
+            max_iter=max_iter,
+            rng=rng,
+        )
+        return samples
 
     def _get_realizations(
         self,
@@ -363,13 +707,16 @@ class BaseSolver:
         n: Optional[int] = None,
         name: Optional[str] = None,
         max_iter: int = 10,
+        rng: Optional[Union[np.random.Generator, int]] = None,
         **kwargs,
     ) -> DataFrame:
         """Internal method to obtain n number of parameter realizations."""
         if name:
             kwargs["name"] = name
 
-        parameter_sample = self.get_parameter_sample(n=n, name=name, max_iter=max_iter)
+        parameter_sample = self.get_parameter_sample(
+            n=n, name=name, max_iter=max_iter, rng=rng
+        )
         data = {}
 
         for i, p in enumerate(parameter_sample):
@@ -377,6 +724,164 @@ class BaseSolver:
 
         return DataFrame.from_dict(data, orient="columns", dtype=float)
 
+    def _get_simulation_interval(
+        self,
+        n: Optional[int] = None,
+        alpha: float = 0.05,
+        name: Optional[str] = None,
+        max_iter: int = 10,
+        n_jobs: Optional[int] = None,
+        method: str = "exact",
+        chunk_size: Optional[int] = None,
+        sigma: Optional[float] = None,
+        rng: Optional[Union[np.random.Generator, int]] = None,
+        **kwargs,
+    ) -> DataFrame:
+        """Internal method to compute the interval of the simulation or the
+        contribution of a stressmodel from n parameter realizations.
+
+        Parameters
+        ----------
+        sigma: float, optional
+            Standard deviation of the normally distributed residuals that are added
+            to the realizations (e.g., for the prediction interval).
+
+        Notes
+        -----
+        With method="exact", all realizations are stored and the quantiles are
+        computed exactly. With method="streaming", the realizations are simulated
+        in chunks of chunk_size realizations and the quantiles are estimated with
+        the P² algorithm (see `pastas.stats.quantiles.P2Quantiles`), so the memory
+        use does not depend on the number of realizations.
+        """
+        if method not in ["exact", "streaming"]:
+            msg = "Method %s is not supported. Choose 'exact' or 'streaming'."
+            logger.error(msg, method)
+            raise ValueError(msg % method)
+        if chunk_size is None and method == "streaming":
+            chunk_size = _STREAMING_CHUNK_SIZE
+        rng = _get_rng(rng)
+
+        q = [alpha / 2, 1 - alpha / 2]
+        chunks = self._iter_simulation_realizations(
+            n=n,
+            name=name,
+            max_iter=max_iter,
+            n_jobs=n_jobs,
+            chunk_size=chunk_size,
+            rng=rng,
+            **kwargs,
+        )
+
+        if method == "exact":
+            data = []
+            for chunk, index in chunks:
+                data.append(chunk)
+            data = np.concatenate(data, axis=1)
+            if sigma is not None:
+                data = data + sigma * rng.standard_normal(data.shape)
+            quantiles = np.nanquantile(data, q, axis=1)
+        else:
+            estimator = None
+            for data, index in chunks:
+                if sigma is not None:
+                    data = data + sigma * rng.standard_normal(data.shape)
+                if estimator is None:
+                    estimator = P2Quantiles(q=q, size=data.shape[0])
+                estimator.update(data)
+            quantiles = estimator.quantiles()
+
+        return DataFrame(quantiles.transpose(), index=index, columns=q)
+
+    def _iter_simulation_realizations(
+        self,
+        n: Optional[int] = None,
+        name: Optional[str] = None,
+        max_iter: int = 10,
+        n_jobs: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+        rng: Optional[Union[np.random.Generator, int]] = None,
+        **kwargs,
+    ) -> Iterator[Tuple[ArrayLike, Index]]:
+        """Internal method to simulate the model or the contribution of a
+        stressmodel for n parameter realizations, in chunks of chunk_size
+        realizations.
+
+        Yields
+        ------
+        data: numpy.ndarray
+            Array with shape (nsim, chunk_size) with a realization in each column.
+        index: pandas.Index
+            The index of the simulation.
+
+        Notes
+        -----
+        If no keyword arguments are provided, all realizations in a chunk are
+        simulated at once (see `Model._simulate_batch`). Otherwise, or if the model
+        cannot be simulated with NumPy arrays, the realizations are simulated one by
+        one.
+        """
+        parameter_sample = self.get_parameter_sample(
+            n=n, name=name, max_iter=max_iter, rng=rng
+        )
+        if chunk_size is None:
+            chunk_size = parameter_sample.shape[0]
+
+        if name is None:
+            func = self.ml.simulate
+        else:
+            func = partial(self.ml.get_contribution, name)
+
+        for start in range(0, parameter_sample.shape[0], max(chunk_size, 1)):
+            sample = parameter_sample[start : start + chunk_size]
+            if not kwargs:
+                data = self.ml._simulate_batch(sample, name=name, n_jobs=n_jobs)
+                if data is not None:
+                    yield data, self.ml._simulation_alignment["index"]
+                    continue
+
+            data = None
+            for i, p in enumerate(sample):
+                sim = func(p=p, **kwargs)
+                if data is None:
+                    data = np.empty((sim.size, sample.shape[0]))
+                    index = sim.index
+                data[:, i] = sim.values
+            yield data, index
+
+    def _get_response_realizations(
+        self,
+        block_or_step: str,
+        name: str,
+        n: Optional[int] = None,
+        max_iter: int = 10,
+        dt: Optional[ArrayLike] = None,
+        rng: Optional[Union[np.random.Generator, int]] = None,
+        **kwargs,
+    ) -> DataFrame:
+        """Internal method to obtain the block or step responses for n parameter
+        realizations.
+
+        The responses for all parameter realizations are computed at once with the
+        step_batch or block_batch method of the response function.
+        """
+        rfunc = self.ml.stressmodels[name].rfunc
+        if rfunc is None or not set(kwargs).issubset(["cutoff", "maxtmax"]):
+            func = getattr(self.ml, f"get_{block_or_step}_response")
+            return self._get_realizations(
+                func=func, n=n, name=name, max_iter=max_iter, dt=dt, rng=rng, **kwargs
+            )
+
+        parameter_sample = self.get_parameter_sample(
+            n=n, name=name, max_iter=max_iter, rng=rng
+        )
+        func = getattr(rfunc, f"{block_or_step}_batch")
+        data = func(parameter_sample[:, : rfunc.nparam], dt=dt, **kwargs)
+
+        data = DataFrame(data, index=dt, dtype=float)
+        data.index.name = "Time [days]"
+        return data
+
     def _get_confidence_interval(
         self,
         func: Function,
@@ -442,6 +947,22 @@ class BaseSolver:
         pcor = DataFrame(data=corr, index=index, columns=index)
         return pcor
 
+    def _get_warm_start_kwargs(self) -> dict:
+        """Internal method to get the keyword arguments for the solve method to
+        start from the results of an earlier optimization.
+
+        Returns
+        -------
+        kwargs: dict
+            Dictionary with keyword arguments, empty for this solver.
+
+        Notes
+        -----
+        This method is called by `Model.solve` if warm_start is True. The keyword
+        arguments provided by the user take precedence.
+        """
+        return {}
+
     def to_dict(self) -> dict:
         data = {
             "class": self._name,
@@ -461,10 +982,16 @@ class LeastSquares(BaseSolver):
     method. All kwargs provided to the Model.solve() method are forwarded to the
     solver. From there, they are forwarded to Scipy least_squares solver.
 
+    By default, the Jacobian is estimated by least_squares with finite differences,
+    which requires a simulation of the model for each parameter. With
+    jac="analytic", the Jacobian is computed from the derivatives of the block
+    responses (see the misfit_jacobian method), which is usually faster.
+
     Examples
     --------
 
     >>> ml.solve(solver=ps.LeastSquares())
+    >>> ml.solve(solver=ps.LeastSquares(), jac="analytic")
 
     References
     ----------
@@ -498,6 +1025,11 @@ class LeastSquares(BaseSolver):
             np.where(parameters.pmax.isnull(), np.inf, parameters.pmax),
         )
 
+        if kwargs.get("jac") == "analytic":
+            kwargs["jac"] = self.jacobian
+        if isinstance(kwargs.get("x_scale"), Series):
+            kwargs["x_scale"] = self._get_x_scale(kwargs["x_scale"], parameters.index)
+
         self.result = least_squares(
             self.objfunction,
             bounds=bounds,
@@ -531,6 +1063,46 @@ class LeastSquares(BaseSolver):
         par[self.vary] = p
         return self.misfit(p=par, noise=noise, weights=weights, callback=callback)
 
+    def _get_warm_start_kwargs(self) -> dict:
+        """Internal method to get the keyword arguments for the solve method to
+        start from the results of an earlier optimization.
+
+        Returns
+        -------
+        kwargs: dict
+            Dictionary with the standard errors of the parameters from the
+            covariance matrix of the earlier optimization as x_scale, so the
+            trust region of least_squares is scaled with the uncertainty of each
+            parameter. Empty if no covariance matrix is available.
+        """
+        if self.pcov is None:
+            return {}
+        return {"x_scale": Series(np.sqrt(np.diag(self.pcov)), index=self.pcov.index)}
+
+    @staticmethod
+    def _get_x_scale(x_scale: Series, names: Index) -> ArrayLike:
+        """Internal method to get the x_scale argument of least_squares for the
+        parameters in names from a Series with the scale of each parameter.
+
+        Parameters without a positive and finite scale get a scale of 1.0, the
+        default of least_squares.
+        """
+        scale = x_scale.reindex(names).values.astype(float)
+        return np.where(np.isfinite(scale) & (scale > 0.0), scale, 1.0)
+
+    def jacobian(
+        self, p: ArrayLike, noise: bool, weights: Series, callback: CallBack
+    ) -> ArrayLike:
+        """Method to compute the Jacobian of the objective function.
+
+        This method is passed to least_squares when the solve method is called with
+        jac="analytic". See the misfit_jacobian method for more information.
+        """
+        par = self.initial.copy()
+        par[self.vary] = p
+        jac = self.misfit_jacobian(p=par, noise=noise, weights=weights, vary=self.vary)
+        return jac[:, self.vary]
+
     def _get_covariances(
         self, jacobian: ArrayLike, cost: float, absolute_sigma: bool = False
     ) -> ArrayLike:
@@ -582,6 +1154,169 @@ class LeastSquares(BaseSolver):
         return pcov
 
 
+class VarProLeastSquares(LeastSquares):
+    """Solver based on variable projection and Scipy's least_squares method.
+
+    Notes
+    -----
+    The simulation of a model is linear in some of the parameters, such as the
+    gains of the response functions and the constant. For given values of the
+    other (nonlinear) parameters, the optimal values of these linear parameters
+    are obtained with a (bounded) linear least squares problem. This solver uses
+    Scipy's least_squares method to optimize the nonlinear parameters only, and
+    solves the linear parameters in each evaluation of the objective function
+    (variable projection, Golub and Pereyra, 2003). The number of parameters that
+    is optimized iteratively is smaller and the problem is usually better
+    conditioned, so fewer iterations are needed.
+
+    The misfit is linear in the residuals for fixed parameters of the noise model,
+    so the linear parameters can also be solved when a noise model is used. The
+    covariances of all parameters are computed from the Jacobian of the misfit at
+    the optimum (see the misfit_jacobian method). If the linear parameters cannot
+    be determined (e.g., when a transform is used), the model is solved with the
+    LeastSquares solver.
+
+    Examples
+    --------
+
+    >>> ml.solve(solver=ps.VarProLeastSquares())
+
+    References
+    ----------
+    Golub, G. and Pereyra, V. (2003). Separable nonlinear least squares: the
+    variable projection method and its applications. Inverse Problems, 19(2).
+    """
+
+    _name = "VarProLeastSquares"
+
+    def __init__(
+        self,
+        pcov: Optional[DataFrame] = None,
+        nfev: Optional[int] = None,
+        **kwargs,
+    ) -> None:
+        LeastSquares.__init__(self, pcov=pcov, nfev=nfev, **kwargs)
+
+    def solve(
+        self,
+        noise: bool = True,
+        weights: Optional[Series] = None,
+        callback: Optional[CallBack] = None,
+        **kwargs,
+    ) -> Tuple[bool, ArrayLike, ArrayLike]:
+        self.vary = self.ml.parameters.vary.values.astype(bool)
+        self.initial = self.ml.parameters.initial.values.copy()
+        parameters = self.ml.parameters
+
+        self.linear = self.vary & self.ml._get_linear_parameters()
+        self.nonlinear = self.vary & ~self.linear
+        if not self.linear.any() or self.ml._simulate_linear_basis(
+            self.initial, np.flatnonzero(self.linear)
+        ) is None:
+            logger.warning(
+                "The linear parameters cannot be determined, the model is solved "
+                "with the LeastSquares solver."
+            )
+            return LeastSquares.solve(
+                self, noise=noise, weights=weights, callback=callback, **kwargs
+            )
+
+        if kwargs.pop("jac", None) == "analytic":
+            logger.info("jac='analytic' is not supported and is ignored.")
+
+        pmin = parameters.pmin.fillna(-np.inf).values
+        pmax = parameters.pmax.fillna(np.inf).values
+        self.linear_bounds = (pmin[self.linear], pmax[self.linear])
+        if isinstance(kwargs.get("x_scale"), Series):
+            names = parameters.index[self.nonlinear]
+            kwargs["x_scale"] = self._get_x_scale(kwargs["x_scale"], names)
+
+        if self.nonlinear.any():
+            self.result = least_squares(
+                self.objfunction,
+                bounds=(pmin[self.nonlinear], pmax[self.nonlinear]),
+                x0=self.initial[self.nonlinear],
+                args=(noise, weights, callback),
+                **kwargs,
+            )
+            p = self.result.x
+            success = self.result.success
+            self.nfev = self.result.nfev
+        else:
+            p = np.array([], dtype=float)
+            success = True
+            self.nfev = 1
+
+        optimal = self.initial.copy()
+        optimal[self.nonlinear] = p
+        optimal[self.linear] = self._solve_linear(optimal, noise, weights)[0]
+
+        # Compute the covariances of all parameters at the optimum
+        rv = self.misfit(optimal, noise=noise, weights=weights)
+        jac = self.misfit_jacobian(optimal, noise=noise, weights=weights)
+        names = parameters.index[self.vary]
+        self.obj_func = 0.5 * np.sum(rv**2)
+        self.pcov = DataFrame(
+            self._get_covariances(jac[:, self.vary], self.obj_func),
+            index=names,
+            columns=names,
+        )
+        self.pcor = self._get_correlations(self.pcov)
+
+        stderr = np.zeros(len(optimal)) * np.nan
+        stderr[self.vary] = np.sqrt(np.diag(self.pcov))
+
+        return success, optimal, stderr
+
+    def objfunction(
+        self, p: ArrayLike, noise: bool, weights: Series, callback: CallBack
+    ) -> ArrayLike:
+        par = self.initial.copy()
+        par[self.nonlinear] = p
+        par[self.linear], rv = self._solve_linear(par, noise, weights)
+        if callback:
+            callback(par)
+        return rv
+
+    def _solve_linear(
+        self, p: ArrayLike, noise: bool, weights: Optional[Series]
+    ) -> Tuple[ArrayLike, ArrayLike]:
+        """Internal method to solve the linear parameters for given values of the
+        nonlinear parameters.
+
+        Returns
+        -------
+        p_linear: array_like
+            The optimal values of the linear parameters.
+        rv: array_like
+            The misfit for the optimal values of the linear parameters.
+        """
+        columns = np.flatnonzero(self.linear)
+        p0 = p.copy()
+        p0[columns] = 0.0
+        rv0 = self.misfit(p0, noise=noise, weights=weights)
+        basis = self.ml._simulate_linear_basis(p, columns)
+
+        index = self.ml.oseries_calib.index
+        if basis is None or rv0.size != index.size:
+            msg = (
+                "The linear parameters cannot be determined, as the model cannot be "
+                "simulated using NumPy arrays or NaN-values are present in the "
+                "residuals."
+            )
+            logger.error(msg)
+            raise ValueError(msg)
+
+        # misfit = rv0 - a @ p_linear, as the residuals are h_obs - h_sim
+        residuals_to_misfit = self._get_residuals_to_misfit(p, noise, weights, index)
+        a = np.empty((rv0.size, columns.size))
+        for i in range(columns.size):
+            a[:, i] = residuals_to_misfit(self.ml._get_observation_values(basis[:, i]))
+
+        result = lsq_linear(a, rv0, bounds=self.linear_bounds, method="bvls")
+        return result.x, rv0 - a @ result.x
+
+
 class LmfitSolve(BaseSolver):
     """Solving the model using the LmFit :cite:p:`newville_lmfitlmfit-py_2019`.
 
@@ -688,9 +1423,31 @@ class EmceeSolve(BaseSolver):
         the MCMC approach. One of the Moves classes from Emcee has to be provided.
         See Emcee documentation for more information.
     parallel: bool, optional
-        Run the sampler in parallel or not.
+        Run the sampler in parallel or not. The solver and the model are sent to
+        each worker process once in each call of solve.
+    processes: int, optional
+        Number of worker processes used if parallel is True. Default is None, which
+        uses the number of cores of the machine.
+    persistent_pool: bool, optional
+        Keep the worker processes after solving if parallel is True, so they are
+        reused when the model is solved again (e.g., to resume sampling). The
+        worker processes are stopped when the solver is deleted or `close_pool` is
+        called. Default is False, in which case the worker processes are stopped
+        at the end of each call of solve.
+    vectorize: bool, optional
+        Compute the log-probability of all walkers at once, by simulating the model
+        for the parameters of all walkers in a single call. Default is False. If
+        parallel is True, the walkers are divided over the worker processes.
     progress_bar: bool, optional
         Show the progress bar or not. Requires the `tqdm` package to be installed.
+    checkpoint: str, optional
+        Path of an HDF5 file to store the MCMC chains in while sampling, using the
+        `emcee.backends.HDFBackend`. Requires the `h5py` package to be installed.
+        Only used if no backend is provided. The path is stored with the `to_dict`
+        method, so the chains are available again after the model is loaded.
+    parameters: pandas.DataFrame, optional
+        DataFrame with the parameters of the objective function, used when the
+        solver is loaded from a dictionary (see `to_dict`).
     **kwargs, optional
         All other keyword arguments are passed on to the BaseSolver class.
 
@@ -713,6 +1470,19 @@ class EmceeSolve(BaseSolver):
 
     >>> ml.solve(solver=ps.EmceeSolve(), thin_by=2)
 
+    With `vectorize=True`, the block responses and simulations of all walkers are
+    computed at once, which is usually much faster than evaluating the walkers one
+    by one:
+
+    >>> ml.solve(solver=ps.EmceeSolve(vectorize=True, parallel=True, processes=4))
+
+    With a checkpoint file, the chains are written to disk while sampling. A run
+    that was interrupted, or that needs more steps, is continued from the last
+    sample with `resume=True`, where `steps` is the number of additional steps:
+
+    >>> ml.solve(solver=ps.EmceeSolve(checkpoint="chains.h5"), steps=5000)
+    >>> ml.solve(steps=5000, resume=True)
+
     Examples
     --------
 
@@ -722,6 +1492,11 @@ class EmceeSolve(BaseSolver):
 
     >>> ml.solver.sampler.get_chain(flat=True, discard=3000)
 
+    To summarize the posterior distribution of the parameters without loading all
+    chains into memory at once, use:
+
+    >>> ml.solver.get_posterior_summary(discard=3000, thin=10)
+
     References
     ----------
     https://emcee.readthedocs.io/en/stable/
@@ -745,6 +1520,11 @@ class EmceeSolve(BaseSolver):
         moves=None,
         parallel: bool = False,
         progress_bar: bool = True,
+        processes: Optional[int] = None,
+        persistent_pool: bool = False,
+        vectorize: bool = False,
+        checkpoint: Optional[str] = None,
+        parameters: Optional[DataFrame] = None,
         **kwargs,
     ) -> None:
         # Check if emcee is installed, if not, return error
@@ -755,26 +1535,77 @@ class EmceeSolve(BaseSolver):
             msg = "emcee not installed. Please install emcee first."
             raise ImportError(msg) from None
 
-        BaseSolver.__init__(self, pcov=None, nfev=None, **kwargs)
+        BaseSolver.__init__(self, **kwargs)
 
         # Set Attributes
-        self.obj_func = np.nan
-        self.nfev = np.nan
+        if self.obj_func is None:
+            self.obj_func = np.nan
+        if self.nfev is None:
+            self.nfev = np.nan
+
+        # Store the chains in an HDF5 file
+        self.checkpoint = checkpoint
+        if checkpoint is not None and backend is None:
+            backend = emcee.backends.HDFBackend(checkpoint)
 
         # Set sampler properties
         self.sampler = None
         self.parallel = parallel
+        self.processes = processes
+        self.persistent_pool = persistent_pool
+        self.vectorize = vectorize
         self.backend = backend
         self.moves = moves
         self.progress_bar = progress_bar
         self.nwalkers = nwalkers
         self.priors = None
+        self._pool = None
+        self._pool_processes = None
+        self._pool_finalizer = None
 
         # Set objective function
         if objective_function is None:
             objective_function = GaussianLikelihood()
+        elif isinstance(objective_function, str):
+            objective_function = getattr(objective_functions, objective_function)()
         self.objective_function = objective_function
-        self.parameters = self.objective_function.get_init_parameters("ln")
+        if parameters is None:
+            parameters = self.objective_function.get_init_parameters("ln")
+        self.parameters = parameters
+
+    def __getstate__(self) -> dict:
+        # the pool of worker processes cannot be pickled
+        state = self.__dict__.copy()
+        state["_pool"] = None
+        state["_pool_processes"] = None
+        state["_pool_finalizer"] = None
+        return state
+
+    def _get_pool(self, processes: int):
+        """Internal method to get the pool of worker processes, which is kept
+        between calls of solve if persistent_pool is True."""
+        if self._pool is None or self._pool_processes != processes:
+            from multiprocessing import Barrier, Pool
+
+            self.close_pool()
+            barrier = Barrier(processes)
+            self._pool = Pool(processes, _init_emcee_worker, (barrier,))
+            self._pool_processes = processes
+            if self._pool_finalizer is None:
+                # stop the worker processes when the solver is deleted
+                self._pool_finalizer = finalize(self, _close_emcee_pool, self.__dict__)
+        return self._pool
+
+    def close_pool(self) -> None:
+        """Method to stop the worker processes used if parallel is True.
+
+        Notes
+        -----
+        With persistent_pool=True, the worker processes are kept after solving, so
+        they are reused when the model is solved again (e.g., to resume sampling).
+        They are stopped when the solver is deleted, or with this method.
+        """
+        _close_emcee_pool(self.__dict__)
 
     def solve(
         self,
@@ -782,8 +1613,38 @@ class EmceeSolve(BaseSolver):
         weights: Optional[Series] = None,
         steps: int = 5000,
         callback: Optional[CallBack] = None,
+        resume: bool = False,
         **kwargs,
     ) -> Tuple[bool, ArrayLike, ArrayLike]:
+        """Method to sample the posterior distribution of the parameters.
+
+        Parameters
+        ----------
+        noise: bool, optional
+            If True, the noise model is applied to the residuals.
+        weights: pandas.Series, optional
+            Series with weights for the residuals.
+        steps: int, optional
+            The number of steps of the MCMC chains. If resume is True, the number of
+            steps added to the existing chains.
+        callback: callable, optional
+            Callback function that will be called after each iteration of the solver.
+        resume: bool, optional
+            Continue the chains from the last sample of the previous run, stored in
+            the backend or the checkpoint file. Default is False, in which case new
+            chains are started. If a backend provided by the user already contains
+            chains, the new chains are appended to these chains. A ValueError is
+            raised if the checkpoint file already contains chains, so these are
+            not overwritten.
+        **kwargs, optional
+            All other keyword arguments are passed on to `run_mcmc`.
+
+        Returns
+        -------
+        success: bool
+        optimal: numpy.Array
+        stderr: numpy.Array
+        """
         # Store initial parameters
         self.initial = np.append(
             self.ml.parameters.initial.values, self.parameters.initial.values
@@ -814,34 +1675,85 @@ class EmceeSolve(BaseSolver):
         ndim = pinit.size
         pinit = pinit + 1e-2 * np.random.randn(self.nwalkers, ndim)
 
+        # Continue from the last sample of the previous run or start new chains
+        backend = self.backend
+        if backend is None and resume and self.sampler is not None:
+            backend = self.sampler.backend
+        if backend is not None and backend.initialized and backend.iteration > 0:
+            if resume:
+                pinit = backend.get_last_sample()
+            elif self.checkpoint is not None and (
+                getattr(backend, "filename", None) == self.checkpoint
+            ):
+                msg = (
+                    "The checkpoint file %s already contains %s iterations of MCMC "
+                    "chains. Use resume=True to continue these chains, or remove the "
+                    "checkpoint file to start new chains."
+                )
+                logger.error(msg, self.checkpoint, backend.iteration)
+                raise ValueError(msg % (self.checkpoint, backend.iteration))
+            else:
+                logger.warning(
+                    "The backend already contains %s iterations of MCMC chains, the "
+                    "new chains are appended. Use resume=True to continue the chains "
+                    "from the last sample.",
+                    backend.iteration,
+                )
+        elif backend is not None:
+            backend.reset(self.nwalkers, ndim)
+        elif resume:
+            logger.warning(
+                "There are no chains to resume from, new chains are started."
+            )
+
         # Create sampler and run mcmc
         if self.parallel:
             logger.info("Going into the parallel universe")
 
-            from multiprocessing import Pool
-
-            with Pool() as pool:
+            self.sampler = None
+            processes = cpu_count() if self.processes is None else self.processes
+            pool = self._get_pool(processes)
+            try:
+                # The solver (and the model) is sent to each worker once, instead of
+                # with every evaluation of the log-probability
+                solver = copy(self)
+                solver.backend = None  # the chains are not needed in the workers
+                state = dumps((solver, noise, weights, callback))
+                pool.map(_set_emcee_worker, [state] * processes, chunksize=1)
+
+                if self.vectorize:
+                    log_prob_fn = partial(_map_log_probability_batch, solver=self)
+                else:
+                    log_prob_fn = _emcee_log_probability
                 self.sampler = emcee.EnsembleSampler(
                     nwalkers=self.nwalkers,
                     ndim=ndim,
-                    log_prob_fn=self.log_probability,
+                    log_prob_fn=log_prob_fn,
                     moves=self.moves,
-                    backend=self.backend,
-                    pool=pool,
-                    args=(noise, weights, callback),
+                    backend=backend,
+                    pool=None if self.vectorize else pool,
+                    vectorize=self.vectorize,
                 )
 
                 self.sampler.run_mcmc(
                     pinit, steps, progress=self.progress_bar, **kwargs
                 )
+            finally:
+                if not self.persistent_pool:
+                    self.close_pool()
         else:
+            if self.vectorize:
+                log_prob_fn = self.log_probability_batch
+            else:
+                log_prob_fn = self.log_probability
             self.sampler = emcee.EnsembleSampler(
                 nwalkers=self.nwalkers,
                 ndim=ndim,
-                log_prob_fn=self.log_probability,
+                log_prob_fn=log_prob_fn,
                 moves=self.moves,
-                backend=self.backend,
+                backend=backend,
                 pool=None,
+                vectorize=self.vectorize,
                 args=(noise, weights, callback),
             )
 
@@ -943,6 +1855,98 @@ class EmceeSolve(BaseSolver):
 
         return lnlike
 
+    def log_probability_batch(
+        self,
+        P: ArrayLike,
+        noise: Optional[bool] = False,
+        weights: Optional[Series] = None,
+        callback: Optional[CallBack] = None,
+    ) -> ArrayLike:
+        """Full log-probability of multiple parameter sets, called by Emcee if
+        vectorize is True.
+
+        Parameters
+        ----------
+        P: numpy.Array
+            Numpy array with the parameters of a walker in each row.
+        noise: bool, optional
+            If True, the noise model is applied to the residuals.
+        weights: pandas.Series, optional
+            Series with weights for the residuals.
+        callback: callable, optional
+            Callback function that will be called after each iteration of the solver.
+
+        Returns
+        -------
+        log_probability: numpy.Array
+            Numpy array with the log-probability of each parameter set.
+        """
+        P = np.atleast_2d(P)
+
+        # Check if parameters are within the boundaries, like the log_prior method
+        outside = (P < self.bounds[:, 0]) | (P > self.bounds[:, 1])
+        inside = ~np.any(outside, axis=1)
+        lp = np.full(P.shape[0], -np.inf)
+        if inside.any():
+            lp[inside] = 0.0
+            for j, prior in enumerate(self.priors):
+                lp[inside] += prior.logpdf(P[inside, j])
+
+        # Only compute the likelihood for the parameters within the boundaries
+        inside = np.isfinite(lp)
+        if inside.any():
+            lp[inside] += self.log_likelihood_batch(
+                P[inside], noise=noise, weights=weights, callback=callback
+            )
+        return lp
+
+    def log_likelihood_batch(
+        self,
+        P: ArrayLike,
+        noise: bool,
+        weights: Optional[Series] = None,
+        callback: Optional[CallBack] = None,
+    ) -> ArrayLike:
+        """Log-likelihood function for multiple parameter sets.
+
+        Parameters
+        ----------
+        P: numpy.Array
+            Numpy array with the parameters of a walker in each row.
+        noise: bool
+        weights
+        callback
+
+        Returns
+        -------
+        lnlike: numpy.Array
+            Numpy array with the log-likelihood for each parameter set.
+
+        Notes
+        -----
+        The model is simulated for all parameter sets at once (see
+        `BaseSolver._misfit_batch`). If that is not possible, the log-likelihood
+        of each parameter set is computed with the log_likelihood method.
+        """
+        nobj = self.objective_function.nparam
+        par = np.tile(self.initial, (P.shape[0], 1))
+        par[:, self.vary] = P
+
+        rv = self._misfit_batch(
+            par[:, :-nobj], noise=noise, weights=weights, callback=callback
+        )
+        if rv is None:
+            return np.array(
+                [self.log_likelihood(p, noise, weights, callback) for p in P]
+            )
+
+        return np.array(
+            [
+                self.objective_function.compute(rv[:, i], par[i, -nobj:])
+                for i in range(P.shape[0])
+            ]
+        )
+
     def log_prior(self, p: ArrayLike) -> float:
         """Probability of parameter set given the priors.
 
@@ -1093,13 +2097,501 @@ class EmceeSolve(BaseSolver):
         if dist is not None:
             self.parameters.loc[name, "dist"] = str(dist)
 
+    def get_posterior_summary(
+        self,
+        discard: int = 0,
+        thin: int = 1,
+        q: Tuple[float] = (0.025, 0.5, 0.975),
+        chunk_size: int = 1000,
+    ) -> DataFrame:
+        """Method to summarize the posterior distribution of the parameters.
+
+        Parameters
+        ----------
+        discard: int, optional
+            The number of steps to discard at the start of the chains (burn-in).
+        thin: int, optional
+            Only use every thin steps of the chains.
+        q: tuple of float, optional
+            The quantiles of the parameters to compute, between 0 and 1.
+        chunk_size: int, optional
+            The number of steps of the chains that are read at once.
+
+        Returns
+        -------
+        summary: pandas.DataFrame
+            DataFrame with the parameters that are varied as index and the mean,
+            the standard deviation and the quantiles of the samples as columns.
+
+        Notes
+        -----
+        The chains are read from the backend in chunks of steps, so the chains do
+        not have to fit in memory at once (e.g., with a checkpoint file). The
+        quantiles are estimated with the P² algorithm (see
+        `pastas.stats.P2Quantiles`), the mean and standard deviation are exact.
+        """
+        if self.sampler is not None:
+            backend = self.sampler.backend
+        else:
+            backend = self.backend
+        if backend is None or not backend.initialized:
+            msg = "There are no MCMC chains to summarize, solve the model first."
+            logger.error(msg)
+            raise ValueError(msg)
+
+        names = np.append(
+            self.ml.parameters.index[self.ml.parameters.vary],
+            self.parameters.index[self.parameters.vary],
+        )
+        estimator = P2Quantiles(q=q, size=names.size)
+        count = 0
+        mean = np.zeros(names.size)
+        m2 = np.zeros(names.size)
+
+        for chain in _iter_chain(backend, discard, thin, chunk_size):
+            samples = chain.reshape(-1, names.size)
+            if samples.shape[0] == 0:
+                continue
+            estimator.update(samples.T)
+            # combine the mean and sum of squared deviations of the chunk
+            n = samples.shape[0]
+            chunk_mean = samples.mean(axis=0)
+            delta = chunk_mean - mean
+            m2 += ((samples - chunk_mean) ** 2).sum(axis=0)
+            m2 += delta**2 * count * n / (count + n)
+            mean += delta * n / (count + n)
+            count += n
+
+        if count == 0:
+            mean[:] = np.nan
+        summary = DataFrame({"mean": mean}, index=names)
+        summary["std"] = np.sqrt(m2 / (count - 1)) if count > 1 else np.nan
+        for quantile, values in zip(q, estimator.quantiles()):
+            summary[quantile] = values
+        return summary
+
     def to_dict(self) -> dict:
-        """This method is not supported for this solver.
+        """Method to store the solver settings in a dictionary.
 
-        Raises
-        ------
-        NotImplementedError
+        Returns
+        -------
+        data: dict
+            Dictionary with the settings of the solver.
 
+        Notes
+        -----
+        The MCMC chains are not stored in the dictionary. Use the checkpoint
+        argument to store the chains in a file, the path of which is stored. A
+        backend and moves provided by the user are not stored.
         """
-        msg = "The EmceeSolve class does not support to_dict() and cannot be saved."
-        raise NotImplementedError(msg)
+        if self.moves is not None or (
+            self.backend is not None and self.checkpoint is None
+        ):
+            logger.warning(
+                "The moves and backend of the EmceeSolve solver are not stored, "
+                "use the checkpoint argument to store the chains."
+            )
+        data = BaseSolver.to_dict(self)
+        data.update(
+            {
+                "objective_function": self.objective_function._name,
+                "parameters": self.parameters.copy(),
+                "nwalkers": self.nwalkers,
+                "parallel": self.parallel,
+                "processes": self.processes,
+                "persistent_pool": self.persistent_pool,
+                "vectorize": self.vectorize,
+                "progress_bar": self.progress_bar,
+                "checkpoint": self.checkpoint,
+            }
+        )
+        return data
+
+
+def _iter_chain(
+    backend, discard: int = 0, thin: int = 1, chunk_size: int = 1000
+) -> Iterator[ArrayLike]:
+    """Internal method to read the MCMC chains from an emcee backend in chunks of
+    steps, selecting the same steps as `backend.get_chain(discard, thin)`."""
+    step = chunk_size * thin
+    if isinstance(backend, emcee.backends.HDFBackend):
+        with backend.open() as f:
+            group = f[backend.name]
+            iteration = group.attrs["iteration"]
+            for start in range(discard + thin - 1, iteration, step):
+                stop = min(start + step, iteration)
+                yield group["chain"][start:stop:thin]
+    else:
+        iteration = backend.iteration
+        for start in range(discard + thin - 1, iteration, step):
+            stop = min(start + step, iteration)
+            yield backend.chain[start:stop:thin]
+
+
+def _get_rng(rng: Optional[Union[np.random.Generator, int]] = None):
+    """Internal method to get the random number generator from a generator, a seed
+    or None, in which case the functions of numpy.random that use the global random
+    state are returned."""
+    if rng is None:
+        return np.random
+    elif rng is np.random or isinstance(rng, np.random.Generator):
+        return rng
+    return np.random.default_rng(rng)
+
+
+def _sample_truncated_normal(
+    mean: ArrayLike,
+    cov: ArrayLike,
+    lower: ArrayLike,
+    upper: ArrayLike,
+    n: int,
+    max_iter: int = 10,
+    rng: Optional[np.random.Generator] = None,
+) -> ArrayLike:
+    """Internal method to sample from a truncated multivariate normal distribution.
+
+    Parameters
+    ----------
+    mean: array_like
+        The mean of the distribution, within the bounds.
+    cov: array_like
+        The covariance matrix of the distribution.
+    lower, upper: array_like
+        The lower and upper bounds of the samples, may be infinite.
+    n: int
+        The number of samples.
+    max_iter: int, optional
+        The maximum number of batches drawn with rejection sampling.
+    rng: numpy.random.Generator, optional
+        The random number generator.
+
+    Returns
+    -------
+    samples: numpy.ndarray
+        Array with shape (n, nparam) with the samples.
+    """
+    rng = _get_rng(rng)
+    nparam = mean.size
+    if nparam == 0:
+        return np.empty((n, 0))
+
+    chol = _get_cholesky(cov)
+    samples = []
+    naccept = 0
+    ndraw = 0
+    size = n
+
+    for _ in range(max_iter):
+        z = rng.standard_normal((size, nparam))
+        s = mean + z @ chol.T
+        accept = s[np.all((s >= lower) & (s <= upper), axis=1)]
+        samples.append(accept)
+        naccept += accept.shape[0]
+        ndraw += size
+        if naccept >= n:
+            break
+        rate = naccept / ndraw
+        if rate < _MIN_ACCEPTANCE_RATE:
+            break
+        size = min(int(np.ceil(1.2 * (n - naccept) / rate)), _MAX_BATCH_SIZE)
+
+    if naccept < n:
+        logger.info(
+            "%s/%s parameter samples are drawn with rejection sampling, the "
+            "remaining samples are drawn with minimax tilting.",
+            naccept,
+            n,
+        )
+        nleft = n - naccept
+        samples.append(_tilted_truncated_normal(mean, cov, lower, upper, nleft, rng))
+
+    return np.concatenate(samples, axis=0)[:n]
+
+
+def _get_cholesky(cov: ArrayLike) -> ArrayLike:
+    """Internal method to get a matrix L with L @ L.T equal to the covariance matrix,
+    also for covariance matrices that are not positive definite."""
+    try:
+        return np.linalg.cholesky(cov)
+    except np.linalg.LinAlgError:
+        w, v = np.linalg.eigh(cov)
+        return v * np.sqrt(np.clip(w, 0.0, None))
+
+
+def _tilted_truncated_normal(
+    mean: ArrayLike,
+    cov: ArrayLike,
+    lower: ArrayLike,
+    upper: ArrayLike,
+    n: int,
+    rng: np.random.Generator,
+    max_iter: int = 100,
+) -> ArrayLike:
+    """Internal method to sample from a truncated multivariate normal distribution
+    with minimax tilting.
+
+    Notes
+    -----
+    This is the exact sampler of Botev (2017). The variables are reordered and a
+    Cholesky factorization of the covariance matrix is computed, so each variable
+    can be drawn sequentially from a univariate truncated normal distribution
+    given the previous ones. These proposals are shifted by a tilting parameter,
+    which is chosen to minimize the maximum of the likelihood ratio with the
+    truncated multivariate normal distribution, and are accepted with rejection
+    sampling. Unlike a Gibbs sampler, the samples are independent and drawn from
+    the exact distribution, also for strongly correlated parameters.
+
+    Botev, Z. I. (2017). The normal law under linear restrictions: simulation and
+    estimation via minimax tilting. Journal of the Royal Statistical Society:
+    Series B, 79(1), 125-148.
+    """
+    chol, lower, upper, perm = _get_permuted_cholesky(cov, lower - mean, upper - mean)
+    # scale the rows of the Cholesky factor to a unit diagonal, which is removed
+    diag = np.diag(chol)
+    lower = lower / diag
+    upper = upper / diag
+    L = chol / diag[:, np.newaxis] - np.eye(mean.size)
+
+    x, mu = _get_tilting_parameters(L, lower, upper)
+    psi = _tilting_psi(x, mu, L, lower, upper)
+
+    samples = []
+    naccept = 0
+    ndraw = 0
+    size = n
+    for _ in range(max_iter):
+        logp, z = _tilted_proposal(size, mu, L, lower, upper, rng)
+        accept = z[-np.log(rng.uniform(size=size)) > psi - logp]
+        samples.append(accept)
+        naccept += accept.shape[0]
+        ndraw += size
+        if naccept >= n:
+            break
+        rate = max(naccept, 1) / ndraw
+        size = min(int(np.ceil(1.2 * (n - naccept) / rate)), _MAX_BATCH_SIZE)
+    else:
+        msg = (
+            "The parameter samples could not be drawn from the truncated normal "
+            "distribution, as the acceptance rate is too low."
+        )
+        logger.error(msg)
+        raise ValueError(msg)
+
+    z = np.concatenate(samples, axis=0)[:n]
+    return mean + (z @ chol.T)[:, np.argsort(perm)]
+
+
+def _get_permuted_cholesky(
+    cov: ArrayLike, lower: ArrayLike, upper: ArrayLike
+) -> Tuple[ArrayLike, ArrayLike, ArrayLike, ArrayLike]:
+    """Internal method to get the Cholesky factor of the covariance matrix with the
+    variables reordered, so the variable with the smallest probability to be within
+    its bounds is drawn first (Genz's variable reordering)."""
+    d = lower.size
+    cov = cov.copy()
+    lower = lower.copy()
+    upper = upper.copy()
+    perm = np.arange(d)
+    L = np.zeros((d, d))
+    z = np.zeros(d)
+    eps = np.finfo(float).eps
+
+    for j in range(d):
+        s = np.sqrt(np.maximum(np.diag(cov)[j:] - np.sum(L[j:, :j] ** 2, 1), eps))
+        c = L[j:, :j] @ z[:j]
+        prob = _log_normal_probability((lower[j:] - c) / s, (upper[j:] - c) / s)
+        k = j + np.argmin(prob)
+
+        # swap variables j and k
+        jk, kj = [j, k], [k, j]
+        cov[jk, :] = cov[kj, :]
+        cov[:, jk] = cov[:, kj]
+        L[jk, :] = L[kj, :]
+        lower[jk] = lower[kj]
+        upper[jk] = upper[kj]
+        perm[jk] = perm[kj]
+
+        L[j, j] = np.sqrt(max(cov[j, j] - L[j, :j] @ L[j, :j], eps))
+        L[j + 1 :, j] = (cov[j + 1 :, j] - L[j + 1 :, :j] @ L[j, :j]) / L[j, j]
+
+        # the expected value of variable j within its bounds
+        c = L[j, :j] @ z[:j]
+        a = (lower[j] - c) / L[j, j]
+        b = (upper[j] - c) / L[j, j]
+        w = _log_normal_probability(a, b)
+        z[j] = (np.exp(-0.5 * a**2 - w) - np.exp(-0.5 * b**2 - w)) / np.sqrt(2 * np.pi)
+
+    return L, lower, upper, perm
+
+
+def _get_tilting_parameters(
+    L: ArrayLike, lower: ArrayLike, upper: ArrayLike
+) -> Tuple[ArrayLike, ArrayLike]:
+    """Internal method to find the tilting parameter mu and the point x of the
+    minimax problem, by solving for the point where the gradient of psi is zero."""
+    d = lower.size
+    x = np.zeros(d)
+    mu = np.zeros(d)
+    if d > 1:
+        solution = root(
+            _tilting_gradient,
+            np.zeros(2 * (d - 1)),
+            args=(L, lower, upper),
+            jac=True,
+            method="hybr",
+        )
+        if not solution.success:
+            logger.warning(
+                "The tilting parameters of the truncated normal distribution could "
+                "not be determined: %s The parameter samples may be inaccurate.",
+                solution.message,
+            )
+        x[:-1] = solution.x[: d - 1]
+        mu[:-1] = solution.x[d - 1 :]
+    return x, mu
+
+
+def _tilting_psi(
+    x: ArrayLike, mu: ArrayLike, L: ArrayLike, lower: ArrayLike, upper: ArrayLike
+) -> float:
+    """Internal method to compute the logarithm of the likelihood ratio psi of the
+    tilted proposal for the point x."""
+    c = L @ x
+    a = lower - mu - c
+    b = upper - mu - c
+    return np.sum(_log_normal_probability(a, b) + 0.5 * mu**2 - x * mu)
+
+
+def _tilting_gradient(
+    y: ArrayLike, L: ArrayLike, lower: ArrayLike, upper: ArrayLike
+) -> Tuple[ArrayLike, ArrayLike]:
+    """Internal method to compute the gradient of psi with respect to x and mu
+    (stacked in y, without the last variable) and its Jacobian."""
+    d = lower.size
+    x = np.zeros(d)
+    mu = np.zeros(d)
+    x[:-1] = y[: d - 1]
+    mu[:-1] = y[d - 1 :]
+
+    c = L @ x
+    a = lower - mu - c
+    b = upper - mu - c
+    w = _log_normal_probability(a, b)
+    pa = np.exp(-0.5 * a**2 - w) / np.sqrt(2 * np.pi)
+    pb = np.exp(-0.5 * b**2 - w) / np.sqrt(2 * np.pi)
+    P = pa - pb
+
+    dx = -mu[:-1] + (L.T @ P)[:-1]
+    dmu = mu - x + P
+    gradient = np.concatenate([dx, dmu[:-1]])
+
+    a[np.isinf(a)] = 0.0
+    b[np.isinf(b)] = 0.0
+    dP = -(P**2) + a * pa - b * pb
+    DL = dP[:, np.newaxis] * L
+    mx = (DL - np.eye(d))[:-1, :-1]
+    xx = (L.T @ DL)[:-1, :-1]
+    jacobian = np.block([[xx, mx.T], [mx, np.diag(1 + dP[:-1])]])
+    return gradient, jacobian
+
+
+def _tilted_proposal(
+    n: int,
+    mu: ArrayLike,
+    L: ArrayLike,
+    lower: ArrayLike,
+    upper: ArrayLike,
+    rng: np.random.Generator,
+) -> Tuple[ArrayLike, ArrayLike]:
+    """Internal method to draw n samples from the tilted proposal distribution,
+    with the logarithm of their likelihood ratio."""
+    d = lower.size
+    z = np.zeros((n, d))
+    logp = np.zeros(n)
+    for k in range(d):
+        c = z[:, :k] @ L[k, :k]
+        a = lower[k] - mu[k] - c
+        b = upper[k] - mu[k] - c
+        z[:, k] = mu[k] + _sample_truncated_standard_normal(a, b, rng)
+        logp += _log_normal_probability(a, b) + 0.5 * mu[k] ** 2 - mu[k] * z[:, k]
+    return logp, z
+
+
+def _log_normal_probability(a: ArrayLike, b: ArrayLike) -> ArrayLike:
+    """Internal method to compute log(Phi(b) - Phi(a)) of the standard normal
+    distribution accurately, also in the tails."""
+    a, b = np.broadcast_arrays(np.asarray(a, dtype=float), np.asarray(b, dtype=float))
+    p = np.empty(a.shape)
+
+    # both bounds in the upper tail: log(Phi(-a) - Phi(-b))
+    upper = a > 0
+    pa = log_ndtr(-a[upper])
+    p[upper] = pa + np.log1p(-np.exp(log_ndtr(-b[upper]) - pa))
+    # both bounds in the lower tail
+    lower = b < 0
+    pb = log_ndtr(b[lower])
+    p[lower] = pb + np.log1p(-np.exp(log_ndtr(a[lower]) - pb))
+    # the bounds on either side of zero
+    middle = ~(upper | lower)
+    p[middle] = np.log1p(-ndtr(a[middle]) - ndtr(-b[middle]))
+    return p
+
+
+def _sample_truncated_standard_normal(
+    a: ArrayLike, b: ArrayLike, rng: np.random.Generator
+) -> ArrayLike:
+    """Internal method to sample from the standard normal distribution truncated to
+    [a, b] with the inverse cumulative distribution function."""
+    # use the lower tail for accuracy, by flipping intervals in the upper tail
+    flip = a > 0
+    a, b = np.where(flip, -b, a), np.where(flip, -a, b)
+    cdf_a = ndtr(a)
+    cdf_b = ndtr(b)
+    u = cdf_a + rng.uniform(size=a.shape) * (cdf_b - cdf_a)
+    z = np.clip(ndtri(u), a, b)
+    return np.where(flip, -z, z)
+
+
+# Solver and arguments of the log-probability in the worker processes of EmceeSolve
+_emcee_worker = {}
+
+
+def _close_emcee_pool(state: dict) -> None:
+    """Internal method to stop the worker processes of EmceeSolve, given the
+    attributes of the solver."""
+    if state["_pool"] is not None:
+        state["_pool"].terminate()
+        state["_pool"] = None
+        state["_pool_processes"] = None
+
+
+def _init_emcee_worker(barrier) -> None:
+    """Internal method to initialize a worker process of EmceeSolve."""
+    _emcee_worker["barrier"] = barrier
+
+
+def _set_emcee_worker(state: bytes) -> None:
+    """Internal method to store the pickled solver and the arguments of the
+    log-probability in a worker process of EmceeSolve."""
+    solver, noise, weights, callback = loads(state)
+    _emcee_worker["solver"] = solver
+    _emcee_worker["args"] = (noise, weights, callback)
+    # wait for the other workers, so each worker gets exactly one of these tasks
+    _emcee_worker["barrier"].wait()
+
+
+def _emcee_log_probability(p: ArrayLike) -> float:
+    """Internal method to compute the log-probability in a worker process."""
+    return _emcee_worker["solver"].log_probability(p, *_emcee_worker["args"])
+
+
+def _emcee_log_probability_batch(P: ArrayLike) -> ArrayLike:
+    """Internal method to compute the log-probability of multiple parameter sets in
+    a worker process."""
+    return _emcee_worker["solver"].log_probability_batch(P, *_emcee_worker["args"])
+
+
+def _map_log_probability_batch(P: ArrayLike, solver: EmceeSolve) -> ArrayLike:
+    """Internal method to divide the parameter sets over the worker processes."""
+    chunks = np.array_split(P, min(solver._pool_processes, P.shape[0]))
+    return np.concatenate(solver._pool.map(_emcee_log_probability_batch, chunks))
@@ -9,6 +9,7 @@
     core
     metrics
     dutch
+    quantiles
     sgi
     signatures
     tests
@@ -23,5 +24,6 @@ import pastas.stats.signatures as signatures
 from .core import acf, ccf, mean, std, var
 from .dutch import ghg, glg, gvg, q_ghg, q_glg, q_gvg
 from .metrics import aic, bic, evp, kge, kge_2012, mae, nse, pearsonr, rmse, rsq, sse
+from .quantiles import P2Quantiles
 from .sgi import sgi
 from .tests import diagnostics, durbin_watson, ljung_box, runs_test, stoffer_toloi
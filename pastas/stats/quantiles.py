@@ -0,0 +1,135 @@
+"""The following methods may be used to estimate quantiles of many samples with a
+bounded amount of memory.
+
+The confidence and prediction intervals of a simulation are computed from a large
+number of realizations of the simulation. Storing all realizations requires memory
+proportional to the number of samples times the number of time steps. The P²
+algorithm estimates a quantile from a stream of samples while storing only five
+values per time step, independent of the number of samples.
+"""
+
+# Type Hinting
+from typing import List
+
+import numpy as np
+
+from pastas.typing import ArrayLike
+
+
+class P2Quantiles:
+    """Streaming estimator of quantiles using the P² algorithm.
+
+    Parameters
+    ----------
+    q: list of float
+        The quantiles to estimate, between 0 and 1.
+    size: int
+        The number of values in each sample (e.g., the number of time steps). The
+        quantiles are estimated for each value separately.
+
+    Notes
+    -----
+    The P² algorithm of Jain and Chlamtac (1985) keeps five markers for each
+    quantile and each value. The markers are updated with each new sample, using a
+    piecewise-parabolic approximation of the cumulative distribution. The markers
+    are updated for all values at once, so the memory use and the time per sample
+    are proportional to the number of values.
+
+    The quantiles are computed exactly from the samples as long as less than five
+    samples have been added.
+
+    Examples
+    --------
+    >>> estimator = P2Quantiles(q=[0.025, 0.975], size=100)
+    >>> for chunk in chunks:  # arrays with shape (100, nsamples)
+    >>>     estimator.update(chunk)
+    >>> estimator.quantiles()
+    """
+
+    def __init__(self, q: List[float], size: int) -> None:
+        self.q = np.asarray(q, dtype=float)
+        self.size = size
+        self.count = 0
+
+        # the markers of all quantiles and values are stored in the columns
+        p = np.repeat(self.q, size)
+        ones = np.ones_like(p)
+        self._heights = None
+        self._positions = np.outer(np.arange(1.0, 6.0), ones)
+        # the desired positions of the markers and their increments
+        self._desired = np.array([ones, 1 + 2 * p, 1 + 4 * p, 3 + 2 * p, 5 * ones])
+        self._increment = np.array([0 * ones, p / 2, p, (1 + p) / 2, ones])
+        self._buffer = []
+
+    def update(self, x: ArrayLike) -> None:
+        """Method to add samples to the estimator.
+
+        Parameters
+        ----------
+        x: array_like
+            Array with shape (size,) with one sample, or with shape (size, nsamples)
+            with a sample in each column.
+        """
+        x = np.asarray(x, dtype=float)
+        if x.ndim == 1:
+            x = x[:, np.newaxis]
+        for j in range(x.shape[1]):
+            self._update_one(np.tile(x[:, j], self.q.size))
+
+    def quantiles(self) -> ArrayLike:
+        """Method to get the estimated quantiles.
+
+        Returns
+        -------
+        quantiles: numpy.ndarray
+            Array with shape (nq, size) with the estimated quantiles.
+        """
+        if self.count == 0:
+            return np.full((self.q.size, self.size), np.nan)
+        elif self.count < 5:
+            data = np.column_stack(self._buffer)[: self.size]
+            return np.quantile(data, self.q, axis=1)
+        return self._heights[2].reshape(self.q.size, self.size)
+
+    def _update_one(self, x: ArrayLike) -> None:
+        """Internal method to update the markers with one sample."""
+        self.count += 1
+        if self.count <= 5:
+            self._buffer.append(x)
+            if self.count == 5:
+                self._heights = np.sort(np.column_stack(self._buffer), axis=1).T
+            return
+
+        h = self._heights
+        n = self._positions
+
+        # find the cell of each value and update the extreme markers
+        h[0] = np.minimum(h[0], x)
+        h[4] = np.maximum(h[4], x)
+        n[1:] += x[np.newaxis, :] < h[1:]
+        n[4] = self.count
+        self._desired += self._increment
+
+        for i in range(1, 4):
+            d = self._desired[i] - n[i]
+            up = (d >= 1.0) & (n[i + 1] - n[i] > 1.0)
+            down = (d <= -1.0) & (n[i - 1] - n[i] < -1.0)
+            adjust = up | down
+            if not adjust.any():
+                continue
+            d = np.where(up, 1.0, -1.0)[adjust]
+            hm, hi, hp = h[i - 1, adjust], h[i, adjust], h[i + 1, adjust]
+            nm, ni, np_ = n[i - 1, adjust], n[i, adjust], n[i + 1, adjust]
+
+            # piecewise-parabolic prediction of the new height
+            parabolic = hi + d / (np_ - nm) * (
+                (ni - nm + d) * (hp - hi) / (np_ - ni)
+                + (np_ - ni - d) * (hi - hm) / (ni - nm)
+            )
+            # use a linear prediction if the parabolic one is not monotonic
+            linear = np.where(
+                d > 0, hi + (hp - hi) / (np_ - ni), hi - (hm - hi) / (nm - ni)
+            )
+            monotonic = (hm < parabolic) & (parabolic < hp)
+            h[i, adjust] = np.where(monotonic, parabolic, linear)
+            n[i, adjust] = ni + d
@@ -14,6 +14,8 @@ See Also
 pastas.model.Model.add_stressmodel
 """
 
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from inspect import isclass
 from logging import getLogger
 
@@ -21,8 +23,15 @@ from logging import getLogger
 from typing import List, Optional, Tuple, Union
 
 import numpy as np
-from pandas import DataFrame, Series, Timedelta, Timestamp, concat, date_range
-from scipy.signal import fftconvolve
+from pandas import (
+    DataFrame,
+    DatetimeIndex,
+    Series,
+    Timedelta,
+    Timestamp,
+    concat,
+    date_range,
+)
 
 from pastas.typing import (
     ArrayLike,
@@ -33,6 +42,8 @@ from pastas.typing import (
     TimestampType,
 )
 
+from .cache import block_cache
+from .convolution import convolve, convolve_sum
 from .decorators import njit, set_parameter
 from .recharge import Linear
 from .rfunc import Exponential, HantushWellModel, One
@@ -94,6 +105,13 @@ class StressModelBase:
         )
 
         self.stress = []
+        self._prepared_stress = None
+
+    def __getstate__(self) -> dict:
+        # the prepared stresses are prepared again in the first simulation
+        state = self.__dict__.copy()
+        state["_prepared_stress"] = None
+        return state
 
     @property
     def nparam(self) -> Tuple[int]:
@@ -187,6 +205,111 @@ class StressModelBase:
         if freq:
             self.freq = freq
 
+    def _prepare_stress(
+        self,
+        tmin: Optional[TimestampType] = None,
+        tmax: Optional[TimestampType] = None,
+        freq: Optional[str] = None,
+    ) -> None:
+        """Internal method to prepare the stresses as read-only NumPy arrays.
+
+        Notes
+        -----
+        The stresses are updated for tmin, tmax and freq and stored as contiguous
+        float64 arrays, aligned with the index returned by `_get_stress_index`.
+        This method is called through `_get_prepared_stress` for each stress model
+        in `Model.initialize`. The FFTs of the stresses are stored in "spectra"
+        when they are first computed, so they are reused in the following
+        simulations.
+        """
+        self.update_stress(tmin=tmin, tmax=tmax, freq=freq)
+        index = self._get_stress_index()
+
+        stress = []
+        for ts in self.stress:
+            series = ts.series
+            if not series.index.equals(index):
+                series = series.reindex(index)
+            # a read-only view, so the values shared by TimeSeries are not copied
+            values = np.ascontiguousarray(series.values, dtype=float).view()
+            values.flags.writeable = False
+            stress.append(values)
+
+        self._prepared_stress = {
+            "key": (tmin, tmax, freq),
+            "versions": self._get_stress_versions(),
+            "index": index,
+            "stress": stress,
+            "spectra": [{} for _ in stress],  # FFTs of the stresses, see convolve
+        }
+
+    def _get_prepared_stress(
+        self,
+        tmin: Optional[TimestampType] = None,
+        tmax: Optional[TimestampType] = None,
+        freq: Optional[str] = None,
+    ) -> List[ArrayLike]:
+        """Internal method to get the prepared stresses as NumPy arrays.
+
+        Returns
+        -------
+        stress: list of numpy.ndarray
+            List with a read-only array for each stress.
+
+        Notes
+        -----
+        The stresses are only prepared again if tmin, tmax or freq are different
+        from the prepared stresses, or if any of the TimeSeries has been updated in
+        the meantime. This avoids checking the settings of each TimeSeries in every
+        simulation during the optimization.
+        """
+        prepared = self._prepared_stress
+        if (
+            prepared is None
+            or prepared["key"] != (tmin, tmax, freq)
+            or prepared["versions"] != self._get_stress_versions()
+        ):
+            self._prepare_stress(tmin=tmin, tmax=tmax, freq=freq)
+            prepared = self._prepared_stress
+        return prepared["stress"]
+
+    def _get_stress_versions(self) -> Tuple[Tuple[int, int]]:
+        """Internal method to identify the current state of the stresses."""
+        return tuple((id(ts), ts._version) for ts in self.stress)
+
+    def _get_stress_index(self, istress: Optional[int] = None) -> DatetimeIndex:
+        """Internal method to get the index shared by the (selected) stresses."""
+        if istress is None:
+            stress = self.stress
+        else:
+            stress = [self.stress[i] for i in np.atleast_1d(istress)]
+        if len(stress) == 0:
+            return DatetimeIndex([])
+        index = stress[0].series.index
+        for s in stress[1:]:
+            if not s.series.index.equals(index):
+                index = index.union(s.series.index)
+        return index
+
+    def _simulate_array(
+        self,
+        p: ArrayLike,
+        tmin: Optional[TimestampType] = None,
+        tmax: Optional[TimestampType] = None,
+        freq: Optional[str] = None,
+        dt: float = 1.0,
+    ) -> ArrayLike:
+        """Internal method to simulate the contribution as a NumPy array.
+
+        Notes
+        -----
+        This method is used by the Model to simulate without the overhead of
+        creating and aligning pandas Series. The values are aligned with the index
+        of the Series returned by the simulate method. Stress models that do not
+        override this method fall back to the simulate method.
+        """
+        return self.simulate(p, tmin=tmin, tmax=tmax, freq=freq, dt=dt).values
+
     def get_stress(
         self,
         p: Optional[ArrayLike] = None,
@@ -228,13 +351,125 @@ class StressModelBase:
         self, p: ArrayLike, dt: float, tmin: TimestampType, tmax: TimestampType
     ) -> ArrayLike:
         """Internal method to get the block-response function."""
+        maxtmax = self._get_maxtmax(tmin, tmax)
+        b = block_cache.get_block(self.rfunc, p, dt, maxtmax=maxtmax)
+        return b
+
+    def _get_block_derivative(
+        self, p: ArrayLike, dt: float, tmin: TimestampType, tmax: TimestampType
+    ) -> ArrayLike:
+        """Internal method to get the derivatives of the block-response function."""
+        maxtmax = self._get_maxtmax(tmin, tmax)
+        return self.rfunc.block_derivative(p, dt, maxtmax=maxtmax)
+
+    @staticmethod
+    def _get_maxtmax(tmin: TimestampType, tmax: TimestampType) -> Union[float, None]:
+        """Internal method to get the maximum length of the response in days."""
         if tmin is not None and tmax is not None:
             day = Timedelta(1, "D")
-            maxtmax = (Timestamp(tmax) - Timestamp(tmin)) / day
+            return (Timestamp(tmax) - Timestamp(tmin)) / day
         else:
-            maxtmax = None
-        b = self.rfunc.block(p, dt, maxtmax=maxtmax)
-        return b
+            return None
+
+    def _get_linear_parameters(self) -> ArrayLike:
+        """Internal method to get the parameters the contribution is linear in.
+
+        Returns
+        -------
+        linear: numpy.ndarray
+            Boolean array with length nparam, which is True for the parameters the
+            contribution is proportional to (e.g., the gain of the response
+            function). The contribution for a value of one of such a parameter is
+            obtained by simulating with that parameter set to one.
+        """
+        linear = np.zeros(self.nparam, dtype=bool)
+        rfunc = getattr(self, "rfunc", None)
+        if rfunc is not None:
+            # the gain of the response function is the first parameter
+            linear[0] = rfunc._linear_gain
+        return linear
+
+    def _simulate_jacobian(
+        self,
+        p: ArrayLike,
+        tmin: Optional[TimestampType] = None,
+        tmax: Optional[TimestampType] = None,
+        freq: Optional[str] = None,
+        dt: float = 1.0,
+    ) -> ArrayLike:
+        """Internal method to get the derivatives of the contribution to the
+        parameters.
+
+        Returns
+        -------
+        jac: numpy.ndarray
+            Array with shape (n, nparam), aligned with the array returned by the
+            `_simulate_array` method.
+
+        Notes
+        -----
+        The derivatives are computed with forward finite differences of the
+        contribution of this stress model only. Stress models that convolve a stress
+        with a response function compute the derivatives by convolving the stress
+        with the derivatives of the block response.
+        """
+        p = np.asarray(p, dtype=float)
+        h0 = self._simulate_array(p, tmin=tmin, tmax=tmax, freq=freq, dt=dt)
+        jac = np.zeros((h0.size, p.size))
+        for j in range(p.size):
+            h = np.sqrt(np.finfo(float).eps) * max(1.0, abs(p[j]))
+            p1 = p.copy()
+            p1[j] += h
+            h1 = self._simulate_array(p1, tmin=tmin, tmax=tmax, freq=freq, dt=dt)
+            jac[:, j] = (h1 - h0) / h
+        return jac
+
+    def _simulate_batch(
+        self,
+        P: ArrayLike,
+        tmin: Optional[TimestampType] = None,
+        tmax: Optional[TimestampType] = None,
+        freq: Optional[str] = None,
+        dt: float = 1.0,
+        n_jobs: Optional[int] = None,
+    ) -> ArrayLike:
+        """Internal method to simulate the contribution for many parameter sets.
+
+        Parameters
+        ----------
+        P: array_like
+            Two-dimensional array with a parameter set in each row.
+        n_jobs: int, optional
+            Number of processes used by stress models that simulate each parameter
+            set separately with an expensive nonlinear model. Default is None, which
+            simulates all parameter sets in the current process.
+
+        Returns
+        -------
+        h: numpy.ndarray
+            Array with shape (n, nsamples) with the contribution for each parameter
+            set in a column, aligned with the array returned by the
+            `_simulate_array` method.
+
+        Notes
+        -----
+        Stress models that convolve a stress with a response function compute the
+        block responses for all parameter sets at once and convolve them with the
+        stress in one call. Other stress models simulate each parameter set
+        separately.
+        """
+        h = [
+            self._simulate_array(p, tmin=tmin, tmax=tmax, freq=freq, dt=dt)
+            for p in np.atleast_2d(P)
+        ]
+        return np.column_stack(h)
+
+    def _get_block_batch(
+        self, P: ArrayLike, dt: float, tmin: TimestampType, tmax: TimestampType
+    ) -> ArrayLike:
+        """Internal method to get the block responses for many parameter sets."""
+        maxtmax = self._get_maxtmax(tmin, tmax)
+        return self.rfunc.block_batch(P, dt, maxtmax=maxtmax)
 
     def get_settings(self) -> dict:
         """Method to obtain the settings of the stresses.
@@ -415,16 +650,54 @@ class StressModel(StressModelBase):
         pandas.Series
             The simulated head contribution.
         """
-        self.update_stress(tmin=tmin, tmax=tmax, freq=freq)
+        h = self._simulate_array(p, tmin=tmin, tmax=tmax, freq=freq, dt=dt)
+        return Series(data=h, index=self.stress[0].series.index, name=self.name)
+
+    def _simulate_array(
+        self,
+        p: ArrayLike,
+        tmin: Optional[TimestampType] = None,
+        tmax: Optional[TimestampType] = None,
+        freq: Optional[str] = None,
+        dt: float = 1.0,
+    ) -> ArrayLike:
+        """Internal method to simulate the head contribution as a NumPy array."""
+        stress = self._get_prepared_stress(tmin=tmin, tmax=tmax, freq=freq)[0]
+        spectra = self._prepared_stress["spectra"][0]
         b = self._get_block(p, dt, tmin, tmax)
-        stress = self.stress[0].series
-        npoints = stress.index.size
-        h = Series(
-            data=fftconvolve(stress, b, "full")[:npoints],
-            index=stress.index,
-            name=self.name,
-        )
-        return h
+        return convolve(stress, b, spectra=spectra)
+
+    def _simulate_jacobian(
+        self,
+        p: ArrayLike,
+        tmin: Optional[TimestampType] = None,
+        tmax: Optional[TimestampType] = None,
+        freq: Optional[str] = None,
+        dt: float = 1.0,
+    ) -> ArrayLike:
+        """Internal method to get the derivatives of the contribution to the
+        parameters, by convolving the stress with the derivatives of the block
+        response."""
+        stress = self._get_prepared_stress(tmin=tmin, tmax=tmax, freq=freq)[0]
+        spectra = self._prepared_stress["spectra"][0]
+        db = self._get_block_derivative(p, dt, tmin, tmax)
+        return convolve(stress, db, spectra=spectra)
+
+    def _simulate_batch(
+        self,
+        P: ArrayLike,
+        tmin: Optional[TimestampType] = None,
+        tmax: Optional[TimestampType] = None,
+        freq: Optional[str] = None,
+        dt: float = 1.0,
+        n_jobs: Optional[int] = None,
+    ) -> ArrayLike:
+        """Internal method to simulate the contribution for many parameter sets, by
+        convolving the stress with the block responses of all parameter sets."""
+        stress = self._get_prepared_stress(tmin=tmin, tmax=tmax, freq=freq)[0]
+        spectra = self._prepared_stress["spectra"][0]
+        b = self._get_block_batch(np.atleast_2d(P), dt, tmin, tmax)
+        return convolve(stress, b, spectra=spectra)
 
     def to_dict(self, series: bool = True) -> dict:
         """Method to export the StressModel object.
@@ -519,19 +792,25 @@ class StepModel(StressModelBase):
         freq: Optional[str] = None,
         dt: float = 1.0,
     ) -> Series:
+        tindex = date_range(tmin, tmax, freq=freq)
+        h = self._simulate_array(p, tmin=tmin, tmax=tmax, freq=freq, dt=dt)
+        return Series(data=h, index=tindex, name=self.name)
+
+    def _simulate_array(
+        self,
+        p: ArrayLike,
+        tmin: Optional[TimestampType] = None,
+        tmax: Optional[TimestampType] = None,
+        freq: Optional[str] = None,
+        dt: float = 1.0,
+    ) -> ArrayLike:
+        """Internal method to simulate the step contribution as a NumPy array."""
         tstart = Timestamp.fromordinal(int(p[-1]))
         tindex = date_range(tmin, tmax, freq=freq)
-        h = Series(0, tindex, name=self.name)
-        h.loc[h.index > tstart] = 1
+        step = (tindex > tstart).astype(float)
 
         b = self._get_block(p[:-1], dt, tmin, tmax)
-        npoints = h.index.size
-        h = Series(
-            data=fftconvolve(h, b, "full")[:npoints],
-            index=h.index,
-            name=self.name,
-        )
-        return h
+        return convolve(step, b)
 
     def to_dict(self, **kwargs) -> dict:
         """Method to export the StepModel object.
@@ -824,8 +1103,12 @@ class WellModel(StressModelBase):
             logger.error(msg)
             raise ValueError(msg)
         else:
+            # the stresses are TimeSeries if the model is copied
             self.distances = Series(
-                index=[s.squeeze().name for s in stress],
+                index=[
+                    s.name if isinstance(s, TimeSeries) else s.squeeze().name
+                    for s in stress
+                ],
                 data=distances,
                 name="distances",
             )
@@ -884,18 +1167,10 @@ class WellModel(StressModelBase):
         istress: Optional[int] = None,
         **kwargs,
     ) -> Series:
-        distances = self.get_distances(istress=istress)
-        stress_df = self.get_stress(
-            p=p, tmin=tmin, tmax=tmax, freq=freq, istress=istress, squeeze=False
+        h = self._simulate_array(
+            p, tmin=tmin, tmax=tmax, freq=freq, dt=dt, istress=istress
         )
-        h = Series(data=0, index=self.stress[0].series.index, name=self.name)
-        for name, r in distances.items():
-            stress = stress_df.loc[:, name]
-            npoints = stress.index.size
-            p_with_r = np.concatenate([p, np.array([r])])
-            b = self._get_block(p_with_r, dt, tmin, tmax)
-            c = fftconvolve(stress, b, "full")[:npoints]
-            h = h.add(Series(c, index=stress.index), fill_value=0.0)
+        h = Series(data=h, index=self._get_stress_index(istress=istress))
         if istress is not None:
             if isinstance(istress, list):
                 h.name = self.name + "_" + "+".join(str(i) for i in istress)
@@ -907,6 +1182,86 @@ class WellModel(StressModelBase):
             h.name = self.name
         return h
 
+    def _simulate_array(
+        self,
+        p: Optional[ArrayLike] = None,
+        tmin: Optional[TimestampType] = None,
+        tmax: Optional[TimestampType] = None,
+        freq: Optional[str] = None,
+        dt: float = 1.0,
+        istress: Optional[int] = None,
+    ) -> ArrayLike:
+        """Internal method to simulate the head contribution as a NumPy array."""
+        if tmin is None:
+            tmin = self.tmin
+        if tmax is None:
+            tmax = self.tmax
+        prepared = self._get_prepared_stress(tmin=tmin, tmax=tmax, freq=freq)
+
+        distances = self.get_distances(istress=istress)
+        if istress is None:
+            index = self._prepared_stress["index"]
+            names = [s.name for s in self.stress]
+            stresses = dict(zip(names, prepared))
+            spectra = dict(zip(names, self._prepared_stress["spectra"]))
+        else:
+            # only the selected stresses are aligned with each other
+            index = self._get_stress_index(istress=istress)
+            stresses = {}
+            for s in self.stress:
+                if s.name in distances.index:
+                    stress = s.series
+                    if not stress.index.equals(index):
+                        stress = stress.reindex(index)
+                    stresses[s.name] = stress.values
+            spectra = {}
+
+        if isinstance(self.rfunc, HantushWellModel) and distances.size > 1:
+            # compute the block responses for all wells at once
+            maxtmax = self._get_maxtmax(tmin, tmax)
+            b = self.rfunc.block_wells(p, distances.values, dt, maxtmax=maxtmax)
+            return convolve_sum(
+                [stresses[name] for name in distances.index],
+                b,
+                spectra=[spectra.get(name) for name in distances.index],
+            )
+
+        h = np.zeros(index.size)
+        for name, r in distances.items():
+            p_with_r = np.concatenate([p, np.array([r])])
+            b = self._get_block(p_with_r, dt, tmin, tmax)
+            h += convolve(stresses[name], b, spectra=spectra.get(name))
+        return h
+
+    def _simulate_jacobian(
+        self,
+        p: ArrayLike,
+        tmin: Optional[TimestampType] = None,
+        tmax: Optional[TimestampType] = None,
+        freq: Optional[str] = None,
+        dt: float = 1.0,
+    ) -> ArrayLike:
+        """Internal method to get the derivatives of the contribution to the
+        parameters, by convolving the stresses with the derivatives of the block
+        responses."""
+        if tmin is None:
+            tmin = self.tmin
+        if tmax is None:
+            tmax = self.tmax
+        prepared = self._get_prepared_stress(tmin=tmin, tmax=tmax, freq=freq)
+        index = self._prepared_stress["index"]
+
+        names = [s.name for s in self.stress]
+        stresses = dict(zip(names, prepared))
+        spectra = dict(zip(names, self._prepared_stress["spectra"]))
+
+        jac = np.zeros((index.size, self.rfunc.nparam))
+        for name, r in self.distances.items():
+            p_with_r = np.concatenate([p, np.array([r])])
+            db = self._get_block_derivative(p_with_r, dt, tmin, tmax)
+            jac += convolve(stresses[name], db, spectra=spectra[name])
+        return jac
+
     @staticmethod
     def _handle_stress(stress, settings, metadata):
         """Internal method to handle user provided stress in init.
@@ -1403,26 +1758,135 @@ class RechargeModel(StressModelBase):
         -------
         pandas.Series
         """
+        h = self._simulate_array(
+            p, tmin=tmin, tmax=tmax, freq=freq, dt=dt, istress=istress
+        )
+        name = self.name
+        if istress is not None and self.stress[istress].name is not None:
+            name = f"{self.name} ({self.stress[istress].name})"
+
+        return Series(data=h, index=self.prec.series.index, name=name)
+
+    def _simulate_array(
+        self,
+        p: Optional[ArrayLike] = None,
+        tmin: Optional[TimestampType] = None,
+        tmax: Optional[TimestampType] = None,
+        freq: Optional[str] = None,
+        dt: float = 1.0,
+        istress: Optional[int] = None,
+    ) -> ArrayLike:
+        """Internal method to simulate the recharge contribution as a NumPy array."""
         if p is None:
             p = self.parameters.initial.values
         b = self._get_block(p[: self.rfunc.nparam], dt, tmin, tmax)
-        stress = self.get_stress(
-            p=p, tmin=tmin, tmax=tmax, freq=freq, istress=istress
-        ).values
-        name = self.name
+        if istress is None:
+            stress = self._get_recharge(p=p, tmin=tmin, tmax=tmax, freq=freq)
+        else:
+            stress = self.get_stress(
+                p=p, tmin=tmin, tmax=tmax, freq=freq, istress=istress
+            ).values
 
-        if istress is not None:
-            if istress == 1 and self.nsplit > 1:
-                # only happen when Linear is used as the recharge model
-                stress = stress * p[-1]
-            if self.stress[istress].name is not None:
-                name = f"{self.name} ({self.stress[istress].name})"
-
-        return Series(
-            data=fftconvolve(stress, b, "full")[: stress.size],
-            index=self.prec.series.index,
-            name=name,
-        )
+        if istress == 1 and self.nsplit > 1:
+            # only happen when Linear is used as the recharge model
+            stress = stress * p[-1]
+
+        return convolve(stress, b)
+
+    def _simulate_jacobian(
+        self,
+        p: ArrayLike,
+        tmin: Optional[TimestampType] = None,
+        tmax: Optional[TimestampType] = None,
+        freq: Optional[str] = None,
+        dt: float = 1.0,
+    ) -> ArrayLike:
+        """Internal method to get the derivatives of the contribution to the
+        parameters.
+
+        Notes
+        -----
+        The derivatives to the parameters of the response function are computed by
+        convolving the recharge with the derivatives of the block response. The
+        derivatives to the parameters of the recharge model are computed by
+        convolving the finite difference derivatives of the recharge with the block
+        response.
+        """
+        p = np.asarray(p, dtype=float)
+        nrfunc = self.rfunc.nparam
+        b = self._get_block(p[:nrfunc], dt, tmin, tmax)
+        db = self._get_block_derivative(p[:nrfunc], dt, tmin, tmax)
+        rch = self._get_recharge(p=p, tmin=tmin, tmax=tmax, freq=freq)
+
+        jac = np.zeros((rch.size, p.size))
+        jac[:, :nrfunc] = convolve(rch, db)
+        for j in range(nrfunc, p.size):
+            h = np.sqrt(np.finfo(float).eps) * max(1.0, abs(p[j]))
+            p1 = p.copy()
+            p1[j] += h
+            drch = (self._get_recharge(p=p1, tmin=tmin, tmax=tmax, freq=freq) - rch) / h
+            jac[:, j] = convolve(drch, b)
+        return jac
+
+    def _simulate_batch(
+        self,
+        P: ArrayLike,
+        tmin: Optional[TimestampType] = None,
+        tmax: Optional[TimestampType] = None,
+        freq: Optional[str] = None,
+        dt: float = 1.0,
+        n_jobs: Optional[int] = None,
+    ) -> ArrayLike:
+        """Internal method to simulate the contribution for many parameter sets, by
+        convolving the recharge of each parameter set with its block response."""
+        P = np.atleast_2d(np.asarray(P, dtype=float))
+        b = self._get_block_batch(P[:, : self.rfunc.nparam], dt, tmin, tmax)
+        rch = self._get_recharge_batch(P, tmin, tmax, freq, n_jobs=n_jobs)
+        return convolve(rch, b)
+
+    def _get_recharge_batch(
+        self,
+        P: ArrayLike,
+        tmin: Optional[TimestampType] = None,
+        tmax: Optional[TimestampType] = None,
+        freq: Optional[str] = None,
+        n_jobs: Optional[int] = None,
+    ) -> ArrayLike:
+        """Internal method to compute the recharge flux for many parameter sets.
+
+        Returns
+        -------
+        rch: numpy.ndarray
+            Array with shape (n, nsamples) with the recharge for each parameter set
+            in a column.
+
+        Notes
+        -----
+        The linear recharge model is computed for all parameter sets at once. The
+        nonlinear recharge models are computed for each parameter set separately,
+        in n_jobs processes if n_jobs is larger than one.
+        """
+        if tmin is None:
+            tmin = self.tmin
+        if tmax is None:
+            tmax = self.tmax
+
+        stress = self._get_prepared_stress(tmin=tmin, tmax=tmax, freq=freq)
+        temp = stress[2] if self.temp is not None else None
+        P = P[:, P.shape[1] - self.recharge.nparam :]
+
+        if isinstance(self.recharge, Linear):
+            return stress[0][:, np.newaxis] + stress[1][:, np.newaxis] * P[:, 0]
+
+        recharge = self.recharge
+        simulate = partial(_simulate_recharge, recharge, stress[0], stress[1], temp)
+        if n_jobs is None or n_jobs == 1:
+            rch = [simulate(p) for p in P]
+        else:
+            chunksize = max(1, P.shape[0] // (4 * n_jobs))
+            with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+                rch = list(executor.map(simulate, P, chunksize=chunksize))
+        return np.column_stack(rch)
 
     def get_stress(
         self,
@@ -1484,6 +1948,28 @@ class RechargeModel(StressModelBase):
         else:
             return self.temp.series
 
+    def _get_recharge(
+        self,
+        p: ArrayLike,
+        tmin: Optional[TimestampType] = None,
+        tmax: Optional[TimestampType] = None,
+        freq: Optional[str] = None,
+    ) -> ArrayLike:
+        """Internal method to compute the recharge flux from the prepared stresses."""
+        if tmin is None:
+            tmin = self.tmin
+        if tmax is None:
+            tmax = self.tmax
+
+        stress = self._get_prepared_stress(tmin=tmin, tmax=tmax, freq=freq)
+        temp = stress[2] if self.temp is not None else None
+        return self.recharge.simulate(
+            prec=stress[0],
+            evap=stress[1],
+            p=p[-self.recharge.nparam :],
+            **{"temp": temp},
+        )
+
     def get_water_balance(
         self,
         p: Optional[ArrayLike] = None,
@@ -1716,10 +2202,29 @@ class TarsoModel(RechargeModel):
         freq=None,
         dt: float = 1.0,
     ) -> Series:
-        stress = self.get_stress(p=p, tmin=tmin, tmax=tmax, freq=freq)
-        h = self.tarso(p[: -self.recharge.nparam], stress.values, dt)
-        sim = Series(h, name=self.name, index=stress.index)
-        return sim
+        h = self._simulate_array(p, tmin=tmin, tmax=tmax, freq=freq, dt=dt)
+        return Series(h, name=self.name, index=self.prec.series.index)
+
+    def _simulate_array(
+        self,
+        p: Optional[ArrayLike] = None,
+        tmin: Optional[TimestampType] = None,
+        tmax: Optional[TimestampType] = None,
+        freq=None,
+        dt: float = 1.0,
+    ) -> ArrayLike:
+        """Internal method to simulate the head contribution as a NumPy array."""
+        stress = self._get_recharge(p=p, tmin=tmin, tmax=tmax, freq=freq)
+        return self.tarso(p[: -self.recharge.nparam], stress, dt)
+
+    # the contribution is not a convolution, so use finite differences
+    _simulate_jacobian = StressModelBase._simulate_jacobian
+    _simulate_batch = StressModelBase._simulate_batch
+
+    def _get_linear_parameters(self) -> ArrayLike:
+        """Internal method to get the parameters the contribution is linear in."""
+        # the contribution is not proportional to the gain of the response function
+        return np.zeros(self.nparam, dtype=bool)
 
     def to_dict(self, series: bool = True) -> dict:
         """Method to export the TarsoModel object.
@@ -1948,33 +2453,36 @@ class ChangeModel(StressModelBase):
         freq: Optional[str] = None,
         dt: float = 1.0,
     ) -> Series:
-        self.update_stress(tmin=tmin, tmax=tmax, freq=freq)
+        h = self._simulate_array(p, tmin=tmin, tmax=tmax, freq=freq, dt=dt)
+        return Series(data=h, index=self.stress[0].series.index, name=self.name)
+
+    def _simulate_array(
+        self,
+        p: ArrayLike,
+        tmin: Optional[TimestampType] = None,
+        tmax: Optional[TimestampType] = None,
+        freq: Optional[str] = None,
+        dt: float = 1.0,
+    ) -> ArrayLike:
+        """Internal method to simulate the head contribution as a NumPy array."""
+        stress = self._get_prepared_stress(tmin=tmin, tmax=tmax, freq=freq)[0]
+        index = self._prepared_stress["index"]
         rfunc1 = self.rfunc1.block(p[: self.rfunc1.nparam])
         rfunc2 = self.rfunc2.block(
             p[self.rfunc1.nparam : self.rfunc1.nparam + self.rfunc2.nparam]
         )
 
-        stress = self.stress[0].series
-        npoints = stress.index.size
+        npoints = stress.size
         t = np.linspace(0, 1, npoints)
         beta = p[-2]
 
-        sigma = stress.index.get_loc(Timestamp.fromordinal(int(p[-1]))) / npoints
+        sigma = index.get_loc(Timestamp.fromordinal(int(p[-1]))) / npoints
         omega = 1 / (np.exp(beta * (t - sigma)) + 1)
 
-        h1 = Series(
-            data=fftconvolve(stress, rfunc1, "full")[:npoints],
-            index=stress.index,
-            name="1",
-        )
-        h2 = Series(
-            data=fftconvolve(stress, rfunc2, "full")[:npoints],
-            index=stress.index,
-            name="1",
-        )
-        h = omega * h1 + (1 - omega) * h2
-
-        return h
+        spectra = self._prepared_stress["spectra"][0]
+        h1 = convolve(stress, rfunc1, spectra=spectra)
+        h2 = convolve(stress, rfunc2, spectra=spectra)
+        return omega * h1 + (1 - omega) * h2
 
     def to_dict(self, series: bool = True):
         """Method to export the ChangeModel object.
@@ -1997,3 +2505,15 @@ class ChangeModel(StressModelBase):
             "up": self.rfunc1.up,
         }
         return data
+
+
+def _simulate_recharge(
+    recharge: Recharge,
+    prec: ArrayLike,
+    evap: ArrayLike,
+    temp: Optional[ArrayLike],
+    p: ArrayLike,
+) -> ArrayLike:
+    """Internal function to compute the recharge flux, which can be sent to other
+    processes."""
+    return recharge.simulate(prec=prec, evap=evap, p=p, **{"temp": temp})
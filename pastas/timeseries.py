@@ -3,10 +3,12 @@ from logging import getLogger
 # Type Hinting
 from typing import Optional, Union
 
+import numpy as np
 import pandas as pd
-from pandas import Series, Timedelta
+from pandas import Series, Timedelta, Timestamp
 from pandas.tseries.frequencies import to_offset
 
+from .cache import get_series_hash, series_store
 from .rcparams import rcParams
 from .timeseries_utils import _get_dt, _get_time_offset, _infer_fixed_freq, resample
 from .utils import validate_name
@@ -19,8 +21,10 @@ class TimeSeries:
 
     Parameters
     ----------
-    series: pandas.Series
-        pandas.Series with pandas.DatetimeIndex.
+    series: pandas.Series or pastas.TimeSeries
+        pandas.Series with pandas.DatetimeIndex. If a TimeSeries is provided, its
+        original and updated series are reused without validating them again, and
+        the series is only updated if the settings are different.
     name: str, optional
         String with the name of the time series, if None is provided, pastas will try
         to derive the name from the series.
@@ -99,6 +103,43 @@ class TimeSeries:
         settings: Optional[Union[str, dict]] = None,
         metadata: Optional[dict] = None,
     ) -> None:
+        if isinstance(series, TimeSeries):
+            self._init_from_timeseries(series)
+            force_update = False
+        else:
+            self._init_from_series(series, settings)
+            force_update = True
+
+        # Use user provided name or set from series
+        if name is None:
+            name = series.name
+        self.name = validate_name(name)
+        self._series_original.name = validate_name(name)
+
+        if metadata is not None:
+            self.metadata.update(metadata)
+
+        # Update the settings with user-provided values, if any.
+        if settings:
+            if isinstance(settings, str):
+                if settings in self._predefined_settings.keys():
+                    settings = self._predefined_settings[settings]
+                else:
+                    msg = (
+                        "Settings shortcut code '%s' is not in the predefined "
+                        "settings options. Please choose from %s.",
+                    )
+
+                    raise KeyError(msg, settings, self._predefined_settings.keys())
+            if self._update_settings(**settings):
+                force_update = True
+
+        self.update_series(force_update=force_update, **self.settings)
+
+    def _init_from_series(
+        self, series: Series, settings: Optional[Union[str, dict]]
+    ) -> None:
+        """Internal method to validate and store a user-provided series."""
         # Make sure we have a Pandas Series and not a 1D-DataFrame
         if isinstance(series, pd.DataFrame):
             if len(series.columns) == 1:
@@ -109,7 +150,8 @@ class TimeSeries:
                 )
 
         # Make sure we have a workable Pandas Series, depends on type of time series
-        if settings == "oseries":
+        self._equidistant = settings != "oseries"
+        if not self._equidistant:
             validate_oseries(series)
         else:
             if settings is not None and not isinstance(settings, str):
@@ -121,9 +163,12 @@ class TimeSeries:
                     )
             validate_stress(series)
 
-        # Store a copy of the original series
-        self._series_original = series.copy()  # copy of the original series
+        # Store the original series, shared with other TimeSeries with the same values
+        self._key = get_series_hash(series)
+        self._series_original = series_store.add(self._key, series)
+        self._buffer = None  # buffer for the original series, see append
         self._series = None
+        self._version = 0  # incremented each time the series is updated
         self.freq_original = _infer_fixed_freq(self._series_original.index)
         self.settings = {
             "freq": self.freq_original,
@@ -138,30 +183,19 @@ class TimeSeries:
         }
         self.metadata = {"x": 0.0, "y": 0.0, "z": 0.0, "projection": None}
 
-        # Use user provided name or set from series
-        if name is None:
-            name = series.name
-        self.name = validate_name(name)
-        self._series_original.name = validate_name(name)
-
-        if metadata is not None:
-            self.metadata.update(metadata)
-
-        # Update the settings with user-provided values, if any.
-        if settings:
-            if isinstance(settings, str):
-                if settings in self._predefined_settings.keys():
-                    settings = self._predefined_settings[settings]
-                else:
-                    msg = (
-                        "Settings shortcut code '%s' is not in the predefined "
-                        "settings options. Please choose from %s.",
-                    )
-
-                    raise KeyError(msg, settings, self._predefined_settings.keys())
-            self._update_settings(**settings)
-
-        self.update_series(force_update=True, **self.settings)
+    def _init_from_timeseries(self, ts: "TimeSeries") -> None:
+        """Internal method to reuse the validated and updated series of a
+        TimeSeries."""
+        self._equidistant = ts._equidistant
+        self._key = ts._key
+        self._series_original = _share_series(ts.series_original)
+        self._buffer = None
+        self._series = _share_series(ts.series)
+        self._version = 0
+        self._fill_before_end = ts._fill_before_end
+        self.freq_original = ts.freq_original
+        self.settings = ts.settings.copy()
+        self.metadata = ts.metadata.copy()
 
     def __repr__(self) -> str:
         """Prints a simple string representation of the time series."""
@@ -174,6 +208,21 @@ class TimeSeries:
             f"tmax={self.settings['tmax']})"
         )
 
+    def __getstate__(self) -> dict:
+        # The updated series is computed again from the original series when the
+        # TimeSeries is unpickled, so only the original series is pickled (e.g., as
+        # a reference to the file for a memory-mapped series).
+        state = self.__dict__.copy()
+        state["_buffer"] = None
+        state["_series"] = None
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        if self._key is not None:
+            self._series_original = series_store.add(self._key, self._series_original)
+        self.update_series(force_update=True)
+
     @property
     def series_original(self) -> Series:
         return self._series_original
@@ -182,7 +231,9 @@ class TimeSeries:
     def series_original(self, series: Series) -> None:
         """Sets a new freq_original for the TimeSeries."""
         validate_stress(series)
-        self._series_original = series.copy()
+        self._key = get_series_hash(series)
+        self._series_original = series_store.add(self._key, series)
+        self._buffer = None
         self.freq_original = pd.infer_freq(self._series_original.index)
         self.settings["tmin"] = series.index.min()  # reset tmin
         self.settings["tmax"] = series.index.max()  # reset tmax
@@ -239,14 +290,25 @@ class TimeSeries:
         The method will validate if any of the settings is changed to determine if
         the series need to be updated.
         """
+        settings = self.settings.copy()
         if self._update_settings(**kwargs) or force_update:
+            # Only update the end of the series if only tmax is changed
+            changed = [key for key in settings if settings[key] != self.settings[key]]
+            if not force_update and changed == ["tmax"] and settings["tmax"]:
+                tmax = min(pd.Timestamp(settings["tmax"]), self.settings["tmax"])
+                start = min(tmax, self._series_original.index[-1])
+                if self._update_tail(start):
+                    return
+
             tmin = self.settings["tmin"]
             freq = self.settings["freq"]
             if tmin is not None and freq is not None:
                 self.settings["time_offset"] = _get_time_offset(tmin, freq)
 
-            # Get the original series to start with
-            series = self._series_original.copy(deep=True)
+            # Get the original series to start with, read-only values are not copied
+            # as they cannot be changed in place
+            series = self._series_original
+            series = series.copy(deep=series.values.flags.writeable)
 
             # Only fill_nans if necessary
             if series.hasnans:
@@ -258,7 +320,197 @@ class TimeSeries:
             series = self._fill_after(series)
             series.name = self._series_original.name
 
+            # Share the series with other TimeSeries with the same original series
+            # and settings
+            if self._key is not None:
+                key = (self._key, tuple(self.settings.items()))
+                try:
+                    series = series_store.add(key, series)
+                except TypeError:  # settings that cannot be hashed
+                    pass
+
             self._series = series
+            self._version += 1
+
+    def append(self, series: Series) -> None:
+        """Method to append new values to the end of the time series.
+
+        Parameters
+        ----------
+        series: pandas.Series
+            Series with the new values. The index should start after the last index
+            of the original series. For a stress, the time step of the new values
+            should be the same as the time step of the original series.
+
+        Notes
+        -----
+        The original series is stored in a buffer with extra capacity, so new values
+        can be appended without copying the original series each time. The series
+        is only updated from the last values before the new values onward, using
+        the series before that point as it is. Only if the settings use the mean of
+        the whole original series (fill_nan or sample_up is "mean"), or if the
+        frequency is decreased, the whole series is updated.
+
+        If tmax of the settings is the last (valid) index of the original series,
+        tmax is moved to the last index of the new values.
+
+        Examples
+        --------
+        >>> ml.oseries.append(new_observations)
+        >>> ml.stressmodels["rch"].prec.append(new_precipitation)
+        >>> ml.solve(warm_start=True)
+        """
+        if isinstance(series, pd.DataFrame) and len(series.columns) == 1:
+            series = series.iloc[:, 0]
+        if series.empty:
+            return
+
+        original = self._series_original
+        if series.index[0] <= original.index[-1]:
+            msg = (
+                "The new values of time series %s should start after the last index "
+                "(%s) of the original series."
+            )
+            logger.error(msg, self.name, original.index[-1])
+            raise ValueError(msg % (self.name, original.index[-1]))
+
+        # Validate the new values together with the last original value
+        check = pd.concat([original.iloc[-1:], series])
+        check.name = self.name
+        _validate_series(check, equidistant=False)
+        if self._equidistant and original.size > 1:
+            dt = np.diff(np.append(original.index.values[-2:], series.index.values))
+            if (dt != dt[0]).any():
+                msg = (
+                    "The time step of the new values of time series %s should be "
+                    "the same as the time step of the original series."
+                )
+                logger.error(msg, self.name)
+                raise ValueError(msg % self.name)
+
+        # Move tmax if it is the last valid index of the original series
+        tmax = self.settings["tmax"]
+        last = original.index[-1]
+        if tmax is not None and pd.Timestamp(tmax) == _last_valid_index(original):
+            self.settings["tmax"] = series.last_valid_index()
+            tmax = None
+
+        self._append_original(series)
+
+        if tmax is None or pd.Timestamp(tmax) >= last:
+            start = last
+        else:
+            start = pd.Timestamp(tmax)
+        if not self._update_tail(start):
+            self.update_series(force_update=True)
+
+    def _append_original(self, series: Series) -> None:
+        """Internal method to append values to the buffer of the original series."""
+        original = self._series_original
+        n = original.size
+        m = series.size
+
+        # Double the capacity of the buffer when it is full
+        buffer = self._buffer
+        if buffer is None or buffer["values"].size < n + m:
+            capacity = 2 * (n + m)
+            values = np.empty(capacity, dtype=original.dtype)
+            index = np.empty(capacity, dtype=original.index.dtype)
+            values[:n] = original.values
+            index[:n] = original.index.values
+            buffer = {"values": values, "index": index}
+            self._buffer = buffer
+
+        self._key = None  # the original series is not shared anymore
+        buffer["values"][n : n + m] = series.values
+        buffer["index"][n : n + m] = series.index.values.astype(buffer["index"].dtype)
+        self._series_original = Series(
+            buffer["values"][: n + m],
+            index=pd.DatetimeIndex(buffer["index"][: n + m]),
+            name=original.name,
+            copy=False,
+        )
+
+    def _update_tail(self, start: Timestamp) -> bool:
+        """Internal method to update the series from start onward, using the series
+        before start as it is.
+
+        Parameters
+        ----------
+        start: pandas.Timestamp
+            The time from which the series is updated. Should not be later than the
+            last index of the original series used for the current series.
+
+        Returns
+        -------
+        updated: bool
+            False if the series cannot be updated partially and the whole series
+            needs to be updated.
+
+        Notes
+        -----
+        The values after start are computed from the original series from the last
+        two valid values before start onward, so the fill_nan and sample_up methods
+        use the same neighbouring values as for the whole series.
+        """
+        series = self._series
+        original = self._series_original
+        freq = self.settings["freq"]
+        tmin = self.settings["tmin"]
+        resample = bool(freq) and freq != self.freq_original
+
+        if series is None or series.empty or self.settings["fill_nan"] == "mean":
+            return False
+        elif resample and (
+            self.freq_original is None
+            or _get_dt(freq) > _get_dt(self.freq_original)
+            or self.settings["sample_up"] == "mean"
+        ):
+            return False
+
+        # Find the last valid original value before start
+        values = original.values
+        i = original.index.searchsorted(start) - 1
+        while i > 0 and np.isnan(values[i]):
+            i -= 1
+        if i < 1:
+            return False
+        splice = original.index[i]
+        if tmin is not None and pd.Timestamp(tmin) > splice:
+            return False
+        if resample and (splice - original.index[0]) % Timedelta(to_offset(freq)):
+            return False
+
+        tail = original.iloc[i - 1 :]
+        if tail.hasnans:
+            tail = self._fill_nan(tail)
+        tail = self._change_frequency(tail)
+        tail = tail.iloc[tail.index.searchsorted(splice) :]
+        head = series.iloc[: series.index.searchsorted(splice)]
+
+        # The values filled with the mean of the series change with the new values.
+        # The mean is computed before the series is cut at tmax, like in
+        # update_series.
+        n = 0
+        if self.settings["fill_before"] == "mean" and self._fill_before_end is not None:
+            n = head.index.searchsorted(self._fill_before_end)
+        data = [head.values[n:], tail.values]
+        mean = np.nansum([np.nansum(x) for x in data]) / sum(
+            np.count_nonzero(~np.isnan(x)) for x in data
+        )
+
+        end = tail.index[-1]
+        tail = self._fill_after(tail)
+        if self.settings["fill_after"] == "mean" and tail.index[-1] > end:
+            tail.loc[tail.index > end] = mean
+
+        series = pd.concat([head, tail])
+        if n > 0:
+            series.iloc[:n] = mean
+        series.name = original.name
+        self._series = series
+        self._version += 1
+        return True
 
     def _update_settings(self, **kwargs) -> bool:
         """Internal method that check if an update is actually necessary.
@@ -444,6 +696,7 @@ class TimeSeries:
         method = self.settings["fill_before"]
         tmin = self.settings["tmin"]
 
+        self._fill_before_end = None
         if tmin is None:
             pass
         elif pd.Timestamp(tmin) > series.index.max():
@@ -460,6 +713,8 @@ class TimeSeries:
                 start=pd.Timestamp(tmin), end=series.index.min(), freq=freq
             )
             series = series.reindex(series.index.union(index_extend[:-1]))
+            # the first index that is not filled, used in _update_tail
+            self._fill_before_end = series.first_valid_index()
 
             if method == "mean":
                 mean_value = series.mean()
@@ -607,6 +862,27 @@ class TimeSeries:
         return data
 
 
+def _share_series(series: Series) -> Series:
+    """Internal method to get a new Series with the values and index of a series.
+
+    The values are not copied, but shared as a read-only view, so they cannot be
+    changed through the new Series.
+    """
+    values = series.values.view()
+    values.flags.writeable = False
+    return Series(values, index=series.index, name=series.name, copy=False)
+
+
+def _last_valid_index(series: Series) -> Timestamp:
+    """Internal method to get the last valid index of a series, searching from the
+    end of the series."""
+    values = series.values
+    i = values.size - 1
+    while i >= 0 and np.isnan(values[i]):
+        i -= 1
+    return series.index[i] if i >= 0 else None
+
+
 def validate_stress(series: Series):
     """Method to validate user-provided stress input time series.
 
@@ -1,3 +1,6 @@
+import json
+import pickle
+
 import numpy as np
 import pytest
 from pandas import Series, Timedelta, date_range, read_csv
@@ -104,10 +107,194 @@ def test_load_model(ml: ps.Model) -> None:
     assert ml.solver.pcov.equals(ml2.solver.pcov)
 
 
+def test_load_model_version(ml: ps.Model, tmp_path, monkeypatch) -> None:
+    calls = []
+    load_model = ps.io.base._load_model
+
+    def _load_model(data, validate=True):
+        calls.append(validate)
+        return load_model(data, validate=validate)
+
+    monkeypatch.setattr(ps.io.base, "_load_model", _load_model)
+    ml.solve()
+    ml.to_file(tmp_path / "model.pas")
+    # a file written by the current version of Pastas is not validated
+    ml2 = ps.io.load(tmp_path / "model.pas")
+    assert calls == [False]
+    assert ml2.parameters.equals(ml.parameters)
+    assert ml2.stressmodels["rch"].parameters.equals(ml.stressmodels["rch"].parameters)
+    assert np.allclose(ml2.simulate(), ml.simulate())
+
+    # a file written by another version of Pastas is validated
+    with open(tmp_path / "model.pas") as f:
+        data = json.load(f)
+    data["file_info"]["pastas_version"] = "1.0.0"
+    with open(tmp_path / "model.pas", "w") as f:
+        json.dump(data, f)
+    ml3 = ps.io.load(tmp_path / "model.pas")
+    assert calls == [False, True]
+    assert ml3.parameters.equals(ml2.parameters)
+
+
+def test_load_model_pasz(ml: ps.Model, tmp_path) -> None:
+    ml.solve()
+    ml.to_file(tmp_path / "model.pasz", compress=True)
+    ml2 = ps.io.load(tmp_path / "model.pasz")
+    assert ml2.oseries.series_original.equals(ml.oseries.series_original)
+    stress = ml.stressmodels["rch"].stress
+    stress2 = ml2.stressmodels["rch"].stress
+    for ts, ts2 in zip(stress, stress2):
+        assert ts2.series_original.equals(ts.series_original)
+    assert (ml2.parameters.optimal == ml.parameters.optimal).all()
+    assert ml2.simulate().equals(ml.simulate())
+
+    data = ps.io.pasz.load(tmp_path / "model.pasz", lazy=True)
+    series = data["oseries"]["series"].load()
+    assert series.equals(ml.oseries.series_original)
+
+
+def test_load_model_pasz_same_values(tmp_path) -> None:
+    # stresses with identical values are stored once, but keep their own names
+    ml = ps.Model(obs, name="Test_Model")
+    for name in ["a", "b"]:
+        sm = ps.StressModel(prec.rename(name), ps.Exponential(), name=f"sm_{name}")
+        ml.add_stressmodel(sm)
+    ml.to_file(tmp_path / "model.pasz")
+    ml2 = ps.io.load(tmp_path / "model.pasz")
+    for name in ["a", "b"]:
+        stress = ml2.stressmodels[f"sm_{name}"].stress[0]
+        assert stress.name == name
+        assert stress.series_original.name == name
+        assert stress.series_original.equals(prec)
+
+
+def test_model_archive(ml: ps.Model, tmp_path) -> None:
+    ml.solve()
+    with ps.io.ModelArchive(tmp_path / "models.db") as archive:
+        archive.add_model(ml)
+        archive.add_model(ml.copy(name="model_2"))
+        with pytest.raises(ValueError):
+            archive.add_model(ml)
+        assert archive.names == [ml.name, "model_2"]
+        query = "SELECT COUNT(*) FROM series"
+        nseries = archive._connection.execute(query).fetchone()[0]
+        archive.add_model(ml, overwrite=True)
+        assert len(archive) == 2
+        assert archive._connection.execute(query).fetchone()[0] == nseries
+        index = archive.get_index()
+        assert index.loc[ml.name, "evp"] == ml.stats.evp()
+        assert archive.get_metadata().loc["model_2", "x"] == ml.oseries.metadata["x"]
+
+        ml2 = archive.load("model_2")
+        assert ml2.oseries.series_original.equals(ml.oseries.series_original)
+        assert ml2.simulate().equals(ml.simulate())
+
+        # the series are shared by the models and deleted with the last model
+        archive.del_model(ml.name)
+        assert len(archive) == 1
+        archive.del_model("model_2")
+        assert archive._connection.execute(query).fetchone()[0] == 0
+
+
+def test_model_memmap(tmp_path) -> None:
+    series = {}
+    for name, s in [("obs", obs), ("prec", prec), ("evap", evap)]:
+        ps.memmap.write_series(s, tmp_path / name)
+        series[name] = ps.memmap.read_series(tmp_path / name, name=s.name)
+
+    ml = ps.Model(series["obs"], name="Test_Model")
+    sm = ps.RechargeModel(series["prec"], series["evap"], ps.Exponential(), name="rch")
+    ml.add_stressmodel(sm)
+    ml.solve(report=False)
+    assert type(ml.parameters.loc["constant_d", "initial"]) is np.float64
+    ml.to_file(tmp_path / "model.pas")
+    ml2 = ps.io.load(tmp_path / "model.pas")
+    assert np.allclose(ml2.simulate(), ml.simulate())
+
+
+def test_model_memmap_pickle(tmp_path) -> None:
+    index = date_range("2000-01-01", periods=50000, freq="h")
+    stress = Series(np.random.rand(index.size), index=index, name="well")
+    head = Series(np.random.rand(index.size - 1000), index=index[1000:], name="head")
+    ps.memmap.write_series(stress, tmp_path / "well")
+    ps.memmap.write_series(head, tmp_path / "head")
+    stress = ps.memmap.read_series(tmp_path / "well", name="well")
+    head = ps.memmap.read_series(tmp_path / "head", name="head")
+
+    # the prepared and updated stresses are not pickled, but computed again
+    ml = ps.Model(head, name="Test_Model")
+    sm = ps.StressModel(stress, ps.Exponential(), name="well", settings="well")
+    ml.add_stressmodel(sm)
+    sim = ml.simulate()
+    data = pickle.dumps(ml)
+    assert len(data) < 0.05 * stress.values.nbytes
+    assert pickle.loads(data).simulate().equals(sim)
+
+
 def test_model_copy(ml_empty: ps.Model) -> None:
     ml_empty.copy()
 
 
+def test_model_copy_parameters(ml: ps.Model) -> None:
+    ml.set_parameter("rch_n", initial=1.1, vary=False, pmax=5.0)
+    ml.solve()
+    ml2 = ml.copy()
+    assert ml2.parameters.equals(ml.parameters)
+    assert ml2.stressmodels["rch"].parameters.loc["rch_n", "pmax"] == 5.0
+    assert ml2.simulate().equals(ml.simulate())
+
+    # the parameters of the copy are independent of the original model
+    ml2.set_parameter("rch_A", initial=10.0)
+    assert ml.parameters.loc["rch_A", "initial"] != 10.0
+    assert ml.stressmodels["rch"].parameters.loc["rch_A", "initial"] != 10.0
+
+
+def test_model_copy_shallow(ml: ps.Model) -> None:
+    ml.solve()
+    ml2 = ml.copy(deep=False)
+    assert ml2.parameters.equals(ml.parameters)
+    assert ml2.simulate().equals(ml.simulate())
+    assert ml2.solver.ml is ml2
+
+    # the series are shared, but the TimeSeries and parameters are not
+    prec = ml.stressmodels["rch"].prec
+    prec2 = ml2.stressmodels["rch"].prec
+    assert np.shares_memory(prec2.series.values, prec.series.values)
+    prec2.update_series(tmin="1990-01-01")
+    assert prec.series.index[0] != prec2.series.index[0]
+    ml2.set_parameter("rch_A", initial=10.0)
+    assert ml.stressmodels["rch"].parameters.loc["rch_A", "initial"] != 10.0
+
+
+def _add_wells(ml: ps.Model) -> None:
+    wells = [prec.rename("well_1"), evap.rename("well_2")]
+    sm = ps.WellModel(wells, name="wells", distances=[10.0, 100.0], settings="well")
+    ml.add_stressmodel(sm)
+
+
+def _add_flex(ml: ps.Model) -> None:
+    rch = ps.rch.FlexModel()
+    sm = ps.RechargeModel(prec, evap, ps.Exponential(), recharge=rch, name="rch")
+    ml.add_stressmodel(sm)
+
+
+def _add_transform(ml: ps.Model) -> None:
+    sm = ps.StressModel(prec, ps.Exponential(), name="prec", settings="prec")
+    ml.add_stressmodel(sm)
+    ml.add_transform(ps.ThresholdTransform())
+
+
+@pytest.mark.parametrize("deep", [True, False])
+@pytest.mark.parametrize("add", [_add_wells, _add_flex, _add_transform])
+def test_model_copy_stressmodels(add, deep: bool) -> None:
+    ml = ps.Model(obs, name="Test_Model")
+    add(ml)
+    ml.solve(report=False)
+    ml2 = ml.copy(deep=deep)
+    assert ml2.parameters.equals(ml.parameters)
+    assert ml2.simulate().equals(ml.simulate())
+
+
 def test_get_block(ml: ps.Model) -> None:
     ml.get_block_response("rch")
 
@@ -132,6 +319,62 @@ def test_residuals(ml: ps.Model) -> None:
     ml.residuals()
 
 
+def test_simulate_aligned(ml_sm: ps.Model) -> None:
+    ml_sm.solve()
+    assert ml_sm._simulation_alignment is not None
+    sim = ml_sm.simulate(return_warmup=True)
+    res = ml_sm.residuals()
+    ml_sm._simulation_alignment = None
+    assert sim.equals(ml_sm.simulate(return_warmup=True))
+    assert res.equals(ml_sm.residuals())
+
+
+def test_residuals_between_steps() -> None:
+    # an observation between the simulation time steps
+    t = obs.index[100] + Timedelta(12, "h")
+    head = obs.rename(index={obs.index[100]: t})
+    ml = ps.Model(head)
+    sm = ps.StressModel(prec, ps.Exponential(), name="prec", settings="prec")
+    ml.add_stressmodel(sm)
+    ml.solve(report=False)
+    assert ml.interpolate_simulation
+    res = ml.residuals()
+    ml._simulation_alignment = None
+    assert np.allclose(res, ml.residuals())
+
+    # without interpolation the residual is NaN and removed, like with pandas
+    ml._set_simulation_alignment()
+    ml.interpolate_simulation = False
+    res = ml.residuals()
+    assert res.index.equals(ml.oseries_calib.index.drop(t))
+    ml._simulation_alignment = None
+    assert res.equals(ml.residuals())
+
+
+def test_wellmodel_vectorized() -> None:
+    wells = [Series(prec.values, index=prec.index, name=f"w{i}") for i in range(3)]
+    wm = ps.WellModel(wells, name="wells", distances=[10.0, 100.0, 500.0])
+    ml = ps.Model(obs)
+    ml.add_stressmodel(wm)
+    ml.initialize()
+    p = ml.get_parameters("wells")
+    h = wm.simulate(p)
+    h_wells = sum(wm.simulate(p, istress=i) for i in range(3))
+    assert np.allclose(h.values, h_wells.values)
+
+
+def test_prepared_stress(ml_sm: ps.Model) -> None:
+    ml_sm.initialize()
+    sm = ml_sm.stressmodels["prec"]
+    key = sm._prepared_stress["key"]
+    stress = sm._get_prepared_stress(*key)[0]
+    assert not stress.flags.writeable
+    assert stress is sm._get_prepared_stress(*key)[0]
+    # updating the series invalidates the prepared stress
+    sm.stress[0].series_original = sm.stress[0].series_original * 2.0
+    assert np.allclose(sm._get_prepared_stress(*key)[0], 2.0 * stress)
+
+
 def test_noise(ml: ps.Model) -> None:
     ml.noise()
 
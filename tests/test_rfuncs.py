@@ -1,4 +1,6 @@
+import numpy as np
 import pytest
+from scipy.integrate import quad
 
 import pastas as ps
 
@@ -34,3 +36,193 @@ def test_to_dict_rfuncs(rfunc_name) -> None:
     p2 = rfunc2.get_init_parameters("test").initial.to_numpy()
 
     assert (rfunc1.step(p1) - rfunc2.step(p2)).sum() == 0.0
+
+
+@pytest.mark.parametrize("rfunc_name", ps.rfunc.__all__)
+def test_block_derivative(rfunc_name) -> None:
+    rfunc = getattr(ps.rfunc, rfunc_name)()
+    if rfunc_name == "HantushWellModel":
+        rfunc.set_distances(100.0)
+    p = rfunc.get_init_parameters("test").initial.to_numpy()
+    db = rfunc.block_derivative(p)
+    assert db.shape == (rfunc.block(p).size, rfunc.nparam)
+
+
+@pytest.mark.parametrize(
+    "rfunc,p",
+    [
+        (ps.Gamma(), None),
+        (ps.Hantush(), None),
+        (ps.Hantush(quad=True), None),
+        (ps.Polder(), None),
+        (ps.DoubleExponential(), [1.0, 0.3, 10.0, 40.0]),
+        (ps.FourParam(), None),
+        (ps.HantushWellModel(), [1.0, 100.0, -9.2, 100.0]),
+        (ps.HantushWellModel(quad=True), [1.0, 100.0, -9.2, 100.0]),
+    ],
+)
+def test_block_derivative_values(rfunc, p) -> None:
+    if p is None:
+        p = rfunc.get_init_parameters("test").initial.to_numpy()
+    p = np.asarray(p, dtype=float)
+    db = rfunc.block_derivative(p, maxtmax=50)
+    # compare with central differences of the block response
+    for j in range(rfunc.nparam):
+        h = 1e-5 * max(1.0, abs(p[j]))
+        dp = np.zeros(p.size)
+        dp[j] = h
+        b1 = rfunc.block(p + dp, maxtmax=50)
+        b0 = rfunc.block(p - dp, maxtmax=50)
+        db_cd = (b1 - b0) / (2 * h)
+        assert np.allclose(db[:, j], db_cd, atol=1e-5 * np.abs(db_cd).max())
+
+
+@pytest.mark.parametrize("rfunc_name", ps.rfunc.__all__)
+def test_step_batch(rfunc_name) -> None:
+    rfunc = getattr(ps.rfunc, rfunc_name)()
+    if rfunc_name == "HantushWellModel":
+        rfunc.set_distances(100.0)
+    p = rfunc.get_init_parameters("test").initial.to_numpy()
+    P = np.outer([0.9, 1.0, 1.1], p)
+    s = rfunc.step_batch(P)
+    b = rfunc.block_batch(P)
+    for i, p in enumerate(P):
+        step = rfunc.step(p)
+        block = rfunc.block(p)
+        assert np.allclose(s[: step.size, i], step)
+        assert np.allclose(s[step.size :, i], step[-1])
+        assert np.allclose(b[: block.size, i], block)
+        assert np.allclose(b[block.size :, i], 0.0)
+    t = np.arange(1.0, 50.0)
+    s = rfunc.step_batch(P, dt=t)
+    assert s.shape == (t.size, P.shape[0])
+    assert np.allclose(s[:, 1], rfunc.step(P[1], dt=t))
+
+
+def test_block_derivative_exponential() -> None:
+    rfunc = ps.Exponential()
+    p = np.array([2.0, 20.0])
+    db = rfunc.block_derivative(p, maxtmax=100)
+    h = 1e-6
+    db_a = (rfunc.block(p + [0.0, h], maxtmax=100) - rfunc.block(p, maxtmax=100)) / h
+    assert np.allclose(db[:, 0], rfunc.block(p, maxtmax=100) / 2.0)
+    assert np.allclose(db[:, 1], db_a, atol=1e-6)
+
+
+def test_block_cache() -> None:
+    cache = ps.cache.BlockCache(maxsize=2)
+    rfunc = ps.Gamma()
+    p = rfunc.get_init_parameters("test").initial.to_numpy()
+    b1 = cache.get_block(rfunc, p)
+    b2 = cache.get_block(rfunc, p)
+    assert b1 is b2 and not b1.flags.writeable
+    assert (b1 == rfunc.block(p)).all()
+    cache.get_block(rfunc, p * 2.0)
+    cache.get_block(rfunc, p * 3.0)
+    assert cache.info() == {"hits": 1, "misses": 3, "size": 2, "maxsize": 2}
+    # a different response function with the same parameters is not a hit
+    cache.get_block(ps.Gamma(), p * 3.0)
+    assert cache.hits == 1
+
+
+def test_block_cache_settings() -> None:
+    cache = ps.cache.BlockCache()
+    rfunc = ps.Hantush()
+    p = rfunc.get_init_parameters("test").initial.to_numpy()
+    cache.get_block(rfunc, p)
+    # the block response is computed again after a setting is changed
+    rfunc.quad = True
+    assert np.array_equal(cache.get_block(rfunc, p), rfunc.block(p))
+    assert cache.hits == 0
+    rfunc = ps.Spline(t=[1, 10, 100])
+    p = rfunc.get_init_parameters("test").initial.to_numpy()
+    cache.get_block(rfunc, p)
+    rfunc.t = [1, 20, 100]
+    assert np.array_equal(cache.get_block(rfunc, p), rfunc.block(p))
+    assert cache.hits == 0
+
+
+@pytest.mark.parametrize("method", ["auto", "direct", "fft", "oa"])
+def test_convolve(method: str) -> None:
+    rng = np.random.default_rng(0)
+    stress = rng.random(1000)
+    for m in [10, 200, 2000]:
+        b = rng.random(m)
+        h = ps.convolution.convolve(stress, b, method=method)
+        assert h.shape == stress.shape
+        assert np.allclose(h, np.convolve(stress, b)[: stress.size])
+        db = rng.random((m, 2))
+        jac = ps.convolution.convolve(stress, db, method=method)
+        assert np.allclose(jac[:, 1], np.convolve(stress, db[:, 1])[: stress.size])
+        # the FFT of the stress is stored and reused
+        spectra = {}
+        for _ in range(2):
+            h = ps.convolution.convolve(stress, b, method=method, spectra=spectra)
+            assert np.allclose(h, np.convolve(stress, b)[: stress.size])
+        assert len(spectra) == (method == "fft" or (method == "auto" and m > 64))
+
+
+def test_convolve_auto() -> None:
+    # an explicit "auto" chooses the method, also if another method is set
+    stress = np.random.default_rng(0).random(1000)
+    ps.set_convolution_method("direct")
+    try:
+        for method, nfft in [("auto", 1), (None, 0)]:
+            spectra = {}
+            ps.convolution.convolve(stress, np.ones(200), method, spectra=spectra)
+            assert len(spectra) == nfft
+    finally:
+        ps.set_convolution_method("auto")
+
+
+def test_hantush_well_model_step_wells() -> None:
+    rfunc = ps.HantushWellModel()
+    distances = np.array([10.0, 100.0, 500.0])
+    rfunc.set_distances(distances)
+    p = rfunc.get_init_parameters("test").initial.to_numpy()
+    s = rfunc.step_wells(p, distances)
+    for i, r in enumerate(distances):
+        s1 = rfunc.step(np.append(p, r))
+        assert np.allclose(s[: s1.size, i], s1)
+        assert np.allclose(s[s1.size :, i], s1[-1])
+
+
+def test_hantush_table(tmp_path) -> None:
+    table = ps.lookup.HantushTable(
+        ps.rfunc._hantush_normalized, tol=1e-4, cache_dir=str(tmp_path)
+    )
+    assert (tmp_path / table.path.split("/")[-1]).exists()
+    tau = np.logspace(-3, 3, 50)
+    f = table(tau, 0.5)
+    assert np.allclose(f, ps.rfunc._hantush_normalized(tau, 0.5), atol=1e-4)
+    # outside the table NaN is returned
+    assert np.isnan(table(tau, 100.0)).all()
+
+
+def test_hantush_table_no_cache(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    monkeypatch.setitem(ps.rcParams, "cache_dir", False)
+    table = ps.lookup.HantushTable(ps.rfunc._hantush_normalized, tol=1e-3)
+    assert table.cache_dir is False
+    assert not any(tmp_path.iterdir())
+
+
+@pytest.mark.parametrize("rfunc_name", ["Hantush", "HantushWellModel"])
+def test_hantush_use_table(rfunc_name: str, tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    rfunc = getattr(ps, rfunc_name)()
+    rfunc_table = getattr(ps, rfunc_name)(use_table=True)
+    if rfunc_name == "HantushWellModel":
+        rfunc.set_distances(100.0)
+    p = rfunc.get_init_parameters("test").initial.to_numpy()
+    assert np.allclose(rfunc_table.step(p), rfunc.step(p), atol=1e-5)
+
+
+@pytest.mark.parametrize("dt", [1.0, 7.0])
+def test_fourparam_step(dt: float) -> None:
+    rfunc = ps.FourParam()
+    p = np.array([1.0, -0.5, 10.0, 1.0])
+    assert np.isclose(rfunc._integral(p), quad(rfunc.impulse, 0, np.inf, args=p)[0])
+    s = rfunc.step(p, dt=dt)
+    s_quad = ps.FourParam(quad=True).step(p, dt=dt)
+    assert np.allclose(s, s_quad, atol=1e-8)
@@ -1,3 +1,6 @@
+import numpy as np
+import pytest
+
 import pastas as ps
 
 
@@ -14,7 +17,74 @@ def test_no_noise(ml: ps.Model):
     ml.solve()
 
 
+def test_least_squares_analytic_jacobian(ml: ps.Model):
+    ml.solve(solver=ps.LeastSquares())
+    obj_func = ml.solver.obj_func
+    ml.solve(solver=ps.LeastSquares(), jac="analytic")
+    assert np.isclose(ml.solver.obj_func, obj_func, rtol=1e-3)
+
+
+def test_misfit_jacobian(ml: ps.Model):
+    ml.solve(solver=ps.LeastSquares())
+    p = ml.parameters.optimal.to_numpy()
+    jac = ml.solver.misfit_jacobian(p, noise=True)
+    # the jacobian to the gain can be checked with finite differences
+    h = 1e-6 * p[0]
+    rv = ml.solver.misfit(p, noise=True)
+    rv1 = ml.solver.misfit(p + np.eye(p.size)[0] * h, noise=True)
+    assert np.allclose(jac[:, 0], (rv1 - rv) / h, rtol=1e-4, atol=1e-8)
+
+
+def test_varpro_least_squares(ml: ps.Model):
+    ml.solve(solver=ps.LeastSquares())
+    obj_func = ml.solver.obj_func
+    ml.solve(solver=ps.VarProLeastSquares())
+    assert np.isclose(ml.solver.obj_func, obj_func, rtol=1e-3)
+    assert ml.parameters.stderr.loc[ml.parameters.vary].notna().all()
+
+
+def test_varpro_linear_parameters(ml: ps.Model):
+    linear = ml._get_linear_parameters()
+    assert linear[ml.parameters.index.get_loc("rch_A")]
+    assert not linear[ml.parameters.index.get_loc("rch_a")]
+    assert linear[ml.parameters.index.get_loc("constant_d")]
+
+
 # test the uncertainty method here
+def test_get_parameter_sample(ml: ps.Model):
+    ml.solve(solver=ps.LeastSquares())
+    sample = ml.solver.get_parameter_sample(n=500, rng=1)
+    assert sample.shape == (500, ml.parameters.index.size)
+    assert np.array_equal(sample, ml.solver.get_parameter_sample(n=500, rng=1))
+    # a bound at the optimal value rejects half of the samples of this parameter
+    ml.set_parameter("rch_a", pmin=ml.parameters.loc["rch_a", "optimal"])
+    sample = ml.solver.get_parameter_sample(n=500, max_iter=1, rng=1)
+    assert sample.shape == (500, ml.parameters.index.size)
+    i = ml.parameters.index.get_loc("rch_a")
+    assert (sample[:, i] >= ml.parameters.loc["rch_a", "pmin"]).all()
+
+
+def test_truncated_normal_correlated():
+    # strongly correlated parameters, both truncated at their mean
+    rng = np.random.default_rng(1)
+    mean = np.zeros(2)
+    cov = np.array([[1.0, 0.995], [0.995, 1.0]])
+    lower = np.zeros(2)
+    upper = np.full(2, np.inf)
+    # all samples are drawn with minimax tilting for max_iter=0
+    sample = ps.solver._sample_truncated_normal(
+        mean, cov, lower, upper, n=20000, max_iter=0, rng=rng
+    )
+    assert (sample >= lower).all()
+
+    # compare with rejection sampling
+    expected = rng.multivariate_normal(mean, cov, size=100000)
+    expected = expected[(expected >= lower).all(axis=1)]
+    assert np.allclose(sample.std(axis=0), expected.std(axis=0), atol=0.02)
+    q = np.quantile(sample, 0.975, axis=0)
+    assert np.allclose(q, np.quantile(expected, 0.975, axis=0), atol=0.1)
+
+
 def test_pred_interval(ml: ps.Model):
     ml.solve(solver=ps.LeastSquares())
     ml.solver.prediction_interval(n=10)
@@ -25,6 +95,24 @@ def test_ci_simulation(ml: ps.Model):
     ml.solver.ci_simulation(n=10)
 
 
+def test_ci_simulation_nan(ml: ps.Model, monkeypatch):
+    ml.solve(solver=ps.LeastSquares())
+    iter_realizations = ml.solver._iter_simulation_realizations
+
+    def _iter_simulation_realizations(*args, **kwargs):
+        for chunk, index in iter_realizations(*args, **kwargs):
+            chunk = chunk.copy()
+            chunk[:, 0] = np.nan
+            yield chunk, index
+
+    monkeypatch.setattr(
+        ml.solver, "_iter_simulation_realizations", _iter_simulation_realizations
+    )
+    # realizations with NaN values are skipped, like in DataFrame.quantile
+    ci = ml.solver.ci_simulation(n=10)
+    assert ci.notna().all().all()
+
+
 def test_ci_block_response(ml: ps.Model):
     ml.solve(solver=ps.LeastSquares())
     ml.solver.ci_block_response(name="rch", n=10)
@@ -40,6 +128,42 @@ def test_ci_contribution(ml: ps.Model):
     ml.solver.ci_contribution(name="rch", n=10)
 
 
+def test_ci_simulation_batch(ml: ps.Model):
+    ml.solve(solver=ps.LeastSquares())
+    p = ml.solver.get_parameter_sample(n=10)
+    sim = ml._simulate_batch(p)
+    assert sim.shape == (ml._simulation_alignment["index"].size, 10)
+    for i in [0, 9]:
+        assert np.allclose(sim[:, i], ml.simulate(p=p[i]).values)
+    p = ml.solver.get_parameter_sample(name="rch", n=10)
+    contrib = ml._simulate_batch(p, name="rch")
+    assert np.allclose(contrib[:, 0], ml.get_contribution("rch", p=p[0]).values)
+
+
+def test_ci_simulation_streaming(ml: ps.Model):
+    ml.solve(solver=ps.LeastSquares())
+    np.random.seed(0)
+    exact = ml.solver.ci_simulation(n=200, chunk_size=50)
+    np.random.seed(0)
+    streaming = ml.solver.ci_simulation(n=200, method="streaming", chunk_size=50)
+    assert streaming.index.equals(exact.index)
+    width = (exact.iloc[:, 1] - exact.iloc[:, 0]).mean()
+    assert (streaming - exact).abs().mean().max() < 0.2 * width
+
+
+def test_warm_start(ml: ps.Model):
+    ml.solve(solver=ps.LeastSquares())
+    prepared = ml.stressmodels["rch"]._prepared_stress
+    optimal = ml.parameters.optimal.copy()
+    ml.solve(warm_start=True)
+    assert ml._solve_success
+    assert np.allclose(ml.parameters.optimal, optimal, rtol=1e-3)
+    # the stresses are not prepared again if nothing changed
+    assert ml.stressmodels["rch"]._prepared_stress is prepared
+    x_scale = ml.solver._get_warm_start_kwargs()["x_scale"]
+    assert np.allclose(x_scale, ml.parameters.stderr.loc[x_scale.index])
+
+
 # Test the EmceeSolver
 
 
@@ -52,3 +176,114 @@ def test_emcee(ml: ps.Model):
         fit_constant=False,
         steps=10,
     )
+
+
+def test_emcee_vectorize(ml: ps.Model):
+    ml.solve(solver=ps.LeastSquares())
+    ml.del_noisemodel()
+    solver = ps.EmceeSolve(nwalkers=10, vectorize=True, progress_bar=False)
+    ml.solve(solver=solver, initial=False, fit_constant=False, steps=5)
+    P = solver.sampler.get_chain(flat=True)
+    lp = solver.log_probability_batch(P, noise=False)
+    assert np.allclose(lp, [solver.log_probability(p, noise=False) for p in P])
+
+
+def test_emcee_parallel(ml: ps.Model):
+    ml.solve(solver=ps.LeastSquares())
+    ml.del_noisemodel()
+    solver = ps.EmceeSolve(nwalkers=10, parallel=True, processes=2, progress_bar=False)
+    ml.solve(solver=solver, initial=False, fit_constant=False, steps=5)
+    # the worker processes are stopped after solving by default
+    assert solver._pool is None
+    assert np.isfinite(solver.sampler.get_log_prob()).all()
+
+    # the worker processes are reused to resume sampling with persistent_pool
+    solver.persistent_pool = True
+    ml.solve(initial=False, fit_constant=False, steps=5, resume=True)
+    pool = solver._pool
+    finalizer = solver._pool_finalizer
+    ml.solve(initial=False, fit_constant=False, steps=5, resume=True)
+    assert solver._pool is pool
+    assert solver.sampler.iteration == 15
+    assert np.isfinite(solver.sampler.get_log_prob()).all()
+    solver.close_pool()
+    assert solver._pool is None
+    # the same finalizer stops a new pool when the solver is deleted
+    ml.solve(initial=False, fit_constant=False, steps=5, resume=True)
+    assert solver._pool_finalizer is finalizer
+    solver._pool_finalizer()
+    assert solver._pool is None
+
+
+def test_emcee_backend(ml: ps.Model):
+    emcee = pytest.importorskip("emcee")
+    ml.solve(solver=ps.LeastSquares())
+    ml.del_noisemodel()
+    backend = emcee.backends.Backend()
+    solver = ps.EmceeSolve(nwalkers=10, backend=backend, progress_bar=False)
+    ml.solve(solver=solver, initial=False, fit_constant=False, steps=5)
+    # the chains are appended to the chains in a backend provided by the user
+    ml.solve(initial=False, fit_constant=False, steps=5)
+    assert backend.iteration == 10
+
+
+def test_emcee_checkpoint(ml: ps.Model, tmp_path):
+    pytest.importorskip("h5py")
+    ml.solve(solver=ps.LeastSquares())
+    ml.del_noisemodel()
+    solver = ps.EmceeSolve(
+        nwalkers=10, checkpoint=str(tmp_path / "chains.h5"), progress_bar=False
+    )
+    ml.solve(solver=solver, initial=False, fit_constant=False, steps=10)
+    ml.solve(initial=False, fit_constant=False, steps=5, resume=True)
+    assert solver.sampler.iteration == 15
+    # the chains in the checkpoint file are not overwritten without resume
+    with pytest.raises(ValueError):
+        ml.solve(initial=False, fit_constant=False, steps=5)
+    assert solver.backend.iteration == 15
+
+    summary = solver.get_posterior_summary(discard=2, thin=2, chunk_size=3)
+    chain = solver.sampler.get_chain(discard=2, thin=2, flat=True)
+    assert np.allclose(summary["mean"], chain.mean(axis=0))
+    assert np.allclose(summary["std"], chain.std(axis=0, ddof=1))
+
+    # The chains are available again after loading the model
+    ml.to_file(tmp_path / "model.pas")
+    ml2 = ps.io.load(tmp_path / "model.pas")
+    assert ml2.solver.checkpoint == solver.checkpoint
+    summary2 = ml2.solver.get_posterior_summary(discard=2, thin=2)
+    assert np.allclose(summary2["mean"], summary["mean"])
+
+
+@pytest.mark.parametrize("deep", [True, False])
+def test_emcee_copy(ml: ps.Model, tmp_path, deep: bool):
+    pytest.importorskip("h5py")
+    ml.solver = ps.EmceeSolve(checkpoint=str(tmp_path / "chains.h5"))
+    ml.solver.set_model(ml)
+    ml2 = ml.copy(deep=deep)
+    # the copy has its own parameters and does not use the checkpoint file
+    assert ml2.solver.parameters is not ml.solver.parameters
+    ml2.solver.set_parameter("ln_sigma", initial=0.123)
+    assert ml.solver.parameters.loc["ln_sigma", "initial"] != 0.123
+    assert ml2.solver.checkpoint is None
+    assert ml2.solver.backend is None
+
+
+def test_solve_many_thread(ml: ps.Model, ml_sm: ps.Model):
+    results = ps.solve_many([ml, ml_sm], n_jobs=2, backend="thread")
+    assert results.success.all()
+    assert ml.parameters.optimal.notna().all()
+
+
+def test_solve_many_process(ml: ps.Model, ml_sm: ps.Model):
+    ml_sm.name = "Test_Model_sm"
+    results = ps.solve_many([ml, ml_sm], n_jobs=2, backend="process")
+    assert results.success.all()
+    assert (results.loc[ml.name, ml.parameters.index] == ml.parameters.optimal).all()
+    ml.simulate()
+
+
+def test_solve_many_failure(ml: ps.Model):
+    results = ps.solve_many([ml], n_jobs=1, tmin="2100")
+    assert not results.loc[ml.name, "success"]
+    assert results.loc[ml.name, "error"] is not None
@@ -40,3 +40,18 @@ def test_stoffer_toloi():
     )
     _, pval = ps.stats.stoffer_toloi(res)
     assert pval > 1e-10
+
+
+def test_p2_quantiles() -> None:
+    rng = np.random.default_rng(0)
+    x = rng.normal(size=(3, 2000))
+    q = [0.05, 0.5, 0.95]
+    estimator = ps.stats.P2Quantiles(q=q, size=3)
+    for i in range(0, 2000, 100):
+        estimator.update(x[:, i : i + 100])
+    assert np.allclose(estimator.quantiles(), np.quantile(x, q, axis=1), atol=0.1)
+
+    # less than five samples are computed exactly
+    estimator = ps.stats.P2Quantiles(q=q, size=3)
+    estimator.update(x[:, :3])
+    assert np.allclose(estimator.quantiles(), np.quantile(x[:, :3], q, axis=1))
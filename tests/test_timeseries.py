@@ -0,0 +1,117 @@
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pastas.memmap import read_series, write_series
+from pastas.timeseries import TimeSeries
+
+
+@pytest.mark.parametrize("settings", ["prec", "evap", "quantity", "oseries"])
+@pytest.mark.parametrize("freq", [None, "D", "7D"])
+def test_timeseries_append(settings: str, freq: str):
+    if settings == "oseries" and freq is not None:
+        pytest.skip("The frequency of the oseries is not changed.")
+    original_freq = "7D" if freq == "D" else "D"
+    index = pd.date_range("2000-01-01", periods=500, freq=original_freq)
+    series = pd.Series(np.random.rand(index.size), index=index, name="s")
+    series.iloc[[100, 398, 399]] = np.nan
+
+    ts = TimeSeries(series.iloc[:400], settings=settings)
+    kwargs = {"freq": freq} if freq else {}
+    if settings != "oseries":
+        kwargs["tmin"] = "1999-06-01"
+    ts.update_series(**kwargs)
+    for i in range(400, 500, 25):
+        ts.append(series.iloc[i : i + 25])
+
+    expected = TimeSeries(series, settings=settings)
+    expected.update_series(**kwargs)
+    assert ts.series_original.equals(series)
+    assert ts.series.index.equals(expected.series.index)
+    assert np.allclose(ts.series, expected.series, equal_nan=True)
+
+    # extend the series to a later tmax
+    if settings != "oseries":
+        tmax = ts.series.index[-1] + pd.Timedelta(30, "D")
+        ts.update_series(tmax=tmax)
+        expected.update_series(tmax=tmax)
+        assert np.allclose(ts.series, expected.series)
+
+
+def test_timeseries_append_errors():
+    index = pd.date_range("2000-01-01", periods=10, freq="D")
+    series = pd.Series(np.random.rand(index.size), index=index, name="s")
+    ts = TimeSeries(series.iloc[:5], settings="prec")
+    with pytest.raises(ValueError):
+        ts.append(series.iloc[4:])
+    with pytest.raises(ValueError):
+        ts.append(series.iloc[6:])
+
+
+def test_timeseries_shared_series():
+    index = pd.date_range("2000-01-01", periods=100, freq="D")
+    series = pd.Series(np.random.rand(index.size), index=index, name="s")
+    ts1 = TimeSeries(series, name="station_1", settings="prec")
+    ts2 = TimeSeries(series.copy(), name="station_2", settings="prec")
+    assert ts1.series_original.name != ts2.series_original.name
+    assert np.shares_memory(ts1.series_original.values, ts2.series_original.values)
+    assert np.shares_memory(ts1.series.values, ts2.series.values)
+
+    # the series of ts2 is not shared anymore after it is changed
+    ts2.update_series(tmin="1999-01-01")
+    assert not np.shares_memory(ts1.series.values, ts2.series.values)
+    assert ts1.series.index[0] == index[0]
+
+
+def test_timeseries_from_timeseries():
+    index = pd.date_range("2000-01-01", periods=100, freq="D")
+    series = pd.Series(np.random.rand(index.size), index=index, name="s")
+    ts = TimeSeries(series, settings="prec")
+    ts.update_series(tmin="1999-12-01")
+    ts2 = TimeSeries(ts, settings=ts.settings)
+    assert ts2.series.equals(ts.series)
+    assert np.shares_memory(ts2.series.values, ts.series.values)
+
+    # the series of the copy is updated if the settings are different
+    ts3 = TimeSeries(ts, name="s3", settings={"freq": "7D"})
+    assert ts3.series.index.freq == "7D"
+    assert ts.series.index.freq == "D"
+
+
+def test_timeseries_from_timeseries_appended():
+    index = pd.date_range("2000-01-01", periods=100, freq="D")
+    series = pd.Series(np.random.rand(index.size), index=index, name="s")
+    ts = TimeSeries(series.iloc[:80], settings="prec")
+    ts.append(series.iloc[80:90])
+
+    # the values of an appended series can be changed, but are still shared
+    ts2 = TimeSeries(ts)
+    assert np.shares_memory(ts2.series_original.values, ts.series_original.values)
+    assert np.shares_memory(ts2.series.values, ts.series.values)
+    assert not ts2.series.values.flags.writeable
+
+    # appending to one of the series does not change the other
+    ts.append(series.iloc[90:])
+    ts2.append(series.iloc[90:95])
+    assert ts.series_original.equals(series)
+    assert ts2.series_original.equals(series.iloc[:95])
+
+
+def test_timeseries_memmap(tmp_path):
+    index = pd.date_range("2000-01-01", periods=1000, freq="h")
+    series = pd.Series(np.random.rand(index.size), index=index, name="s")
+    write_series(series, tmp_path / "s")
+    mseries = read_series(tmp_path / "s", name="s")
+    assert mseries.equals(series)
+
+    # the memory-mapped values are not copied by the TimeSeries
+    ts = TimeSeries(mseries, settings="prec")
+    ts.update_series(tmin="2000-01-10")
+    assert np.shares_memory(ts.series.values, mseries.values)
+
+    # a memory-mapped series is pickled as a reference to the file
+    part = mseries.loc["2000-01-10":"2000-01-20"]
+    assert len(pickle.dumps(part)) < part.values.nbytes
+    assert pickle.loads(pickle.dumps(part)).equals(part)